@@ -1,42 +1,73 @@
 """PQC 패키지 초기화."""
 
-from .gates import LogicGate, build_dataset, truth_table_inputs
-from .model import PQCConfig, TwoQubitPQC
-from .workflow import run_all_experiments, train_gate
-from .tangle.model import EntangledTwoQubitPQC
-from .tangle.workflow import (
-    EntangledTrainingResult,
-    log_entangled_result,
-    run_entangled_experiments,
-    train_entangled_gate,
-)
-from .angle.config import AnglePQCConfig
-from .angle.model import AngleEncodedTwoQubitPQC
-from .angle.workflow import (
-    AngleTrainingResult,
-    log_angle_result,
-    run_angle_experiments,
-    train_angle_gate,
-)
+from importlib import import_module
+from typing import Any
 
-__all__ = [
-    "LogicGate",
-    "build_dataset",
-    "truth_table_inputs",
-    "PQCConfig",
-    "TwoQubitPQC",
-    "run_all_experiments",
-    "train_gate",
-    "EntangledTwoQubitPQC",
-    "EntangledTrainingResult",
-    "train_entangled_gate",
-    "log_entangled_result",
-    "run_entangled_experiments",
-    "AnglePQCConfig",
-    "AngleEncodedTwoQubitPQC",
-    "AngleTrainingResult",
-    "train_angle_gate",
-    "log_angle_result",
-    "run_angle_experiments",
-]
 
+_EXPORT_MAP = {
+    "ResultCache": ("pqc.cache", "ResultCache"),
+    "LogicGate": ("pqc.gates", "LogicGate"),
+    "build_dataset": ("pqc.gates", "build_dataset"),
+    "truth_table_inputs": ("pqc.gates", "truth_table_inputs"),
+    "PQCConfig": ("pqc.model", "PQCConfig"),
+    "TwoQubitPQC": ("pqc.model", "TwoQubitPQC"),
+    "compile_operations": ("pqc.compile", "compile_operations"),
+    "CompiledPredictor": ("pqc.predictor", "CompiledPredictor"),
+    "TrainingResult": ("pqc.results", "TrainingResult"),
+    "ResultArchive": ("pqc.results", "ResultArchive"),
+    "save_results": ("pqc.results", "save_results"),
+    "ParameterStore": ("pqc.warmstart", "ParameterStore"),
+    "warm_start": ("pqc.warmstart", "warm_start"),
+    "order_gates": ("pqc.warmstart", "order_gates"),
+    "run_all_experiments": ("pqc.workflow", "run_all_experiments"),
+    "train_gate": ("pqc.workflow", "train_gate"),
+    "train_gates": ("pqc.workflow", "train_gates"),
+    "train_gates_warm": ("pqc.workflow", "train_gates_warm"),
+    "StepProfile": ("pqc.profiling", "StepProfile"),
+    "TrainingProfiler": ("pqc.profiling", "TrainingProfiler"),
+    "ExperimentTask": ("pqc.parallel", "ExperimentTask"),
+    "build_tasks": ("pqc.parallel", "build_tasks"),
+    "run_parallel_experiments": ("pqc.parallel", "run_parallel_experiments"),
+    "SuccessiveHalvingPruner": ("pqc.sweep", "SuccessiveHalvingPruner"),
+    "run_sweep": ("pqc.sweep", "run_sweep"),
+    "log_sweep": ("pqc.sweep", "log_sweep"),
+    "scan_landscape": ("pqc.landscape", "scan_landscape"),
+    "load_landscape": ("pqc.landscape", "load_landscape"),
+    "measure_ansatz": ("pqc.expressibility", "measure_ansatz"),
+    "compare_ansatze": ("pqc.expressibility", "compare_ansatze"),
+    "NoiseModel": ("pqc.noise", "NoiseModel"),
+    "noise_sweep": ("pqc.noise", "noise_sweep"),
+    "load_spec": ("pqc.jobs", "load_spec"),
+    "expand_spec": ("pqc.jobs", "expand_spec"),
+    "run_jobs": ("pqc.jobs", "run_jobs"),
+    "EntangledTwoQubitPQC": ("pqc.tangle.model", "EntangledTwoQubitPQC"),
+    "EntangledTrainingResult": ("pqc.tangle.workflow", "EntangledTrainingResult"),
+    "train_entangled_gate": ("pqc.tangle.workflow", "train_entangled_gate"),
+    "train_entangled_gates": ("pqc.tangle.workflow", "train_entangled_gates"),
+    "log_entangled_result": ("pqc.tangle.workflow", "log_entangled_result"),
+    "run_entangled_experiments": ("pqc.tangle.workflow", "run_entangled_experiments"),
+    "AnglePQCConfig": ("pqc.angle.config", "AnglePQCConfig"),
+    "AngleEncodedTwoQubitPQC": ("pqc.angle.model", "AngleEncodedTwoQubitPQC"),
+    "AngleTrainingResult": ("pqc.angle.workflow", "AngleTrainingResult"),
+    "train_angle_gate": ("pqc.angle.workflow", "train_angle_gate"),
+    "train_angle_gates": ("pqc.angle.workflow", "train_angle_gates"),
+    "log_angle_result": ("pqc.angle.workflow", "log_angle_result"),
+    "run_angle_experiments": ("pqc.angle.workflow", "run_angle_experiments"),
+    "NQubitPQCConfig": ("pqc.nqubit.config", "NQubitPQCConfig"),
+    "NQubitPQC": ("pqc.nqubit.model", "NQubitPQC"),
+    "BooleanFunction": ("pqc.nqubit.functions", "BooleanFunction"),
+    "train_boolean_function": ("pqc.nqubit.workflow", "train_boolean_function"),
+    "run_boolean_experiments": ("pqc.nqubit.workflow", "run_boolean_experiments"),
+}
+
+__all__ = tuple(_EXPORT_MAP.keys())
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORT_MAP:
+        raise AttributeError(f"module 'pqc' has no attribute '{name}'") from None
+    module_name, attr_name = _EXPORT_MAP[name]
+    module = import_module(module_name)
+    value = getattr(module, attr_name)
+    globals()[name] = value
+    return value
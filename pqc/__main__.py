@@ -0,0 +1,71 @@
+"""실험 명세 CLI: ``python -m pqc SPEC.toml [-o 출력] [-j 동시 작업 수] [--timeout 초] [--json]``.
+
+명세 형식과 재실행 동작은 `pqc.jobs`를 본다. 진행 상황은 작업이 끝날 때마다 한 줄씩
+내보내며, --json이면 results.jsonl과 같은 JSON 기록을 stdout에 한 줄씩 쓴다.
+ok가 아닌 작업이 하나라도 남으면 종료 코드 1이다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import Counter
+from typing import Any, Sequence
+
+from pqc.jobs import expand_spec, job_id, load_spec, read_records, run_jobs
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m pqc", description="실험 명세(JSON/TOML)의 학습 작업을 실행한다.")
+    parser.add_argument("spec", help="실험 명세 파일 (.json / .toml)")
+    parser.add_argument("-o", "--output", help="출력 디렉터리 (명세의 output보다 우선)")
+    parser.add_argument("-j", "--concurrency", type=int, help="동시에 실행할 작업 수 (기본: CPU 수)")
+    parser.add_argument("--timeout", type=float, help="작업 하나의 제한 시간(초)")
+    parser.add_argument("--json", action="store_true", help="진행 기록을 JSON 줄로 stdout에 쓴다")
+    parser.add_argument("--dry-run", action="store_true", help="실행하지 않고 작업 수만 센다")
+    return parser.parse_args(argv)
+
+
+def _print_progress(done: int, total: int, record: dict[str, Any]) -> None:
+    head = f"[{done}/{total}] {record['id'][:8]} {record['family']} {record['gate']} r{record['repeat']}"
+    if record["status"] == "ok":
+        detail = f"손실 {record['final_loss']:.6f} 정확도 {record['accuracy'] * 100:.1f}%"
+    else:
+        detail = record.get("error", "")
+    print(f"{head} {record['status']} ({record['elapsed']:.1f}s) {detail}", flush=True)
+
+
+def _print_json(done: int, total: int, record: dict[str, Any]) -> None:
+    print(json.dumps({"done": done, "total": total, **record}, ensure_ascii=False), flush=True)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    try:
+        spec = expand_spec(load_spec(args.spec), args.output, args.concurrency, args.timeout)
+    except (OSError, ValueError) as error:
+        print(f"명세 오류: {error}", file=sys.stderr)
+        return 2
+
+    previous = read_records(spec.output)
+    skipped = sum(previous.get(job_id(task), {}).get("status") == "ok" for task in spec.jobs)
+    # --json이면 stdout은 기록 줄만 쓰고 요약은 stderr로 보낸다.
+    summary = sys.stderr if args.json else sys.stdout
+    print(f"작업 {len(spec.jobs)}개 (이미 끝난 {skipped}개 건너뜀), 동시 {spec.concurrency}개 → {spec.output}", file=summary)
+    if args.dry_run:
+        return 0
+
+    try:
+        records = run_jobs(spec, _print_json if args.json else _print_progress)
+    except KeyboardInterrupt:
+        print("중단됨: 끝난 작업은 기록되었으므로 같은 명령으로 이어서 실행할 수 있습니다.", file=sys.stderr)
+        return 130
+    counts = Counter(record["status"] for record in records.values())
+    counts["미실행"] = len(spec.jobs) - len(records)
+    print("완료: " + ", ".join(f"{status} {count}" for status, count in counts.items() if count), file=summary)
+    return 0 if counts["ok"] == len(spec.jobs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,8 +6,12 @@ from typing import Any
 _EXPORT_MAP = {
     "AnglePQCConfig": ("pqc.angle.config", "AnglePQCConfig"),
     "AngleEncodedTwoQubitPQC": ("pqc.angle.model", "AngleEncodedTwoQubitPQC"),
+    "NoisyGateSamples": ("pqc.angle.data", "NoisyGateSamples"),
     "AngleTrainingResult": ("pqc.angle.workflow", "AngleTrainingResult"),
     "train_angle_gate": ("pqc.angle.workflow", "train_angle_gate"),
+    "train_angle_gates": ("pqc.angle.workflow", "train_angle_gates"),
+    "train_noisy_angle_gate": ("pqc.angle.workflow", "train_noisy_angle_gate"),
+    "run_noise_robustness": ("pqc.angle.workflow", "run_noise_robustness"),
     "log_angle_result": ("pqc.angle.workflow", "log_angle_result"),
     "run_angle_experiments": ("pqc.angle.workflow", "run_angle_experiments"),
 }
@@ -7,13 +7,20 @@ from pqc.model import PQCConfig
 
 @dataclass(frozen=True)
 class AnglePQCConfig(PQCConfig):
-    """각도 인코딩 기반 PQC 설정."""
+    """각도 인코딩 기반 PQC 설정.
+
+    batch_size는 잡음 표본 스트림(`fit_stream`)을 학습할 때 한 스텝에 쓰는 표본 수다.
+    """
 
     angle_axis: str = "RY"
     angle_scale: float = 3.141592653589793
     angle_bias: float = 0.0
+    batch_size: int = 256
 
     def __post_init__(self) -> None:
+        super().__post_init__()
         if self.angle_axis.upper() not in {"RX", "RY", "RZ"}:
             raise ValueError("angle_axis는 RX/RY/RZ 중 하나여야 합니다.")
+        if self.batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다.")
 
@@ -0,0 +1,81 @@
+"""각도 인코딩 모델용 잡음 섞인 연속 입력 표본 스트림.
+
+진리표 꼭짓점 (0/1, 0/1) 중 하나를 고르고 입력마다 가우시안 잡음을 더한 표본을
+묶음 단위로 만든다. 표본은 `SAMPLE_CHUNK`행 청크마다 (seed, stream, 청크 번호) 시드로
+다시 만들 수 있으므로 데이터셋 전체를 메모리에 두지 않으며, 같은 설정이면 batch_size나
+섞는 순서와 상관없이 같은 표본 집합이 된다. stream이 다르면 겹치지 않는 표본이라
+`held_out`으로 검증용 스트림을 만든다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Iterator
+
+import numpy as np
+
+from pqc.gates import GATE_FUNCTIONS, LogicGate, truth_table_inputs
+
+# 한 번에 만드는 표본 행 수. 데이터셋 정의의 일부이므로 바꾸면 같은 seed라도 표본이 달라진다.
+SAMPLE_CHUNK = 4096
+
+
+@dataclass(frozen=True)
+class NoisyGateSamples:
+    """gate 진리표 꼭짓점 주변의 표본 num_samples개. 입력은 비트 + N(0, noise_std²), 타깃은 꼭짓점의 출력."""
+
+    gate: LogicGate
+    num_samples: int
+    noise_std: float = 0.1
+    seed: int = 0
+    stream: int = 0
+
+    def __post_init__(self) -> None:
+        if self.num_samples < 1:
+            raise ValueError("num_samples는 1 이상이어야 합니다.")
+        if self.noise_std < 0.0:
+            raise ValueError("noise_std는 0 이상이어야 합니다.")
+
+    @property
+    def num_chunks(self) -> int:
+        return -(-self.num_samples // SAMPLE_CHUNK)
+
+    def held_out(self, num_samples: int) -> "NoisyGateSamples":
+        """같은 분포에서 뽑은, 학습 스트림과 겹치지 않는 검증용 스트림."""
+        return replace(self, num_samples=num_samples, stream=self.stream + 1)
+
+    def chunk(self, index: int) -> tuple[np.ndarray, np.ndarray]:
+        """index번째 청크의 (입력 (M, 2), 타깃 (M,))."""
+        rows = min(SAMPLE_CHUNK, self.num_samples - index * SAMPLE_CHUNK)
+        rng = np.random.default_rng((self.seed, self.stream, index))
+        corners = np.array(truth_table_inputs(), dtype=float)
+        outputs = np.array([GATE_FUNCTIONS[self.gate](*bits) for bits in truth_table_inputs()], dtype=float)
+        picks = rng.integers(0, len(corners), size=rows)
+        features = corners[picks] + rng.normal(0.0, self.noise_std, size=(rows, corners.shape[1]))
+        return features, outputs[picks]
+
+    def batches(self, batch_size: int, seed: int | None = None) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """(입력 (B, 2), 타깃 (B,)) 묶음을 차례로 생성. 마지막 묶음만 B보다 작을 수 있다.
+
+        seed를 주면 청크 순서와 청크 안의 행 순서를 그 시드로 섞는다. 메모리에는
+        청크 하나와 묶음 하나(그리고 청크 번호 순열)만 둔다.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다.")
+        rng = np.random.default_rng(seed) if seed is not None else None
+        order = rng.permutation(self.num_chunks) if rng is not None else range(self.num_chunks)
+        pending_x = np.empty((0, 2))
+        pending_y = np.empty(0)
+        for index in order:
+            features, targets = self.chunk(int(index))
+            if rng is not None:
+                rows = rng.permutation(len(targets))
+                features, targets = features[rows], targets[rows]
+            features = np.concatenate([pending_x, features])
+            targets = np.concatenate([pending_y, targets])
+            full = len(targets) - len(targets) % batch_size
+            for start in range(0, full, batch_size):
+                yield features[start : start + batch_size], targets[start : start + batch_size]
+            pending_x, pending_y = features[full:], targets[full:]
+        if len(pending_y):
+            yield pending_x, pending_y
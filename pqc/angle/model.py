@@ -2,27 +2,36 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pennylane as qml
 import pennylane.numpy as qnp
 
-from pqc.model import TwoQubitPQC
+from pqc.engine import Operation, rotation_states
+from pqc.model import StepCallback, TwoQubitPQC
+from pqc.profiling import TrainingProfiler
 
 from .config import AnglePQCConfig
+from .data import NoisyGateSamples
+
+# 검증 기록 한 줄: (학습 스텝, 검증 손실, 검증 정확도)
+ValidationPoint = tuple[int, float, float]
 
 
 class AngleEncodedTwoQubitPQC(TwoQubitPQC):
     """각도 인코딩을 사용하는 2-큐비트 PQC."""
 
     config: AnglePQCConfig
+    params_per_wire = 5
 
     def __init__(self, config: AnglePQCConfig):
         self.config = config
         super().__init__(config)
+        self.validation_history: list[ValidationPoint] = []
 
     def _angle_encoding(self, inputs: qnp.ndarray) -> None:
         axis = self.config.angle_axis.upper()
-        for wire, bit in enumerate(inputs):
-            angle = self.config.angle_scale * float(bit) + self.config.angle_bias
+        for wire in range(2):
+            angle = self.config.angle_scale * inputs[..., wire] + self.config.angle_bias
             if axis == "RX":
                 qml.RX(angle, wires=wire)
             elif axis == "RY":
@@ -33,18 +42,82 @@ class AngleEncodedTwoQubitPQC(TwoQubitPQC):
     @staticmethod
     def _ansatz_block(params: qnp.ndarray) -> None:
         for wire in range(2):
-            theta, phi, lam, alpha, beta = params[wire]
-            qml.RY(theta, wires=wire)
-            qml.RZ(phi, wires=wire)
-            qml.RY(lam, wires=wire)
-            qml.RX(alpha, wires=wire)
-            qml.RZ(beta, wires=wire)
+            qml.RY(params[..., wire, 0], wires=wire)
+            qml.RZ(params[..., wire, 1], wires=wire)
+            qml.RY(params[..., wire, 2], wires=wire)
+            qml.RX(params[..., wire, 3], wires=wire)
+            qml.RZ(params[..., wire, 4], wires=wire)
         qml.CRX(math.pi / 2, wires=(0, 1))
         qml.CRX(math.pi / 2, wires=(1, 0))
 
+    def _engine_operations(self) -> list[Operation]:
+        operations: list[Operation] = []
+        for block in range(self.config.num_blocks):
+            operations.extend(self._engine_rotations(block, ("RY", "RZ", "RY", "RX", "RZ")))
+            operations.append(Operation("CRX", (0, 1), offset=math.pi / 2))
+            operations.append(Operation("CRX", (1, 0), offset=math.pi / 2))
+        return operations
+
+    def _engine_initial_states(self, features: np.ndarray) -> np.ndarray:
+        angles = self.config.angle_scale * np.asarray(features, dtype=float) + self.config.angle_bias
+        return rotation_states(self.config.angle_axis.upper(), angles)
+
+    def _encoding_operations(self) -> list[Operation]:
+        axis, scale, bias = self.config.angle_axis.upper(), self.config.angle_scale, self.config.angle_bias
+        return [Operation(axis, (wire,), ((wire, scale),), offset=bias) for wire in range(2)]
+
     def _circuit(self, inputs: qnp.ndarray, params: qnp.ndarray) -> qnp.ndarray:
         self._angle_encoding(inputs)
-        for block in range(params.shape[0]):
-            self._ansatz_block(params[block])
+        for block in range(params.shape[-3]):
+            self._ansatz_block(params[..., block, :, :])
         return qml.expval(qml.PauliZ(0))
 
+    def fit_stream(
+        self,
+        samples: NoisyGateSamples,
+        validation: NoisyGateSamples | None = None,
+        validate_every: int | None = None,
+        callback: StepCallback | None = None,
+        profiler: TrainingProfiler | None = None,
+    ) -> list[float]:
+        """잡음 표본 스트림을 batch_size개씩 섞어 흘려보내며 미니배치 학습하고 스텝별 손실을 반환.
+
+        에폭마다 표본 순서를 (seed, 에폭) 시드로 섞고, max_steps 스텝을 채우거나 에폭의
+        미니배치 손실 표본 가중 평균이 convergence_tol 아래면 멈춘다. validation을 주면
+        validate_every 스텝마다(생략하면 에폭이 끝날 때마다) 그리고 학습이 끝날 때
+        `evaluate_stream`으로 평가해 `self.validation_history`에 쌓는다. 메모리는
+        표본 수와 상관없이 청크 하나와 batch_size에 비례한다.
+        """
+        if validate_every is not None and validate_every < 1:
+            raise ValueError("validate_every는 1 이상이어야 합니다.")
+        self.validation_history = []
+
+        def validate(step: int, params: qnp.ndarray) -> None:
+            self.params = params
+            self.validation_history.append((step, *self.evaluate_stream(validation)))
+
+        def validate_periodically(step: int, params: qnp.ndarray) -> None:
+            if step % validate_every == 0:
+                validate(step, params)
+
+        on_step = on_epoch_end = None
+        if validation is not None and validate_every is not None:
+            on_step = validate_periodically
+        elif validation is not None:
+            on_epoch_end = validate
+        history = self._fit_batches(
+            lambda seed: samples.batches(self.config.batch_size, seed=seed),
+            callback=callback,
+            profiler=profiler,
+            on_step=on_step,
+            on_epoch_end=on_epoch_end,
+        )
+        if validation is not None and (not self.validation_history or self.validation_history[-1][0] != len(history)):
+            validate(len(history), self.params)
+        return history
+
+    def evaluate_stream(
+        self, samples: NoisyGateSamples, batch_size: int | None = None
+    ) -> tuple[float, float]:
+        """표본 전체의 (평균 제곱 손실, 정확도)를 묶음 단위로 누적해 계산."""
+        return self._evaluate_batches(samples.batches(batch_size or max(self.config.batch_size, 4096)))
@@ -1,49 +1,118 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Sequence
 
 import numpy as np
-import pennylane.numpy as qnp
 
+from pqc.cache import ResultCache
 from pqc.gates import LogicGate, build_dataset, truth_table_inputs
-from pqc.report import display_qiskit_report
+from pqc.model import StepCallback
+from pqc.profiling import TrainingProfiler
+from pqc.report import default_report_engine, display_qiskit_report
+from pqc.results import TrainingResult
+from pqc.workflow import train_gate_with, train_gates_stacked, train_gates_warm
 
 from .config import AnglePQCConfig
-from .model import AngleEncodedTwoQubitPQC
+from .data import NoisyGateSamples
+from .model import AngleEncodedTwoQubitPQC, ValidationPoint
 
+DEFAULT_ANGLE_CONFIG = AnglePQCConfig()
 
-@dataclass
-class AngleTrainingResult:
-    gate: LogicGate
-    final_loss: float
-    accuracy: float
-    converged: bool
-    params: qnp.ndarray
-    probabilities: list[float]
-    predictions: list[int]
-    targets: list[int]
-    loss_history: list[float]
 
+# 모든 계열이 `pqc.results.TrainingResult` 하나를 공유한다. 예전 이름은 별칭으로 남긴다.
+AngleTrainingResult = TrainingResult
 
-def train_angle_gate(gate: LogicGate, config: AnglePQCConfig) -> AngleTrainingResult:
-    dataset = build_dataset(gate)
+
+def train_angle_gate(
+    gate: LogicGate,
+    config: AnglePQCConfig,
+    callback: StepCallback | None = None,
+    cache: ResultCache | None = None,
+    profiler: TrainingProfiler | None = None,
+) -> AngleTrainingResult:
+    return train_gate_with(AngleEncodedTwoQubitPQC(config), gate, callback=callback, cache=cache, profiler=profiler)
+
+
+def train_angle_gates(
+    gates: Sequence[LogicGate],
+    config: AnglePQCConfig,
+    cache: ResultCache | None = None,
+) -> list[AngleTrainingResult]:
+    return train_gates_stacked(AngleEncodedTwoQubitPQC(config), gates, cache=cache)
+
+
+def train_noisy_angle_gate(
+    samples: NoisyGateSamples,
+    config: AnglePQCConfig,
+    validation: NoisyGateSamples | None = None,
+    validate_every: int | None = None,
+    callback: StepCallback | None = None,
+    profiler: TrainingProfiler | None = None,
+) -> tuple[AngleTrainingResult, list[ValidationPoint]]:
+    """잡음 표본 스트림으로 `fit_stream` 학습하고 (깨끗한 진리표 결과, 검증 기록)을 반환.
+
+    결과의 손실 기록은 미니배치 손실이고, 확률·정확도는 잡음 없는 진리표 네 점에서 잰다.
+    """
     pqc = AngleEncodedTwoQubitPQC(config)
-    history = pqc.fit(dataset)
-    probabilities, predictions, targets = pqc.evaluate(dataset)
-    accuracy = sum(int(p == t) for p, t in zip(predictions, targets)) / len(targets)
-    final_loss = history[-1] if history else float("inf")
-    converged = final_loss < config.convergence_tol
-    return AngleTrainingResult(
-        gate=gate,
-        final_loss=final_loss,
-        accuracy=accuracy,
-        converged=converged,
+    history = pqc.fit_stream(samples, validation, validate_every, callback=callback, profiler=profiler)
+    dataset = build_dataset(samples.gate)
+    result = TrainingResult.for_gate(
+        samples.gate,
         params=pqc.params,
-        probabilities=probabilities,
-        predictions=predictions,
-        targets=targets,
+        probabilities=pqc.predict_probabilities([bits for bits, _ in dataset]),
+        targets=[target for _, target in dataset],
         loss_history=history,
+        max_steps=config.max_steps,
+        convergence_tol=config.convergence_tol,
+        seed=pqc.seed,
     )
+    return result, pqc.validation_history
+
+
+def run_noise_robustness(
+    config: AnglePQCConfig | None = None,
+    gates: Sequence[LogicGate] = (LogicGate.AND, LogicGate.XOR),
+    noise_levels: Sequence[float] = (0.0, 0.1, 0.2, 0.3),
+    num_samples: int = 10**6,
+    validation_samples: int = 10**5,
+    epochs: int = 1,
+) -> list[dict[str, float | str]]:
+    """게이트 × 잡음 세기마다 num_samples개 표본을 epochs 에폭 학습하고 검증 정확도를 표로 출력.
+
+    max_steps는 epochs 에폭을 다 돌 수 있도록 늘린다. 행마다 게이트, 잡음, 진리표 정확도,
+    검증 손실·정확도, 스텝 수, 학습 시간(초)을 담은 딕셔너리 목록을 반환한다.
+    """
+    config = config or replace(DEFAULT_ANGLE_CONFIG, backend="numpy")
+    steps = epochs * -(-num_samples // config.batch_size)
+    config = replace(config, max_steps=max(config.max_steps, steps))
+    rows: list[dict[str, float | str]] = []
+    print(f"\n[Angle 잡음 강건성] 표본 {num_samples} / 검증 {validation_samples} / 배치 {config.batch_size}")
+    for gate in gates:
+        for noise in noise_levels:
+            samples = NoisyGateSamples(gate, num_samples, noise, seed=config.seed)
+            start = time.perf_counter()
+            result, validation = train_noisy_angle_gate(samples, config, samples.held_out(validation_samples))
+            elapsed = time.perf_counter() - start
+            _, val_loss, val_accuracy = validation[-1]
+            rows.append(
+                {
+                    "gate": gate.value,
+                    "noise_std": float(noise),
+                    "truth_table_accuracy": result.accuracy,
+                    "validation_loss": val_loss,
+                    "validation_accuracy": val_accuracy,
+                    "steps": float(result.num_steps),
+                    "seconds": elapsed,
+                }
+            )
+            print(
+                f"  {gate.value:<4} σ={noise:.2f}  진리표 {result.accuracy * 100:5.1f}%  "
+                f"검증 {val_accuracy * 100:5.1f}% (손실 {val_loss:.4f})  {result.num_steps} 스텝 {elapsed:.1f}s"
+            )
+    return rows
 
 
 def log_angle_result(result: AngleTrainingResult, config: AnglePQCConfig) -> None:
@@ -58,8 +127,17 @@ def log_angle_result(result: AngleTrainingResult, config: AnglePQCConfig) -> Non
         print(f"    입력 {bits} -> P(1)={prob:.3f} / 예측={pred} / 정답={target}")
 
 
-def run_angle_experiments(config: AnglePQCConfig | None = None) -> None:
-    angle_config = config or AnglePQCConfig()
+def run_angle_experiments(
+    config: AnglePQCConfig | None = None,
+    stacked: bool = False,
+    cache: ResultCache | None = None,
+    report_dir: str | Path | None = None,
+    warm_start: bool = False,
+) -> None:
+    """warm_start=True면 반전 관계인 게이트를 원본 뒤에 학습해 변환한 초기값에서 출발한다."""
+    if stacked and warm_start:
+        raise ValueError("stacked 학습은 모든 게이트가 같은 초기값에서 출발하므로 warm_start와 함께 쓸 수 없습니다.")
+    angle_config = config or DEFAULT_ANGLE_CONFIG
     gates_to_learn = [
         LogicGate.AND,
         LogicGate.OR,
@@ -68,8 +146,18 @@ def run_angle_experiments(config: AnglePQCConfig | None = None) -> None:
         LogicGate.XOR,
         LogicGate.XNOR,
     ]
-    for gate in gates_to_learn:
-        result = train_angle_gate(gate, angle_config)
+    if stacked:
+        results = train_angle_gates(gates_to_learn, angle_config, cache=cache)
+    elif warm_start:
+        results = train_gates_warm(AngleEncodedTwoQubitPQC, gates_to_learn, angle_config, cache=cache)
+    else:
+        results = (train_angle_gate(gate, angle_config, cache=cache) for gate in gates_to_learn)
+    finished = []
+    for result in results:
         log_angle_result(result, angle_config)
-        display_qiskit_report(result)
+        if report_dir is None:
+            display_qiskit_report(result, model_cls=AngleEncodedTwoQubitPQC, config=angle_config)
+        finished.append(result)
+    if report_dir is not None:
+        default_report_engine().write_reports(finished, report_dir, AngleEncodedTwoQubitPQC, angle_config)
 
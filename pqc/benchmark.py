@@ -0,0 +1,398 @@
+"""세 PQC 계열의 학습/추론 성능 벤치마크와 기준값 비교.
+
+    python -m pqc.benchmark run --output baseline.json
+    python -m pqc.benchmark compare baseline.json current.json --threshold 0.2
+    python -m pqc.benchmark imports
+    python -m pqc.benchmark scaling --inputs 2 16 --output scaling.json
+
+측정 항목은 스텝 처리량, 단일 입력 예측 지연, convergence_tol 도달 시간,
+학습 중 최대 메모리, num_blocks(1..16)에 따른 스텝 처리량이다. 시간 측정은
+반복 중 가장 빠른 값을 써서 잡음을 줄인다. `imports`는 새 프로세스에서 모듈별
+콜드 임포트 시간과 불필요하게 끌려온 무거운 의존성을 예산과 비교한다.
+`scaling`은 n-큐비트 PQC(`pqc.nqubit`)의 미니배치 학습 비용을 입력 수별로 잰다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from pqc.gates import LogicGate, build_dataset
+from pqc.optimizers import OPTIMIZERS
+from pqc.parallel import FAMILIES, default_config, model_class
+
+# 모듈별 (콜드 임포트 시간 상한(초), 임포트만으로 불러오면 안 되는 패키지).
+# 워커 프로세스를 자주 띄우므로 패키지 루트와 학습 경로는 Qiskit을 불러오지 않아야 한다.
+IMPORT_BUDGETS: dict[str, tuple[float, tuple[str, ...]]] = {
+    "pqc": (0.05, ("numpy", "pennylane", "qiskit")),
+    "pqc.tangle": (0.05, ("numpy", "pennylane", "qiskit")),
+    "pqc.angle": (0.05, ("numpy", "pennylane", "qiskit")),
+    "pqc.nqubit": (0.05, ("numpy", "pennylane", "qiskit")),
+    "pqc.engine": (0.5, ("pennylane", "qiskit")),
+    "pqc.cache": (0.5, ("pennylane", "qiskit")),
+    "pqc.report": (0.5, ("pennylane", "qiskit")),
+    "pqc.predictor": (0.5, ("pennylane", "qiskit")),
+    "pqc.results": (0.5, ("pennylane", "qiskit")),
+    "pqc.workflow": (5.0, ("qiskit",)),
+    "pqc.tangle.workflow": (5.0, ("qiskit",)),
+    "pqc.angle.workflow": (5.0, ("qiskit",)),
+}
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(name for name in sys.modules if "." not in name)}}))
+"""
+
+
+@dataclass(frozen=True)
+class Measurement:
+    benchmark: str
+    family: str
+    gate: str
+    num_blocks: int
+    backend: str
+    value: float
+    unit: str
+    higher_is_better: bool
+
+    @property
+    def key(self) -> tuple[str, str, str, int, str]:
+        return (self.benchmark, self.family, self.gate, self.num_blocks, self.backend)
+
+
+def _best_time(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_steps_per_sec(family: str, gate: LogicGate, config: Any, steps: int, repeats: int) -> float:
+    """수렴 판정 없이 steps 스텝을 학습하는 처리량."""
+    dataset = build_dataset(gate)
+    fixed = replace(config, max_steps=steps, convergence_tol=0.0)
+    cls = model_class(family)
+    return steps / _best_time(lambda: cls(fixed).fit(dataset), repeats)
+
+
+def bench_predict_latency(family: str, gate: LogicGate, config: Any, calls: int, repeats: int) -> float:
+    """`predict_probability` 한 번의 평균 지연(초)."""
+    pqc = model_class(family)(config)
+    inputs = build_dataset(gate)[-1][0]
+
+    def run() -> None:
+        for _ in range(calls):
+            pqc.predict_probability(inputs)
+
+    return _best_time(run, repeats) / calls
+
+
+def bench_batch_inference(family: str, gate: LogicGate, config: Any, rows: int, repeats: int) -> float:
+    """`CompiledPredictor.predict_batch`의 초당 처리 행 수 (진리표 행을 rows개로 반복)."""
+    from pqc.predictor import CompiledPredictor
+
+    features = np.stack([np.asarray(bits, dtype=float) for bits, _ in build_dataset(gate)])
+    batch = np.resize(features, (rows, features.shape[1]))
+    predictor = CompiledPredictor.from_model(model_class(family)(config))
+    return rows / _best_time(lambda: predictor.predict_batch(batch), repeats)
+
+
+def bench_time_to_convergence(family: str, gate: LogicGate, config: Any) -> tuple[float, int, bool]:
+    dataset = build_dataset(gate)
+    pqc = model_class(family)(config)
+    start = time.perf_counter()
+    history = pqc.fit(dataset)
+    elapsed = time.perf_counter() - start
+    return elapsed, len(history), bool(history) and history[-1] < config.convergence_tol
+
+
+def bench_peak_memory(family: str, gate: LogicGate, config: Any, steps: int) -> int:
+    dataset = build_dataset(gate)
+    fixed = replace(config, max_steps=steps, convergence_tol=0.0)
+    pqc = model_class(family)(fixed)
+    tracemalloc.start()
+    try:
+        pqc.fit(dataset)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(
+    families: Sequence[str] = FAMILIES,
+    gates: Sequence[LogicGate] = tuple(LogicGate),
+    backend: str = "pennylane",
+    steps: int = 20,
+    repeats: int = 3,
+    predict_calls: int = 20,
+    inference_rows: int = 1_000_000,
+    block_range: Sequence[int] = tuple(range(1, 17)),
+    scaling_gate: LogicGate = LogicGate.XOR,
+    convergence: bool = True,
+    optimizers: Sequence[str] = ("adam",),
+    verbose: bool = True,
+) -> list[Measurement]:
+    """optimizers의 각 최적화기로 수렴 시간을 잰다. adam이 아닌 측정은 이름에 [최적화기]를 붙인다."""
+    measurements: list[Measurement] = []
+
+    def record(benchmark: str, gate: LogicGate, config: Any, value: float, unit: str, higher: bool) -> None:
+        item = Measurement(
+            benchmark, family, gate.value, config.num_blocks, config.backend, float(value), unit, higher
+        )
+        measurements.append(item)
+        if verbose:
+            print(f"  {benchmark:<22} {family:<10} {gate.value:<5} L={config.num_blocks:<3} {value:.6g} {unit}")
+
+    for family in families:
+        config = replace(default_config(family), backend=backend)
+        for gate in gates:
+            throughput = bench_steps_per_sec(family, gate, config, steps, repeats)
+            record("steps_per_sec", gate, config, throughput, "steps/s", True)
+            latency = bench_predict_latency(family, gate, config, predict_calls, repeats)
+            record("predict_latency", gate, config, latency, "s", False)
+            rows_per_sec = bench_batch_inference(family, gate, config, inference_rows, repeats)
+            record("batch_inference", gate, config, rows_per_sec, "rows/s", True)
+            memory = bench_peak_memory(family, gate, config, steps)
+            record("peak_memory", gate, config, memory, "bytes", False)
+            for optimizer in optimizers if convergence else ():
+                suffix = "" if optimizer == "adam" else f"[{optimizer}]"
+                elapsed, num_steps, converged = bench_time_to_convergence(
+                    family, gate, replace(config, optimizer=optimizer)
+                )
+                record(f"time_to_convergence{suffix}", gate, config, elapsed, "s", False)
+                record(f"steps_to_convergence{suffix}", gate, config, num_steps, "steps", False)
+                record(f"converged{suffix}", gate, config, converged, "bool", True)
+        for num_blocks in block_range:
+            scaled = replace(config, num_blocks=num_blocks)
+            throughput = bench_steps_per_sec(family, scaling_gate, scaled, steps, repeats)
+            record("steps_per_sec_scaling", scaling_gate, scaled, throughput, "steps/s", True)
+    return measurements
+
+
+def bench_boolean_scaling(
+    input_range: Sequence[int] = tuple(range(2, 17)),
+    batch_size: int = 64,
+    num_blocks: int = 2,
+    steps: int = 3,
+    repeats: int = 2,
+    verbose: bool = True,
+) -> list[Measurement]:
+    """parity(n) 미니배치 학습의 스텝 처리량, 행 처리량, 에폭 추정 시간, 최대 메모리."""
+    from pqc.nqubit import NQubitPQC, NQubitPQCConfig, parity
+
+    measurements: list[Measurement] = []
+    for num_inputs in input_range:
+        function = parity(num_inputs)
+        config = NQubitPQCConfig(
+            num_inputs=num_inputs,
+            num_blocks=num_blocks,
+            batch_size=batch_size,
+            max_steps=steps,
+            convergence_tol=0.0,
+        )
+        step_time = _best_time(lambda: NQubitPQC(config).fit_stream(function), repeats) / steps
+        tracemalloc.start()
+        try:
+            NQubitPQC(config).fit_stream(function)
+            memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        rows = min(batch_size, function.num_rows)
+        values = (
+            ("steps_per_sec", 1.0 / step_time, "steps/s", True),
+            ("rows_per_sec", rows / step_time, "rows/s", True),
+            ("epoch_seconds", step_time * -(-function.num_rows // batch_size), "s", False),
+            ("peak_memory", memory, "bytes", False),
+        )
+        for benchmark, value, unit, higher in values:
+            measurements.append(
+                Measurement(benchmark, "nqubit", function.name, num_blocks, config.backend, float(value), unit, higher)
+            )
+        if verbose:
+            print(
+                f"  n={num_inputs:<3} {1.0 / step_time:10.2f} steps/s {rows / step_time:12.0f} rows/s "
+                f"에폭 {values[2][1]:10.3f} s  메모리 {memory / 2**20:8.1f} MiB"
+            )
+    return measurements
+
+
+def bench_import_time(module: str, repeats: int = 3) -> tuple[float, set[str]]:
+    """새 인터프리터에서 module을 임포트하는 데 걸린 가장 짧은 시간과 불러온 최상위 패키지."""
+    best, loaded = float("inf"), set()
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE.format(module=module)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        probe = json.loads(completed.stdout.strip().splitlines()[-1])
+        best = min(best, probe["seconds"])
+        loaded = set(probe["modules"])
+    return best, loaded
+
+
+def check_import_budgets(
+    budgets: dict[str, tuple[float, tuple[str, ...]]] = IMPORT_BUDGETS,
+    repeats: int = 3,
+    scale: float = 1.0,
+    verbose: bool = True,
+) -> list[str]:
+    """예산을 넘긴 항목의 설명 목록. 느린 머신에서는 scale로 시간 상한을 늘린다."""
+    violations: list[str] = []
+    for module, (limit, forbidden) in budgets.items():
+        seconds, loaded = bench_import_time(module, repeats)
+        leaked = sorted(set(forbidden) & loaded)
+        over = seconds > limit * scale
+        if verbose:
+            status = "초과" if over or leaked else "통과"
+            print(f"  {module:<22} {seconds * 1e3:8.1f} ms / {limit * scale * 1e3:8.1f} ms  [{status}]")
+        if over:
+            violations.append(f"{module}: {seconds:.3f}s > {limit * scale:.3f}s")
+        if leaked:
+            violations.append(f"{module}: 불필요한 임포트 {', '.join(leaked)}")
+    return violations
+
+
+def _environment() -> dict[str, str]:
+    env = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+    for package in ("numpy", "pennylane", "autograd"):
+        try:
+            env[package] = version(package)
+        except PackageNotFoundError:
+            env[package] = "unknown"
+    return env
+
+
+def save_baseline(path: str | Path, measurements: Sequence[Measurement]) -> None:
+    payload = {"environment": _environment(), "measurements": [asdict(item) for item in measurements]}
+    Path(path).write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def load_baseline(path: str | Path) -> list[Measurement]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [Measurement(**item) for item in payload["measurements"]]
+
+
+@dataclass(frozen=True)
+class Comparison:
+    baseline: Measurement
+    current: Measurement
+
+    @property
+    def change(self) -> float:
+        """나빠진 방향을 양수로 하는 상대 변화율. 기준값이 0이면 나빠졌을 때 +inf, 좋아졌을 때 -inf."""
+        base, cur = self.baseline.value, self.current.value
+        worse = cur - base if not self.baseline.higher_is_better else base - cur
+        if base == 0:
+            return 0.0 if worse == 0 else float("inf") if worse > 0 else float("-inf")
+        return worse / abs(base)
+
+
+def compare(
+    baseline: Sequence[Measurement],
+    current: Sequence[Measurement],
+    threshold: float = 0.2,
+) -> tuple[list[Comparison], list[Comparison]]:
+    """같은 키의 측정끼리 비교해 (전체 비교, threshold를 넘게 나빠진 회귀) 목록을 반환."""
+    current_by_key = {item.key: item for item in current}
+    pairs = [Comparison(item, current_by_key[item.key]) for item in baseline if item.key in current_by_key]
+    regressions = [pair for pair in pairs if pair.change > threshold]
+    return pairs, regressions
+
+
+def _main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pqc.benchmark", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="벤치마크를 실행해 JSON 기준값으로 저장")
+    run.add_argument("--output", required=True)
+    run.add_argument("--families", nargs="+", default=list(FAMILIES), choices=FAMILIES)
+    run.add_argument("--gates", nargs="+", default=[gate.value for gate in LogicGate])
+    run.add_argument("--backend", default="pennylane")
+    run.add_argument("--steps", type=int, default=20)
+    run.add_argument("--repeats", type=int, default=3)
+    run.add_argument("--max-blocks", type=int, default=16)
+    run.add_argument("--skip-convergence", action="store_true")
+    run.add_argument("--optimizers", nargs="+", default=["adam"], choices=OPTIMIZERS)
+
+    cmp = commands.add_parser("compare", help="두 기준값 파일을 비교해 회귀를 보고")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.2)
+
+    imports = commands.add_parser("imports", help="모듈별 콜드 임포트 시간과 의존성 예산 확인")
+    imports.add_argument("--repeats", type=int, default=3)
+    imports.add_argument("--scale", type=float, default=1.0, help="시간 상한 배수")
+
+    scaling = commands.add_parser("scaling", help="n-입력 불리언 함수 학습 비용의 입력 수별 측정")
+    scaling.add_argument("--inputs", nargs=2, type=int, default=[2, 16], metavar=("MIN", "MAX"))
+    scaling.add_argument("--batch-size", type=int, default=64)
+    scaling.add_argument("--blocks", type=int, default=2)
+    scaling.add_argument("--steps", type=int, default=3)
+    scaling.add_argument("--output")
+
+    args = parser.parse_args(argv)
+    if args.command == "scaling":
+        measurements = bench_boolean_scaling(
+            range(args.inputs[0], args.inputs[1] + 1),
+            batch_size=args.batch_size,
+            num_blocks=args.blocks,
+            steps=args.steps,
+        )
+        if args.output:
+            save_baseline(args.output, measurements)
+        return 0
+    if args.command == "imports":
+        violations = check_import_budgets(repeats=args.repeats, scale=args.scale)
+        for violation in violations:
+            print(f"  [예산 초과] {violation}")
+        return 1 if violations else 0
+    if args.command == "run":
+        measurements = run_benchmarks(
+            families=args.families,
+            gates=[LogicGate(name) for name in args.gates],
+            backend=args.backend,
+            steps=args.steps,
+            repeats=args.repeats,
+            block_range=range(1, args.max_blocks + 1),
+            convergence=not args.skip_convergence,
+            optimizers=args.optimizers,
+        )
+        save_baseline(args.output, measurements)
+        print(f"\n측정 {len(measurements)}건을 {args.output}에 저장했습니다.")
+        return 0
+
+    pairs, regressions = compare(load_baseline(args.baseline), load_baseline(args.current), args.threshold)
+    print(f"비교 {len(pairs)}건 / 회귀 {len(regressions)}건 (허용 {args.threshold * 100:.0f}%)")
+    for pair in sorted(regressions, key=lambda item: -item.change):
+        base, cur = pair.baseline, pair.current
+        label = f"{base.benchmark} {base.family} {base.gate} L={base.num_blocks} {base.backend}"
+        print(f"  [회귀] {label}: {base.value:.6g} → {cur.value:.6g} {base.unit} ({pair.change * 100:+.1f}%)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
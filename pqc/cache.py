@@ -0,0 +1,120 @@
+"""학습 결과의 내용 주소 기반 디스크 캐시."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from dataclasses import asdict
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pqc.gates import LogicGate
+    from pqc.model import PQCConfig
+
+# 결과 객체 구조나 학습 의미가 바뀌면 올려서 기존 캐시를 무효화한다.
+CACHE_SCHEMA = 4
+
+_VERSIONED_PACKAGES = ("numpy", "pennylane", "autograd")
+
+
+def _library_versions() -> dict[str, str]:
+    versions = {"python": f"{sys.version_info.major}.{sys.version_info.minor}"}
+    for package in _VERSIONED_PACKAGES:
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = "unknown"
+    return versions
+
+
+def default_cache_dir() -> Path:
+    """`PQC_CACHE_DIR` 환경 변수, 없으면 ~/.cache/pqc."""
+    return Path(os.environ.get("PQC_CACHE_DIR", Path.home() / ".cache" / "pqc"))
+
+
+class ResultCache:
+    """(모델 클래스, 게이트, 설정 전체, 라이브러리 버전) 해시를 키로 학습 결과를 저장.
+
+    결과는 `results/<key>.pkl`, 학습 중 체크포인트는 `checkpoints/<key>.npz`에 둔다.
+    조회할 때마다 파일 수정 시각을 갱신하고, 항목 수가 max_entries를 넘으면
+    가장 오래 쓰이지 않은 결과부터 지운다(LRU).
+    """
+
+    def __init__(self, root: str | Path | None = None, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다.")
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_entries = max_entries
+        self._versions = _library_versions()
+
+    @property
+    def results_dir(self) -> Path:
+        return self.root / "results"
+
+    @property
+    def checkpoints_dir(self) -> Path:
+        return self.root / "checkpoints"
+
+    def key(
+        self, model_cls: type, gate: LogicGate, config: PQCConfig, initial_params: np.ndarray | None = None
+    ) -> str:
+        """initial_params는 설정의 seed 대신 다른 초기값(warm-start)에서 출발할 때 넘긴다."""
+        payload = {
+            "schema": CACHE_SCHEMA,
+            "model": f"{model_cls.__module__}.{model_cls.__qualname__}",
+            "gate": gate.value,
+            "config_type": f"{type(config).__module__}.{type(config).__qualname__}",
+            "config": asdict(config),
+            "versions": self._versions,
+        }
+        if initial_params is not None:
+            payload["initial_params"] = hashlib.sha256(np.asarray(initial_params, dtype=float).tobytes()).hexdigest()
+        encoded = json.dumps(payload, sort_keys=True, default=repr).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _result_path(self, key: str) -> Path:
+        return self.results_dir / f"{key}.pkl"
+
+    def checkpoint_path(self, key: str) -> Path:
+        return self.checkpoints_dir / f"{key}.npz"
+
+    def get(self, key: str) -> Any | None:
+        """캐시된 결과. 없거나 읽을 수 없으면 None."""
+        path = self._result_path(key)
+        try:
+            with open(path, "rb") as handle:
+                result = pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        os.utime(path)
+        return result
+
+    def put(self, key: str, result: Any) -> None:
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        path = self._result_path(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as handle:
+            pickle.dump(result, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self.results_dir.glob("*.pkl"), key=lambda item: item.stat().st_mtime)
+        for stale in entries[: max(0, len(entries) - self.max_entries)]:
+            stale.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.results_dir.glob("*.pkl")) if self.results_dir.exists() else 0
+
+    def clear(self) -> None:
+        for directory in (self.results_dir, self.checkpoints_dir):
+            if directory.exists():
+                for path in directory.iterdir():
+                    path.unlink(missing_ok=True)
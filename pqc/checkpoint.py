@@ -0,0 +1,84 @@
+"""`TwoQubitPQC.fit` 중단 지점 복원을 위한 체크포인트 입출력."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+# plateau 학습률 일정 상태를 담는 npz 키
+_SCHEDULE_KEYS = ("schedule_lr", "schedule_best", "schedule_wait")
+
+
+@dataclass
+class TrainingCheckpoint:
+    """학습 재개에 필요한 상태: 파라미터, Adam 모멘트/스텝 수, 손실 기록, 현재 학습률과
+    plateau 일정 상태 (lr, best, wait).
+
+    fingerprint는 모델 클래스·설정·데이터셋에서 계산한 값으로, 다른 학습의
+    체크포인트를 잘못 이어 붙이는 것을 막는다. stepsize와 schedule_state는 이 필드가
+    생기기 전에 쓴 체크포인트에서는 None이다.
+    """
+
+    fingerprint: str
+    params: np.ndarray
+    loss_history: list[float]
+    first_moment: np.ndarray
+    second_moment: np.ndarray
+    adam_step: int
+    stepsize: np.ndarray | None = None
+    schedule_state: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+    def adam_accumulation(self) -> dict:
+        """`qml.AdamOptimizer.accumulation`과 같은 구조로 되돌린다."""
+        return {"fm": [self.first_moment], "sm": [self.second_moment], "t": self.adam_step}
+
+
+def save_checkpoint(path: str | Path, checkpoint: TrainingCheckpoint) -> None:
+    """임시 파일에 쓴 뒤 교체해, 저장 중 중단돼도 이전 체크포인트가 남도록 한다."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    optional: dict[str, np.ndarray] = {}
+    if checkpoint.stepsize is not None:
+        optional["stepsize"] = np.asarray(checkpoint.stepsize, dtype=float)
+    if checkpoint.schedule_state is not None:
+        optional.update(zip(_SCHEDULE_KEYS, (np.asarray(value) for value in checkpoint.schedule_state)))
+    with open(tmp_path, "wb") as handle:
+        np.savez(
+            handle,
+            fingerprint=np.array(checkpoint.fingerprint),
+            params=np.asarray(checkpoint.params, dtype=float),
+            loss_history=np.asarray(checkpoint.loss_history, dtype=float),
+            first_moment=np.asarray(checkpoint.first_moment, dtype=float),
+            second_moment=np.asarray(checkpoint.second_moment, dtype=float),
+            adam_step=np.array(checkpoint.adam_step),
+            **optional,
+        )
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str | Path) -> TrainingCheckpoint | None:
+    """체크포인트가 없으면 None."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with np.load(path) as data:
+        return TrainingCheckpoint(
+            fingerprint=str(data["fingerprint"]),
+            params=data["params"],
+            loss_history=[float(value) for value in data["loss_history"]],
+            first_moment=data["first_moment"],
+            second_moment=data["second_moment"],
+            adam_step=int(data["adam_step"]),
+            stepsize=np.array(data["stepsize"]) if "stepsize" in data.files else None,
+            schedule_state=(
+                tuple(np.array(data[key]) for key in _SCHEDULE_KEYS) if _SCHEDULE_KEYS[0] in data.files else None
+            ),
+        )
+
+
+def remove_checkpoint(path: str | Path) -> None:
+    Path(path).unlink(missing_ok=True)
@@ -0,0 +1,221 @@
+"""앤사츠 게이트 열 컴파일: 단일 큐비트 회전 사슬과 상수 2-큐비트 구간 합치기.
+
+`compile_operations`는 `Operation` 목록을 받아
+
+- 한 와이어에서 다른 게이트를 사이에 두지 않고 이어지는 단일 큐비트 게이트를
+  2×2 유니터리 하나(`FusedRotation`)로,
+- 같은 와이어 쌍에서 이어지는 매개변수 없는 2-큐비트 게이트(각도 인코딩 앤사츠의
+  CRX(π/2) 쌍 등)를 미리 계산한 4×4 행렬 하나(`FusedConstant`)로
+
+묶는다. 다른 와이어의 게이트와는 교환 가능하므로, 사슬은 그 와이어를 건드리는 다음
+게이트 바로 앞(또는 회로 끝)에서 내보낸다. 합친 회전의 그라디언트는 사슬의 누적곱으로
+원래 파라미터마다 닫힌 형태로 계산한다(`FusedRotation.backprop`).
+
+행렬 계산은 `xp` 인자로 NumPy 대신 autograd 호환 모듈(`pennylane.numpy`)을 받을 수
+있어서, PennyLane 경로도 같은 컴파일 결과를 `QubitUnitary`로 실행한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Any, Sequence, Union
+
+import numpy as np
+
+from pqc.engine import Operation, gate_matrix
+
+# 사슬로 합칠 수 있는 단일 큐비트 게이트
+SINGLE_QUBIT_GATES = frozenset({"RX", "RY", "RZ", "PauliX"})
+
+_I2 = np.eye(2, dtype=complex)
+_PAULI_X = np.array([[0, 1], [1, 0]], dtype=complex)
+_PAULI = {
+    "X": _PAULI_X,
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=complex),
+    "Z": np.array([[1, 0], [0, -1]], dtype=complex),
+}
+
+
+def rotation_matrix(name: str, angle: Any, xp: Any = np) -> Any:
+    """exp(-iθP/2)의 (…, 2, 2) 행렬. xp로 autograd 호환 모듈을 넘기면 미분 가능하다."""
+    half = 0.5 * angle
+    cos, sin = xp.cos(half), xp.sin(half)
+    if name == "RX":
+        rows = ((cos + 0j, -1j * sin), (-1j * sin, cos + 0j))
+    elif name == "RY":
+        rows = ((cos + 0j, -sin + 0j), (sin + 0j, cos + 0j))
+    elif name == "RZ":
+        zero = 0j * half
+        rows = ((xp.exp(-1j * half), zero), (zero, xp.exp(1j * half)))
+    else:
+        raise ValueError(f"지원하지 않는 회전 게이트입니다: {name}")
+    return xp.stack([xp.stack(row, axis=-1) for row in rows], axis=-2)
+
+
+def operation_angle(op: Operation, flat: Any) -> Any:
+    """``offset + Σ coeff · flat[..., index]`` (terms가 없으면 스칼라 offset)."""
+    angle: Any = op.offset
+    for index, coeff in op.terms:
+        angle = angle + coeff * flat[..., index]
+    return angle
+
+
+def _single_qubit_matrix(op: Operation, flat: Any, xp: Any) -> Any:
+    if op.name == "PauliX":
+        return _PAULI_X
+    return rotation_matrix(op.name, operation_angle(op, flat), xp)
+
+
+@lru_cache(maxsize=None)
+def _term_matrix(operations: tuple[Operation, ...], num_params: int) -> np.ndarray:
+    """(num_params, m) 계수 행렬 A. 사슬의 각도는 flat @ A + offset 이다."""
+    matrix = np.zeros((num_params, len(operations)))
+    for position, op in enumerate(operations):
+        for index, coeff in op.terms:
+            matrix[index, position] += coeff
+    return matrix
+
+
+@dataclass(frozen=True)
+class FusedRotation:
+    """한 와이어에서 이어지는 단일 큐비트 게이트 사슬 R_1, …, R_m (적용 순서).
+
+    모든 게이트를 R_k = exp(-iα_k P_k/2) 꼴로 다루므로(PauliX는 전역 위상만 다른 RX(π))
+    게이트별 행렬을 한 번에 만들고, 누적곱 Q_k = R_k ⋯ R_1은 로그 깊이 스캔으로
+    구한다. 사슬 행렬은 U = Q_m이다.
+    """
+
+    wire: int
+    operations: tuple[Operation, ...]
+
+    @property
+    def wires(self) -> tuple[int, ...]:
+        return (self.wire,)
+
+    @property
+    def terms(self) -> tuple[tuple[int, float], ...]:
+        return tuple(term for op in self.operations for term in op.terms)
+
+    @cached_property
+    def generators(self) -> np.ndarray:
+        return np.stack([_PAULI["X" if op.name == "PauliX" else op.name[1]] for op in self.operations])
+
+    @cached_property
+    def offsets(self) -> np.ndarray:
+        return np.array([np.pi if op.name == "PauliX" else op.offset for op in self.operations])
+
+    def factors(self, flat: Any, xp: Any = np) -> Any:
+        """게이트별 (…, m, 2, 2) 행렬. flat은 (…, num_params) 평탄화 파라미터."""
+        angles = xp.matmul(flat, _term_matrix(self.operations, flat.shape[-1])) + self.offsets
+        half = 0.5 * angles[..., None, None]
+        return xp.cos(half) * _I2 - 1j * xp.sin(half) * self.generators
+
+    @staticmethod
+    def prefixes(factors: Any, xp: Any = np) -> Any:
+        """(…, m, 2, 2) 누적곱 Q_k = R_k ⋯ R_1 (Hillis–Steele 스캔, matmul log₂ m번)."""
+        step = 1
+        while step < factors.shape[-3]:
+            factors = xp.concatenate(
+                [factors[..., :step, :, :], xp.matmul(factors[..., step:, :, :], factors[..., :-step, :, :])],
+                axis=-3,
+            )
+            step *= 2
+        return factors
+
+    def matrix(self, flat: Any, xp: Any = np) -> Any:
+        return self.prefixes(self.factors(flat, xp), xp)[..., -1, :, :]
+
+    def backprop(self, prefixes: np.ndarray, weight: np.ndarray, grad: np.ndarray) -> None:
+        """grad (…, num_params)에 사슬 파라미터의 그라디언트를 더한다.
+
+        weight는 W_ab = Σ conj(λ_a) ψ_b (…, 2, 2)로, ψ는 사슬 적용 전 상태, λ는 적용 후
+        adjoint 상태이며 이 와이어 외의 축과 입력 행은 합산한 것이다.
+        dU/dα_k = -i/2 U Q_k† P_k Q_k 이므로 ∂α_k = Im tr(P_k Q_k (Wᵀ U) Q_k†) 이다.
+        """
+        heisenberg = np.swapaxes(weight, -1, -2) @ prefixes[..., -1, :, :]
+        rotated = prefixes @ heisenberg[..., None, :, :] @ np.conj(np.swapaxes(prefixes, -1, -2))
+        partial = np.einsum("kab,...kba->...k", self.generators, rotated).imag
+        grad += partial @ _term_matrix(self.operations, grad.shape[-1]).T
+
+
+@dataclass(frozen=True)
+class FusedConstant:
+    """매개변수 없는 게이트 구간을 미리 곱해 둔 행렬. wires 순서대로 0번이 최상위 비트다."""
+
+    wires: tuple[int, ...]
+    operations: tuple[Operation, ...]
+    matrix: np.ndarray = field(compare=False, repr=False)
+
+    terms: tuple[tuple[int, float], ...] = ()
+
+    @classmethod
+    def from_operations(cls, wires: tuple[int, ...], operations: Sequence[Operation]) -> "FusedConstant":
+        if len(wires) == 1:
+            matrix = np.eye(2, dtype=complex)
+            for op in operations:
+                matrix = _single_qubit_matrix(op, None, np) @ matrix
+        else:
+            local = {wire: position for position, wire in enumerate(wires)}
+            matrix = np.eye(4, dtype=complex)
+            for op in operations:
+                relabeled = Operation(op.name, tuple(local[wire] for wire in op.wires), offset=op.offset)
+                matrix = gate_matrix(relabeled, op.offset) @ matrix
+        return cls(tuple(wires), tuple(operations), np.asarray(matrix, dtype=complex))
+
+
+CompiledOperation = Union[Operation, FusedRotation, FusedConstant]
+
+
+def compile_operations(operations: Sequence[Operation]) -> list[CompiledOperation]:
+    """게이트 열을 합쳐 실행 순서대로 반환. 합칠 것이 없는 게이트는 원래 `Operation` 그대로 둔다."""
+    compiled: list[CompiledOperation] = []
+    chains: dict[int, list[Operation]] = {}
+    segment: list[Operation] = []
+
+    def flush_chain(wire: int) -> None:
+        chain = chains.pop(wire, [])
+        if len(chain) == 1:
+            compiled.append(chain[0])
+        elif any(op.terms for op in chain):
+            compiled.append(FusedRotation(wire, tuple(chain)))
+        elif chain:
+            compiled.append(FusedConstant.from_operations((wire,), chain))
+
+    def flush_segment() -> None:
+        if len(segment) == 1:
+            compiled.append(segment[0])
+        elif segment:
+            compiled.append(FusedConstant.from_operations(segment[0].wires, segment))
+        segment.clear()
+
+    for op in operations:
+        touches_segment = bool(segment) and bool(set(op.wires) & set(segment[0].wires))
+        if len(op.wires) == 1 and op.name in SINGLE_QUBIT_GATES:
+            if touches_segment:
+                flush_segment()
+            chains.setdefault(op.wires[0], []).append(op)
+            continue
+
+        for wire in op.wires:
+            flush_chain(wire)
+        constant_pair = len(op.wires) == 2 and not op.terms
+        if constant_pair and segment and set(op.wires) == set(segment[0].wires):
+            segment.append(op)
+            continue
+        if touches_segment or constant_pair:
+            flush_segment()
+        if constant_pair:
+            segment.append(op)
+        else:
+            compiled.append(op)
+
+    flush_segment()
+    for wire in sorted(chains):
+        flush_chain(wire)
+    return compiled
+
+
+def compiled_size(operations: Sequence[Operation]) -> tuple[int, int]:
+    """(원래 게이트 수, 컴파일 후 게이트 수)."""
+    return len(operations), len(compile_operations(operations))
@@ -0,0 +1,161 @@
+"""PennyLane 백엔드 QNode의 미분 방법 선택 (`PQCConfig.diff_method`).
+
+- ``best``: PennyLane 기본값 (기존 동작).
+- ``backprop`` / ``adjoint`` / ``parameter-shift`` / ``finite-diff``: 그대로 쓴다.
+  backprop과 adjoint는 해석적 기대값에서만 동작하므로 shots와 함께 쓸 수 없다.
+- ``auto``: 모델을 만들 때 후보 방법마다 진리표 입력으로 손실·그라디언트를 직접 계산해
+  본다. 해석적 기대값이면 backprop/adjoint/parameter-shift 중 NumPy 엔진의 해석적
+  그라디언트와 맞는 방법의 시간을 재서 가장 빠른 것을 고른다. finite-diff는 근사라서
+  해석적 모드에서는 후보로 넣지 않는다. 샷이 있으면 시간을 재지 않고 parameter-shift를,
+  그것이 실행되지 않을 때만 finite-diff를 쓴다(샷 잡음 때문에 그라디언트 비교도 하지
+  않는다). 결과는 (모델 클래스, 큐비트 수, num_blocks, shots, 합친 회로 여부, 잡음 모델)마다
+  프로세스 안에서 한 번만 정한다.
+
+numpy·fourier 백엔드는 학습에 QNode를 쓰지 않으므로 auto를 best로 두고 재지 않는다.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pennylane.numpy as qnp
+from pennylane.exceptions import DeviceError, QuantumFunctionError
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.model import TwoQubitPQC
+
+DIFF_METHODS = ("best", "auto", "backprop", "adjoint", "parameter-shift", "finite-diff")
+ANALYTIC_ONLY = ("backprop", "adjoint")
+
+# auto 후보: 해석적 기대값 / 유한 샷
+_ANALYTIC_CANDIDATES = ("backprop", "adjoint", "parameter-shift")
+_SHOT_CANDIDATES = ("parameter-shift", "finite-diff")
+
+# 측정 반복 수(가장 빠른 값을 쓴다)와 측정에 쓰는 최대 입력 행 수
+_REPEATS = 3
+_MAX_ROWS = 16
+
+# 해석적 그라디언트와의 허용 오차
+_GRAD_ATOL = 1e-6
+
+# 한 번 실행이 지금까지 가장 빠른 후보의 이 배수보다 느리면 더 재지 않는다.
+_ABORT_FACTOR = 3.0
+
+
+@dataclass(frozen=True)
+class DiffMethodChoice:
+    """auto가 고른 방법과 후보별 손실+그라디언트 한 번의 시간(초, 샷 모드는 비어 있다).
+
+    skipped는 실행되지 않거나 그라디언트가 틀려 빠진 후보와 그 이유다.
+    """
+
+    method: str
+    timings: dict[str, float]
+    skipped: dict[str, str] = field(default_factory=dict)
+
+
+_CHOICES: dict[tuple, DiffMethodChoice] = {}
+
+
+def _benchmark_key(model: "TwoQubitPQC") -> tuple:
+    config = model.config
+    return (type(model), model.num_wires, config.num_blocks, config.shots, model.compiled is not None, config.noise)
+
+
+def _time_method(
+    model: "TwoQubitPQC", method: str, features: qnp.ndarray, targets: qnp.ndarray, limit: float
+) -> tuple[float, np.ndarray]:
+    """method로 만든 QNode의 (가장 빠른 손실+그라디언트 시간, 그라디언트). 한 번이라도 limit보다
+    느리면 그 시간을 돌려주고 반복을 멈춘다."""
+    qnode = model._make_qnode(method)
+    previous, model.qnode = model.qnode, qnode
+    try:
+        best, grad = float("inf"), None
+        for repeat in range(_REPEATS + 1):  # 첫 호출은 tape 구성 비용을 빼려고 버린다
+            start = time.perf_counter()
+            _, grad = model._loss_and_grad(features, targets, model.params)
+            elapsed = time.perf_counter() - start
+            if repeat or elapsed > limit:
+                best = min(best, elapsed)
+            if elapsed > limit:
+                break
+        return best, np.asarray(grad, dtype=float)
+    finally:
+        model.qnode = previous
+
+
+def benchmark_diff_methods(model: "TwoQubitPQC") -> DiffMethodChoice:
+    """model의 설정에서 auto 후보를 시험해 방법을 고른다. 결과는 캐시한다.
+
+    해석적 모드는 유효한 후보 중 가장 빠른 것, 샷 모드는 실행되는 첫 후보다.
+    """
+    key = _benchmark_key(model)
+    if key in _CHOICES:
+        return _CHOICES[key]
+
+    from pqc.gates import truth_table_inputs
+
+    rows = np.array(truth_table_inputs(model.num_wires)[:_MAX_ROWS], dtype=float)
+    # 그라디언트가 0이 되지 않도록 입력마다 다른 타깃을 둔다.
+    targets = qnp.array(np.arange(len(rows)) % 2, dtype=float, requires_grad=False)
+    features = qnp.array(rows, requires_grad=False)
+
+    if model.config.shots is not None:
+        choice = _first_runnable(model, features, targets)
+    else:
+        engine = model._analytic_engine()
+        expvals, pullback = engine.expval_and_vjp(model._engine_initial_states(rows), np.asarray(model.params))
+        residual = model._expval_to_prob(expvals) - np.asarray(targets)
+        reference = pullback(-residual / residual.shape[-1])
+        choice = _fastest_exact(model, features, targets, reference)
+    _CHOICES[key] = choice
+    return choice
+
+
+def _fastest_exact(
+    model: "TwoQubitPQC", features: qnp.ndarray, targets: qnp.ndarray, reference: np.ndarray
+) -> DiffMethodChoice:
+    timings: dict[str, float] = {}
+    skipped: dict[str, str] = {}
+    for method in _ANALYTIC_CANDIDATES:
+        try:
+            limit = _ABORT_FACTOR * min(timings.values(), default=float("inf"))
+            elapsed, grad = _time_method(model, method, features, targets, limit)
+        except (QuantumFunctionError, DeviceError, ValueError) as error:  # 이 회로·장치에서 지원하지 않는 방법
+            skipped[method] = f"{type(error).__name__}: {error}"
+            continue
+        if not np.allclose(grad, reference, atol=_GRAD_ATOL):
+            skipped[method] = "해석적 그라디언트와 다릅니다."
+            continue
+        timings[method] = elapsed
+    method = min(timings, key=timings.get) if timings else "best"
+    return DiffMethodChoice(method, timings, skipped)
+
+
+def _first_runnable(model: "TwoQubitPQC", features: qnp.ndarray, targets: qnp.ndarray) -> DiffMethodChoice:
+    """샷 모드: 후보를 순서대로 한 번씩 실행해 보고 처음 실행되는 방법을 쓴다."""
+    skipped: dict[str, str] = {}
+    for method in _SHOT_CANDIDATES:
+        previous, model.qnode = model.qnode, model._make_qnode(method)
+        try:
+            model._loss_and_grad(features, targets, model.params)
+        except (QuantumFunctionError, DeviceError, ValueError) as error:
+            skipped[method] = f"{type(error).__name__}: {error}"
+            continue
+        finally:
+            model.qnode = previous
+        return DiffMethodChoice(method, {}, skipped)
+    return DiffMethodChoice("best", {}, skipped)
+
+
+def resolve_diff_method(model: "TwoQubitPQC") -> str:
+    """config.diff_method를 QNode에 넘길 방법 이름으로. auto면 `benchmark_diff_methods`로 고른다."""
+    method = model.config.diff_method
+    if method != "auto":
+        return method
+    if model.config.backend in ("numpy", "fourier"):
+        return "best"
+    return benchmark_diff_methods(model).method
@@ -0,0 +1,274 @@
+"""2-큐비트 PQC 전용 NumPy 상태벡터 엔진.
+
+PennyLane `default.qubit`과 같은 규약(0번 와이어가 최상위 비트)을 따르며,
+회로는 `Operation` 목록으로 기술한다. 매개변수 게이트는 모두
+U(θ) = exp(-iθG/2) 꼴이므로 생성자 G만 미리 계산해 두면 행렬과 미분을
+닫힌 형태로 얻을 수 있고, 그라디언트는 adjoint 방식으로 한 번의 역방향
+진화만으로 계산한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+
+_I2 = np.eye(2, dtype=complex)
+_PAULI = {
+    "X": np.array([[0, 1], [1, 0]], dtype=complex),
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=complex),
+    "Z": np.array([[1, 0], [0, -1]], dtype=complex),
+}
+_P0 = np.array([[1, 0], [0, 0]], dtype=complex)
+_P1 = np.array([[0, 0], [0, 1]], dtype=complex)
+_I4 = np.eye(4, dtype=complex)
+
+# ⟨Z0⟩ 관측량의 대각 성분 (|00>, |01>, |10>, |11>)
+Z0_DIAGONAL = np.array([1.0, 1.0, -1.0, -1.0])
+
+
+def _on_wire(matrix: np.ndarray, wire: int) -> np.ndarray:
+    return np.kron(matrix, _I2) if wire == 0 else np.kron(_I2, matrix)
+
+
+def _excited(matrix: np.ndarray, control: int) -> np.ndarray:
+    """제어 큐비트가 |1>일 때만 타깃에 matrix를 적용하는 성분."""
+    return np.kron(_P1, matrix) if control == 0 else np.kron(matrix, _P1)
+
+
+def _controlled(matrix: np.ndarray, control: int) -> np.ndarray:
+    return _on_wire(_P0, control) + _excited(matrix, control)
+
+
+def _generator(name: str, wires: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+    """U(θ) = exp(-iθG/2)의 생성자 G와 G² 투영자를 반환."""
+    if name in {"RX", "RY", "RZ"}:
+        return _on_wire(_PAULI[name[1]], wires[0]), _I4
+    if name in {"IsingXX", "IsingYY", "IsingZZ"}:
+        pauli = _PAULI[name[-1]]
+        return np.kron(pauli, pauli), _I4
+    if name in {"CRX", "CRY", "CRZ"}:
+        control = wires[0]
+        return _excited(_PAULI[name[-1]], control), _on_wire(_P1, control)
+    raise ValueError(f"지원하지 않는 매개변수 게이트입니다: {name}")
+
+
+def _fixed_matrix(name: str, wires: tuple[int, ...]) -> np.ndarray:
+    if name == "PauliX":
+        return _on_wire(_PAULI["X"], wires[0])
+    if name == "CNOT":
+        return _controlled(_PAULI["X"], wires[0])
+    if name == "CZ":
+        return _controlled(_PAULI["Z"], wires[0])
+    raise ValueError(f"지원하지 않는 고정 게이트입니다: {name}")
+
+
+def _embed(matrix: np.ndarray, wire: int) -> np.ndarray:
+    """(…, 2, 2) 배치 행렬을 wire에 작용하는 (…, 4, 4) 행렬로 확장 (배치용 `_on_wire`)."""
+    if wire == 0:
+        full = np.einsum("...ab,cd->...acbd", matrix, _I2)
+    else:
+        full = np.einsum("ab,...cd->...acbd", _I2, matrix)
+    return full.reshape(full.shape[:-4] + (4, 4))
+
+
+_SWAP = np.eye(4, dtype=complex)[[0, 2, 1, 3]]
+
+PARAMETRIC_GATES = frozenset({"RX", "RY", "RZ", "IsingXX", "IsingYY", "IsingZZ", "CRX", "CRY", "CRZ"})
+
+
+@dataclass(frozen=True)
+class Operation:
+    """엔진이 실행할 게이트 하나.
+
+    매개변수 게이트의 각도는 ``offset + Σ coeff · params.flat[index]`` 로 계산한다.
+    얽힘 PQC의 IsingZZ처럼 여러 파라미터를 재활용하는 게이트도 이 선형 결합으로 표현된다.
+    """
+
+    name: str
+    wires: tuple[int, ...]
+    terms: tuple[tuple[int, float], ...] = ()
+    offset: float = 0.0
+
+    @property
+    def parametric(self) -> bool:
+        return self.name in PARAMETRIC_GATES
+
+
+def local_generator(op: Operation) -> np.ndarray:
+    """매개변수 게이트 exp(-iθG/2)의 생성자 G를 op.wires 순서의 국소 행렬 (2×2 또는 4×4)로."""
+    if len(op.wires) == 1:
+        return _PAULI[op.name[1]]
+    return _generator(op.name, (0, 1))[0]
+
+
+def gate_matrix(op: Operation, angle: float = 0.0) -> np.ndarray:
+    """wires가 {0, 1} 안에 있는 게이트 하나의 4×4 행렬. 매개변수 게이트는 각도 angle로 계산한다."""
+    if not op.parametric:
+        return _fixed_matrix(op.name, op.wires)
+    generator, projector = _generator(op.name, op.wires)
+    half = 0.5 * angle
+    return _I4 - projector + np.cos(half) * projector - 1j * np.sin(half) * generator
+
+
+def basis_states(features: np.ndarray) -> np.ndarray:
+    """(N, 2) 비트 배열을 계산 기저 상태 (N, 4)로 변환."""
+    bits = np.asarray(features, dtype=float).reshape(-1, 2).round().astype(int)
+    states = np.zeros((bits.shape[0], 4), dtype=complex)
+    states[np.arange(bits.shape[0]), 2 * bits[:, 0] + bits[:, 1]] = 1.0
+    return states
+
+
+def rotation_states(axis: str, angles: np.ndarray) -> np.ndarray:
+    """(N, 2) 각도로 |00>에 와이어별 RX/RY/RZ를 적용한 곱 상태 (N, 4)."""
+    half = 0.5 * np.asarray(angles, dtype=float).reshape(-1, 2)
+    cos, sin = np.cos(half), np.sin(half)
+    if axis == "RX":
+        single = np.stack([cos, -1j * sin], axis=-1)
+    elif axis == "RY":
+        single = np.stack([cos, sin], axis=-1).astype(complex)
+    elif axis == "RZ":
+        single = np.stack([np.exp(-1j * half), np.zeros_like(half)], axis=-1)
+    else:
+        raise ValueError(f"지원하지 않는 인코딩 축입니다: {axis}")
+    return (single[:, 0, :, None] * single[:, 1, None, :]).reshape(-1, 4)
+
+
+class StatevectorEngine:
+    """`Operation` 목록을 (배치) 상태벡터 위에서 실행하고 adjoint 그라디언트를 제공.
+
+    fuse=True면 `pqc.compile.compile_operations`로 회전 사슬과 상수 구간을 합친 게이트
+    열을 실행한다. 결과와 그라디언트는 합치지 않은 실행과 (부동소수점 오차 안에서) 같다.
+    """
+
+    def __init__(self, operations: Sequence[Operation], param_shape: tuple[int, ...], fuse: bool = True):
+        from pqc.compile import FusedConstant, FusedRotation, compile_operations
+
+        self.operations = tuple(operations)
+        self.units = tuple(compile_operations(self.operations)) if fuse else self.operations
+        self.param_shape = tuple(param_shape)
+        self.num_params = int(np.prod(self.param_shape))
+        # 지금까지 시뮬레이션한 회로 수 (파라미터 배치 × 입력 행)
+        self.executions = 0
+        self._generators: list[np.ndarray | None] = []
+        self._projectors: list[np.ndarray | None] = []
+        self._fixed: list[np.ndarray | None] = []
+        self._chains: list[FusedRotation | None] = []
+        for unit in self.units:
+            generator = projector = fixed = chain = None
+            if isinstance(unit, FusedRotation):
+                chain = unit
+            elif isinstance(unit, FusedConstant):
+                fixed = unit.matrix
+                if len(unit.wires) == 1:
+                    fixed = _on_wire(fixed, unit.wires[0])
+                elif unit.wires == (1, 0):
+                    fixed = _SWAP @ fixed @ _SWAP
+            elif unit.parametric:
+                generator, projector = _generator(unit.name, unit.wires)
+            else:
+                fixed = _fixed_matrix(unit.name, unit.wires)
+            self._generators.append(generator)
+            self._projectors.append(projector)
+            self._fixed.append(fixed)
+            self._chains.append(chain)
+
+    def _batch_shape(self, params: np.ndarray) -> tuple[int, ...]:
+        return params.shape[: params.ndim - len(self.param_shape)]
+
+    def _angle(self, op: Operation, flat: np.ndarray) -> np.ndarray:
+        angle = np.full(flat.shape[:-1], op.offset)
+        for index, coeff in op.terms:
+            angle = angle + coeff * flat[..., index]
+        return angle
+
+    def _unit_matrices(self, params: np.ndarray) -> tuple[list[np.ndarray], list[np.ndarray | None]]:
+        """실행 단위별 (…, 4, 4) 유니터리와, 합친 회전 사슬의 (…, m, 2, 2) 누적곱."""
+        params = np.asarray(params, dtype=float)
+        flat = params.reshape(self._batch_shape(params) + (self.num_params,))
+        matrices: list[np.ndarray] = []
+        factors: list[np.ndarray | None] = []
+        for unit, generator, projector, fixed, chain in zip(
+            self.units, self._generators, self._projectors, self._fixed, self._chains
+        ):
+            if chain is not None:
+                chain_factors = chain.prefixes(chain.factors(flat))
+                matrices.append(_embed(chain_factors[..., -1, :, :], chain.wire))
+                factors.append(chain_factors)
+                continue
+            factors.append(None)
+            if fixed is not None:
+                matrices.append(fixed)
+                continue
+            half = 0.5 * self._angle(unit, flat)[..., None, None]
+            matrices.append(_I4 - projector + np.cos(half) * projector - 1j * np.sin(half) * generator)
+        return matrices, factors
+
+    def matrices(self, params: np.ndarray) -> list[np.ndarray]:
+        """실행 단위(`units`)별 (…, 4, 4) 유니터리를 반환. 앞쪽 축은 파라미터 배치 축이다."""
+        return self._unit_matrices(params)[0]
+
+    @staticmethod
+    def _evolve(states: np.ndarray, matrices: Sequence[np.ndarray]) -> np.ndarray:
+        psi = states
+        for matrix in matrices:
+            psi = psi @ np.swapaxes(matrix, -1, -2)
+        return psi
+
+    @staticmethod
+    def _wire_weight(bra: np.ndarray, psi: np.ndarray, wire: int) -> np.ndarray:
+        """W_ab = Σ conj(λ_a) ψ_b (…, 2, 2). 입력 행과 다른 와이어 축은 합산한다."""
+        bra = np.conj(bra).reshape(bra.shape[:-1] + (2, 2))
+        psi = psi.reshape(psi.shape[:-1] + (2, 2))
+        if wire == 0:
+            return np.einsum("...nac,...nbc->...ab", bra, psi)
+        return np.einsum("...nca,...ncb->...ab", bra, psi)
+
+    def state(self, states: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """초기 상태 (N, 4)를 진화시킨 최종 상태 (…, N, 4)."""
+        psi = self._evolve(states, self.matrices(params))
+        self.executions += psi.size // 4
+        return psi
+
+    def expval(self, states: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """⟨Z0⟩ (…, N)."""
+        psi = self.state(states, params)
+        return (np.abs(psi) ** 2) @ Z0_DIAGONAL
+
+    def expval_and_vjp(
+        self, states: np.ndarray, params: np.ndarray
+    ) -> tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]:
+        """⟨Z0⟩와, cotangent (…, N)를 파라미터 그라디언트로 보내는 pullback을 반환."""
+        params = np.asarray(params, dtype=float)
+        batch_shape = self._batch_shape(params)
+        matrices, factors = self._unit_matrices(params)
+        final = self._evolve(states, matrices)
+        self.executions += final.size // 4
+        expvals = (np.abs(final) ** 2) @ Z0_DIAGONAL
+
+        def pullback(cotangent: np.ndarray) -> np.ndarray:
+            grad = np.zeros(batch_shape + (self.num_params,))
+            psi = final
+            bra = np.asarray(cotangent, dtype=float)[..., None] * (Z0_DIAGONAL * final)
+            for unit, generator, chain, matrix, chain_factors in zip(
+                reversed(self.units),
+                reversed(self._generators),
+                reversed(self._chains),
+                reversed(matrices),
+                reversed(factors),
+            ):
+                adjoint = np.conj(matrix)
+                if generator is not None and unit.terms:
+                    # dU/dθ = -i/2 G U  →  ∂θ = Im⟨λ|G|ψ⟩ (입력 축 합산)
+                    overlap = np.sum(np.conj(bra) * (psi @ generator.T), axis=(-2, -1))
+                    for index, coeff in unit.terms:
+                        grad[..., index] += coeff * overlap.imag
+                psi = psi @ adjoint
+                if chain is not None:
+                    # 사슬은 적용 전 상태 ψ와 적용 후 λ로 2×2 가중치를 만들어 곱의 미분을 계산
+                    chain.backprop(chain_factors, self._wire_weight(bra, psi, chain.wire), grad)
+                bra = bra @ adjoint
+            return grad.reshape(batch_shape + self.param_shape)
+
+        return expvals, pullback
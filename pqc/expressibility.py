@@ -0,0 +1,185 @@
+"""앤사츠 표현력(expressibility)과 Meyer–Wallach 얽힘 능력의 몬테카를로 추정.
+
+- 표현력 (Sim et al., 2019): 같은 입력에 무작위 파라미터 두 벌을 넣은 출력 상태의
+  충실도 F = |⟨ψ_θ|ψ_φ⟩|² 분포를 `EXPRESSIBILITY_BINS`칸 히스토그램으로 모아 Haar 분포
+  P(F) = (d − 1)(1 − F)^(d−2)와의 KL 발산을 잰다. 작을수록 Haar에 가깝다(표현력이 높다).
+- 얽힘 능력: Q = 2(1 − Σ_k Tr ρ_k² / n)의 평균 (ρ_k는 큐비트 k의 축약 밀도 행렬).
+
+두 값 모두 진리표 입력마다 계산해 입력 평균을 낸다. 파라미터는 `_init_params`처럼
+[−π, π)에서 균등하게 뽑고, `METRIC_BATCH`쌍씩 NumPy 엔진의 파라미터 배치 축으로 한 번에
+실행한다. 묶음마다 히스토그램과 Q의 합·제곱합만 누적하므로 메모리는 표본 수와 무관하며,
+신뢰구간 반폭이 tolerance 아래로 내려가거나 max_samples를 다 쓰면 멈춘다. 표현력은
+누적 히스토그램을 다항 분포로 다시 뽑는 부트스트랩으로 히스토그램 KL의 치우침을 빼고 구간을
+구하며, 얽힘 능력의 구간은 정규 근사다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from statistics import NormalDist
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+from pqc.gates import truth_table_inputs
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.model import TwoQubitPQC
+
+EXPRESSIBILITY_BINS = 75
+
+# 한 묶음의 파라미터 쌍 수와 표현력 신뢰구간의 부트스트랩 반복 수
+METRIC_BATCH = 4096
+BOOTSTRAP_ROUNDS = 200
+
+
+@dataclass(frozen=True)
+class AnsatzMetrics:
+    """앤사츠 하나(모델 클래스, num_blocks)의 추정 결과. 구간은 confidence 수준의 (하한, 상한).
+
+    표현력은 치우침을 뺀 값이라 Haar에 아주 가까우면 0보다 조금 작게 나올 수 있다.
+    """
+
+    model: str
+    num_blocks: int
+    samples: int
+    expressibility: float
+    expressibility_interval: tuple[float, float]
+    expressibility_per_input: tuple[float, ...]
+    entangling_capability: float
+    entangling_interval: tuple[float, float]
+    converged: bool
+
+
+def haar_fidelity_probabilities(dimension: int, bins: int = EXPRESSIBILITY_BINS) -> np.ndarray:
+    """Haar 무작위 상태 쌍의 충실도가 [0, 1]을 bins등분한 칸마다 들어갈 확률 (bins,)."""
+    edges = np.linspace(0.0, 1.0, bins + 1)
+    cumulative = 1.0 - (1.0 - edges) ** (dimension - 1)
+    return np.diff(cumulative)
+
+
+def kl_divergence(counts: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """히스토그램 counts (…, bins)의 경험 분포와 reference (bins,) 사이의 KL(P̂ ‖ Q)."""
+    counts = np.asarray(counts, dtype=float)
+    probs = counts / np.sum(counts, axis=-1, keepdims=True)
+    ratio = np.where(probs > 0, probs / reference, 1.0)
+    return np.sum(probs * np.log(ratio), axis=-1)
+
+
+def meyer_wallach(states: np.ndarray, num_wires: int) -> np.ndarray:
+    """상태 (…, 2^n)의 Meyer–Wallach 얽힘 Q (…,)."""
+    psi = np.asarray(states).reshape(states.shape[:-1] + (2,) * num_wires)
+    batch_ndim = psi.ndim - num_wires
+    purity = np.zeros(states.shape[:-1])
+    for wire in range(num_wires):
+        split = np.moveaxis(psi, batch_ndim + wire, -1).reshape(states.shape[:-1] + (-1, 2))
+        reduced = np.einsum("...ka,...kb->...ab", split.conj(), split)
+        purity += np.sum(np.abs(reduced) ** 2, axis=(-2, -1))
+    return 2.0 * (1.0 - purity / num_wires)
+
+
+def measure_ansatz(
+    model: "TwoQubitPQC",
+    max_samples: int = 100_000,
+    min_samples: int = 10_000,
+    tolerance: float = 5e-3,
+    confidence: float = 0.95,
+    batch_size: int = METRIC_BATCH,
+    seed: int = 0,
+) -> AnsatzMetrics:
+    """model 앤사츠의 표현력과 얽힘 능력을 파라미터 쌍 최대 max_samples개로 추정.
+
+    min_samples쌍을 넘긴 뒤 두 신뢰구간 반폭이 모두 tolerance 이하가 되면 멈춘다.
+    쌍 하나는 입력 행마다 회로 두 번이다.
+    """
+    if not 1 <= min_samples <= max_samples:
+        raise ValueError("1 ≤ min_samples ≤ max_samples여야 합니다.")
+    if batch_size < 1 or tolerance <= 0.0 or not 0.0 < confidence < 1.0:
+        raise ValueError("batch_size와 tolerance는 양수, confidence는 0과 1 사이여야 합니다.")
+
+    engine = model._build_engine()
+    inputs = model._engine_initial_states(np.array(truth_table_inputs(model.num_wires), dtype=float))
+    num_inputs, dimension = inputs.shape
+    reference = haar_fidelity_probabilities(dimension)
+    shape = tuple(model.params.shape)
+    rng = np.random.default_rng(seed)
+    z = NormalDist().inv_cdf(0.5 + 0.5 * confidence)
+    tail = 50.0 * (1.0 - confidence)
+
+    counts = np.zeros((num_inputs, EXPRESSIBILITY_BINS), dtype=np.int64)
+    entangling_sum = entangling_squares = 0.0
+    samples = 0
+    converged = False
+    while samples < max_samples:
+        size = min(batch_size, max_samples - samples)
+        params = rng.uniform(-np.pi, np.pi, size=(2, size) + shape)
+        states = engine.state(inputs, params).reshape((2, size, num_inputs, dimension))
+        fidelity = np.abs(np.sum(states[0].conj() * states[1], axis=-1)) ** 2  # (B, N)
+        bins = np.minimum((fidelity * EXPRESSIBILITY_BINS).astype(int), EXPRESSIBILITY_BINS - 1)
+        for row in range(num_inputs):
+            counts[row] += np.bincount(bins[:, row], minlength=EXPRESSIBILITY_BINS)
+        # 파라미터 한 벌의 입력 평균 Q를 관측값 하나로 본다(같은 θ의 입력끼리는 독립이 아니다).
+        entangling = np.mean(meyer_wallach(states.reshape(-1, num_inputs, dimension), model.num_wires), axis=-1)
+        entangling_sum += float(np.sum(entangling))
+        entangling_squares += float(np.sum(entangling**2))
+        samples += size
+
+        # 히스토그램 KL은 양의 치우침(대략 (칸 수 − 1) / 2n)이 있어 부트스트랩으로 치우침을 빼고,
+        # 구간도 같은 치우침을 반영하는 basic bootstrap 구간(2θ̂ − 분위수)을 쓴다.
+        plug_in = kl_divergence(counts, reference)
+        resampled = np.stack(
+            [rng.multinomial(samples, counts[row] / samples, size=BOOTSTRAP_ROUNDS) for row in range(num_inputs)], axis=1
+        )
+        bootstrap = kl_divergence(resampled, reference)  # (R, N)
+        per_input = 2.0 * plug_in - np.mean(bootstrap, axis=0)
+        upper, lower = 2.0 * np.mean(plug_in) - np.percentile(np.mean(bootstrap, axis=-1), [tail, 100.0 - tail])
+        expressibility_interval = (float(lower), float(upper))
+        observations = 2 * samples
+        entangling_mean = entangling_sum / observations
+        variance = max(entangling_squares / observations - entangling_mean**2, 0.0) * observations / max(observations - 1, 1)
+        half_width = z * np.sqrt(variance / observations)
+        if samples >= min_samples:
+            spread = 0.5 * (expressibility_interval[1] - expressibility_interval[0])
+            if spread <= tolerance and half_width <= tolerance:
+                converged = True
+                break
+
+    return AnsatzMetrics(
+        model=type(model).__name__,
+        num_blocks=model.config.num_blocks,
+        samples=samples,
+        expressibility=float(np.mean(per_input)),
+        expressibility_interval=expressibility_interval,
+        expressibility_per_input=tuple(float(value) for value in per_input),
+        entangling_capability=float(entangling_mean),
+        entangling_interval=(float(entangling_mean - half_width), float(entangling_mean + half_width)),
+        converged=converged,
+    )
+
+
+def compare_ansatze(
+    families: Sequence[str] | None = None,
+    num_blocks: Sequence[int] = (1, 2, 3),
+    **kwargs,
+) -> list[AnsatzMetrics]:
+    """계열(basic/entangled/angle) × num_blocks마다 `measure_ansatz`. kwargs는 그대로 넘긴다."""
+    from pqc.parallel import FAMILIES, default_config, model_class
+
+    results = []
+    for family in families or FAMILIES:
+        for blocks in num_blocks:
+            config = replace(default_config(family), num_blocks=blocks)
+            results.append(measure_ansatz(model_class(family)(config), **kwargs))
+    return results
+
+
+def log_metrics(metrics: Sequence[AnsatzMetrics]) -> None:
+    print("\n[앤사츠 표현력 / 얽힘 능력] KL(P_F ‖ P_Haar)는 작을수록, Q는 클수록 좋다.")
+    for item in metrics:
+        low, high = item.expressibility_interval
+        q_low, q_high = item.entangling_interval
+        status = "" if item.converged else " (예산 소진)"
+        print(
+            f"  {item.model:<24} L={item.num_blocks:<2} KL {item.expressibility:.4f} [{low:.4f}, {high:.4f}]"
+            f"  Q {item.entangling_capability:.4f} [{q_low:.4f}, {q_high:.4f}]  {item.samples}쌍{status}"
+        )
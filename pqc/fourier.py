@@ -0,0 +1,301 @@
+"""2-큐비트 PQC의 ⟨Z0⟩를 닫힌 꼴 삼각 다항식으로 컴파일한 대리 모델 (`backend="fourier"`).
+
+학습 게이트 g의 각도를 φ_g라 하면 exp(−iφG/2) (G² = I)의 Pauli 전달 행렬(PTM)은
+A_g + B_g cos φ_g + C_g sin φ_g 이므로, 입력 x의 기대값은
+
+    ⟨Z0⟩_x(θ) = z · Π_g (A_g + B_g cos φ_g + C_g sin φ_g) · r_x
+
+인 삼각 다항식이다(r_x는 인코딩한 입력 상태의 Pauli 벡터, 고정 게이트는 이웃 항에 미리
+곱해 둔다). 계수는 (1, cos φ_g, sin φ_g) 곱 3^K개로 이루어진 푸리에 계수 텐서이며, 위 식은
+그 텐서를 결합 차원 16의 텐서 트레인으로 저장한 것이다(`fourier_coefficients`로 전개할 수 있다).
+얽힘 앤사츠는 K가 수십이라 3^K 전개는 불가능하고, 연속한 게이트 `GROUP_GATES`개씩만 계수
+행렬 3^m개의 코어로 합쳐 둔다. 관측량을 거꾸로 전파한 16차원 벡터 하나로 모든 입력의 기대값이 내적 한 번씩으로 나오고,
+그라디언트도 입력 가중합 벡터 하나를 앞으로 전파해 얻으므로 스텝 비용이 입력 수와 거의
+무관하다. 코어는 (모델 클래스, num_blocks)마다 한 번 만들고, 만들 때 QNode와 비교해 검증한다.
+"""
+
+from __future__ import annotations
+
+from itertools import product
+from typing import TYPE_CHECKING, Callable, Sequence
+
+import numpy as np
+
+from pqc.engine import Operation, gate_matrix
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.model import TwoQubitPQC
+    from pqc.noise import NoiseModel
+
+# exp(−iφG/2)에서 G² = I라 PTM이 cos φ, sin φ의 1차식인 게이트
+_PAULI_ROTATIONS = {"RX", "RY", "RZ", "IsingXX", "IsingYY", "IsingZZ"}
+
+# 2-큐비트 Pauli 기저 P_a = σ_i ⊗ σ_j (a = 4i + j, 0번 와이어가 앞)
+_SINGLE = [
+    np.eye(2, dtype=complex),
+    np.array([[0, 1], [1, 0]], dtype=complex),
+    np.array([[0, -1j], [1j, 0]], dtype=complex),
+    np.array([[1, 0], [0, -1]], dtype=complex),
+]
+_PAULIS = np.array([np.kron(a, b) for a, b in product(_SINGLE, repeat=2)])
+# Z ⊗ I의 기저 인덱스
+_Z0_INDEX = 3 * 4
+
+# QNode 검증에 쓰는 무작위 파라미터 묶음 수와 허용 오차
+_VERIFY_SETS = 3
+_VERIFY_ATOL = 1e-9
+
+# 코어 하나로 묶는 연속 학습 게이트 수 (코어당 계수 행렬 3^m개)
+GROUP_GATES = 2
+
+# `fourier_coefficients`가 전개하는 최대 학습 게이트 수 (3^K개 계수)
+MAX_DENSE_GATES = 12
+
+
+def transfer_matrix(unitary: np.ndarray) -> np.ndarray:
+    """U의 Pauli 전달 행렬 R_ab = ¼ Tr(P_a U P_b U†) (실수 16×16)."""
+    return channel_transfer_matrix([unitary])
+
+
+def channel_transfer_matrix(kraus: Sequence[np.ndarray]) -> np.ndarray:
+    """Kraus 연산자 {K}로 쓴 채널의 Pauli 전달 행렬 R_ab = ¼ Σ Tr(P_a K P_b K†)."""
+    operators = np.asarray(kraus, dtype=complex)
+    conjugated = np.einsum("kij,bjl,kml->bim", operators, _PAULIS, operators.conj())
+    return np.einsum("aji,bij->ab", _PAULIS, conjugated).real / 4.0
+
+
+def _trig_products(factors: np.ndarray) -> np.ndarray:
+    """(…, G, m, 3) 게이트별 인수의 코어별 곱 (…, G, 3^m). 앞 게이트가 느린 축이다."""
+    result = factors[..., 0, :]
+    for k in range(1, factors.shape[-2]):
+        result = (result[..., :, None] * factors[..., None, k, :]).reshape(result.shape[:-1] + (-1,))
+    return result
+
+
+class FourierSurrogate:
+    """`StatevectorEngine`과 같은 호출 규약(expval / expval_and_vjp)의 삼각 다항식 평가기.
+
+    연속한 학습 게이트 `GROUP_GATES`개를 한 코어로 묶어, 코어마다 (1, cos φ, sin φ) 곱
+    3^m개 항의 계수 행렬을 한 번의 행렬곱으로 적용한다.
+
+    noise(`pqc.noise.NoiseModel`)를 주면 게이트마다 채널의 전달 행렬을 곱해 두므로 같은
+    코드가 혼합 상태 시뮬레이터가 된다. 잡음 모델 목록을 주면 코어에 세기 축 S가 붙고
+    expval과 그라디언트 앞에 (S, …) 축이 생긴다.
+    """
+
+    def __init__(
+        self,
+        operations: list[Operation] | tuple[Operation, ...],
+        param_shape: tuple[int, ...],
+        noise: "NoiseModel | Sequence[NoiseModel] | None" = None,
+    ):
+        self.param_shape = tuple(param_shape)
+        self.num_params = int(np.prod(self.param_shape))
+        # 지금까지 평가한 (잡음 세기 × 파라미터 배치 × 입력 행) 수. 프로파일러가 회로 실행 수로 센다.
+        self.executions = 0
+        self.stacked = isinstance(noise, (list, tuple))
+        levels = list(noise) if self.stacked else [noise]
+        self.num_levels = len(levels)
+
+        identity = np.broadcast_to(np.eye(16), (self.num_levels, 16, 16))
+        channels: dict[tuple[int, ...], np.ndarray] = {}
+
+        def channel(wires: tuple[int, ...]) -> np.ndarray:
+            """wires 각각에 게이트 뒤 채널을 넣는 (S, 16, 16) 전달 행렬."""
+            if wires not in channels:
+                matrices = []
+                for level in levels:
+                    matrix = np.eye(16)
+                    if level is not None:
+                        for wire in wires:
+                            matrix = channel_transfer_matrix(level.kraus(wire)) @ matrix
+                    matrices.append(matrix)
+                channels[wires] = np.stack(matrices)
+            return channels[wires]
+
+        gate_cores: list[np.ndarray] = []
+        gates: list[Operation] = []
+        pending = identity
+        for op in operations:
+            if op.parametric and op.terms:
+                if op.name not in _PAULI_ROTATIONS or any(wire not in (0, 1) for wire in op.wires):
+                    raise ValueError(f"푸리에 대리 모델이 지원하지 않는 학습 게이트입니다: {op.name}{op.wires}")
+                zero = transfer_matrix(gate_matrix(op, 0.0))
+                half = transfer_matrix(gate_matrix(op, 0.5 * np.pi))
+                flip = transfer_matrix(gate_matrix(op, np.pi))
+                constant = 0.5 * (zero + flip)
+                # 채널 · (A, B, C) · 앞쪽 고정 게이트 누적, 모양 (S, 3, 16, 16)
+                terms = np.stack([constant, 0.5 * (zero - flip), half - constant])
+                gate_cores.append(channel(op.wires)[:, None] @ terms[None] @ pending[:, None])
+                gates.append(op)
+                pending = identity
+            else:
+                angle = op.offset if op.parametric else 0.0
+                pending = channel(op.wires) @ transfer_matrix(gate_matrix(op, angle)) @ pending
+        if not gates:
+            raise ValueError("학습 게이트가 없는 회로는 푸리에 대리 모델로 만들 수 없습니다.")
+        readout = np.stack(
+            [np.eye(16) if level is None else channel_transfer_matrix(level.readout_kraus()) for level in levels]
+        )
+        self.observable = (readout @ pending)[:, _Z0_INDEX]  # z · 판독 · (마지막 고정 게이트들), (S, 16)
+        self.num_gates = len(gates)
+        # φ = offsets + flat_params @ angle_map.T
+        self.offsets = np.array([op.offset for op in gates])
+        self.angle_map = np.zeros((self.num_gates, self.num_params))
+        for row, op in enumerate(gates):
+            for index, coeff in op.terms:
+                self.angle_map[row, index] += coeff
+
+        # 게이트 수를 GROUP_GATES의 배수로 맞추는 항등 게이트 (A, B, C) = (I, 0, 0), 각도 0
+        padding = -self.num_gates % GROUP_GATES
+        blank = np.stack([np.eye(16), np.zeros((16, 16)), np.zeros((16, 16))])
+        gate_cores.extend([np.broadcast_to(blank, (self.num_levels, 3, 16, 16))] * padding)
+        self.offsets = np.concatenate([self.offsets, np.zeros(padding)])
+        self.angle_map = np.vstack([self.angle_map, np.zeros((padding, self.num_params))])
+        self.num_groups = len(gate_cores) // GROUP_GATES
+
+        # 코어 c: 게이트 c·m … (c+1)·m − 1의 계수 (S, 3^m, 16, 16). 특징 인덱스는 앞 게이트가 느린 축이다.
+        cores = []
+        for first in range(0, len(gate_cores), GROUP_GATES):
+            core = gate_cores[first]
+            for member in gate_cores[first + 1 : first + GROUP_GATES]:
+                core = np.einsum("sjab,sibc->sijac", member, core).reshape(self.num_levels, -1, 16, 16)
+            cores.append(core)
+        self.cores = np.stack(cores)  # (G, S, 3^m, 16, 16)
+        # 관측량(행벡터)과 상태(열벡터) 쪽 전파용으로 미리 펼친 (G, S, 16, 3^m·16) 행렬
+        self._heisenberg_cores = self.cores.transpose(0, 1, 3, 2, 4).reshape(self.num_groups, self.num_levels, 16, -1)
+        self._schrodinger_cores = self.cores.transpose(0, 1, 4, 2, 3).reshape(self.num_groups, self.num_levels, 16, -1)
+        # (N, 16) 외적 conj(ψ_i)ψ_j → Pauli 기대값
+        self._pauli_map = _PAULIS.reshape(16, 16).T
+
+    def _angles(self, params: np.ndarray) -> tuple[tuple[int, ...], np.ndarray]:
+        params = np.asarray(params, dtype=float)
+        batch_shape = params.shape[: params.ndim - len(self.param_shape)]
+        flat = params.reshape(batch_shape + (self.num_params,))
+        return batch_shape, self.offsets + flat @ self.angle_map.T
+
+    def _pauli_vectors(self, states: np.ndarray) -> np.ndarray:
+        states = np.asarray(states, dtype=complex)
+        outer = (states.conj()[:, :, None] * states[:, None, :]).reshape(states.shape[0], 16)
+        return (outer @ self._pauli_map).real
+
+    def _factors(self, angles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """각도 (…, K)의 게이트별 (1, cos, sin)과 그 도함수 (0, −sin, cos), 모양 (…, G, m, 3)."""
+        cos, sin = np.cos(angles), np.sin(angles)
+        values = np.stack([np.ones_like(cos), cos, sin], axis=-1)
+        slopes = np.stack([np.zeros_like(cos), -sin, cos], axis=-1)
+        shape = angles.shape[:-1] + (self.num_groups, GROUP_GATES, 3)
+        return values.reshape(shape), slopes.reshape(shape)
+
+    def _core(self, cores: np.ndarray, index: int, batch_ndim: int) -> np.ndarray:
+        """코어 index의 (S, 1, …, 1, 16, 3^m·16). 파라미터 배치 축으로 브로드캐스트된다."""
+        core = cores[index]
+        return core.reshape((self.num_levels,) + (1,) * batch_ndim + core.shape[1:])
+
+    def _heisenberg(self, features: np.ndarray) -> np.ndarray:
+        """관측량을 마지막 코어부터 거꾸로 전파한 벡터들 (S, …, G + 1, 16).
+        [c]는 코어 c 뒤(출력 쪽) 전체를 담고, [G]는 입력 쪽까지 전파한 관측량이다."""
+        batch_ndim = features.ndim - 2
+        after = np.empty((self.num_levels,) + features.shape[:-2] + (self.num_groups + 1, 16))
+        left = np.broadcast_to(
+            self.observable.reshape((self.num_levels,) + (1,) * batch_ndim + (16,)), after.shape[:-2] + (16,)
+        )
+        for index in range(self.num_groups - 1, -1, -1):
+            after[..., index, :] = left
+            core = self._core(self._heisenberg_cores, index, batch_ndim)
+            terms = (left[..., None, :] @ core)[..., 0, :].reshape(left.shape[:-1] + (-1, 16))
+            left = (features[..., index, None, :] @ terms)[..., 0, :]
+        after[..., -1, :] = left
+        return after
+
+    def _unstack(self, array: np.ndarray) -> np.ndarray:
+        return array if self.stacked else array[0]
+
+    def expval(self, states: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """⟨Z0⟩ (…, N). 잡음 모델 목록이면 (S, …, N)."""
+        batch_shape, angles = self._angles(params)
+        features = _trig_products(self._factors(angles)[0])
+        inputs = self._pauli_vectors(states)
+        self.executions += self.num_levels * int(np.prod(batch_shape, dtype=int)) * inputs.shape[0]
+        return self._unstack(self._heisenberg(features)[..., -1, :] @ inputs.T)
+
+    def expval_and_vjp(
+        self, states: np.ndarray, params: np.ndarray
+    ) -> tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]:
+        """⟨Z0⟩와, cotangent (…, N)를 파라미터 그라디언트로 보내는 pullback을 반환.
+        잡음 모델 목록이면 둘 다 앞에 세기 축 (S, …)이 붙는다."""
+        batch_shape, angles = self._angles(params)
+        values, slopes = self._factors(angles)
+        features = _trig_products(values)
+        after = self._heisenberg(features)
+        inputs = self._pauli_vectors(states)
+        self.executions += self.num_levels * int(np.prod(batch_shape, dtype=int)) * inputs.shape[0]
+        expvals = after[..., -1, :] @ inputs.T
+
+        def pullback(cotangent: np.ndarray) -> np.ndarray:
+            cotangent = np.asarray(cotangent, dtype=float)
+            if not self.stacked:
+                cotangent = cotangent[None]
+            vector = cotangent @ inputs  # Σ_x w_x r_x (S, …, 16)
+            # weights[…, c, f] = (코어 c 뒤 관측량) · C_cf · (코어 c 앞까지 전파한 입력 가중합)
+            weights = np.empty(after.shape[:-2] + features.shape[-2:])
+            for index in range(self.num_groups):
+                core = self._core(self._schrodinger_cores, index, len(batch_shape))
+                terms = (vector[..., None, :] @ core)[..., 0, :].reshape(vector.shape[:-1] + (-1, 16))
+                weights[..., index, :] = (terms @ after[..., index, :, None])[..., 0]
+                vector = (features[..., index, None, :] @ terms)[..., 0, :]
+            # 게이트 k의 도함수: 특징 곱에서 k번째 인수만 (0, −sin, cos)로 바꾼다.
+            dangles = np.empty(weights.shape[:-1] + (GROUP_GATES,))
+            for k in range(GROUP_GATES):
+                swapped = values.copy()
+                swapped[..., k, :] = slopes[..., k, :]
+                dangles[..., k] = np.sum(weights * _trig_products(swapped), axis=-1)
+            dangles = dangles.reshape(dangles.shape[:-2] + (-1,))
+            grad = (dangles @ self.angle_map).reshape((self.num_levels,) + batch_shape + self.param_shape)
+            return self._unstack(grad)
+
+        return self._unstack(expvals), pullback
+
+    def fourier_coefficients(self, state: np.ndarray) -> np.ndarray:
+        """입력 상태 하나 (4,)의 푸리에 계수 텐서 (3,)*K. 축 g의 0/1/2는 1/cos φ_g/sin φ_g 항이다.
+        잡음 모델 목록이면 (S, 3, …, 3)."""
+        if self.num_gates > MAX_DENSE_GATES:
+            raise ValueError(f"학습 게이트가 {MAX_DENSE_GATES}개를 넘으면 계수 텐서(3^K)를 전개하지 않습니다.")
+        vector = self._pauli_vectors(np.asarray(state)[None])[0]  # (16,)
+        tensor = np.broadcast_to(vector, (self.num_levels, 16))
+        # 입력 쪽 코어부터 곱해 가며 (S, (3,)*g, 16) 텐서를 키운다.
+        for core in self.cores:
+            tensor = np.einsum("sfab,s...b->s...fa", core, tensor)
+        tensor = np.einsum("s...a,sa->s...", tensor, self.observable)
+        tensor = tensor.reshape((self.num_levels,) + (3,) * len(self.offsets))
+        # 패딩한 항등 게이트 축은 1 항(인덱스 0)만 남긴다.
+        return self._unstack(tensor[(Ellipsis,) + (0,) * (len(self.offsets) - self.num_gates)])
+
+
+_SURROGATES: dict[tuple[type, int, "NoiseModel | None"], FourierSurrogate] = {}
+
+
+def fourier_surrogate(model: "TwoQubitPQC") -> FourierSurrogate:
+    """model 계열·num_blocks·잡음 모델의 대리 모델. 처음 만들 때 QNode와 진리표 입력에서 비교한다."""
+    if model.num_wires != 2:
+        raise ValueError("푸리에 대리 모델은 2-큐비트 모델만 지원합니다.")
+    key = (type(model), model.config.num_blocks, model.config.noise)
+    if key in _SURROGATES:
+        return _SURROGATES[key]
+    surrogate = FourierSurrogate(model._engine_operations(), tuple(model.params.shape), noise=model.config.noise)
+
+    from pqc.gates import truth_table_inputs
+
+    import pennylane.numpy as qnp
+
+    features = np.array(truth_table_inputs(), dtype=float)
+    probes = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(_VERIFY_SETS,) + tuple(model.params.shape))
+    expected = np.array(
+        [model.qnode(qnp.array(features, requires_grad=False), qnp.array(probe)) for probe in probes], dtype=float
+    )
+    actual = surrogate.expval(model._engine_initial_states(features), probes)
+    if not np.allclose(actual, expected, atol=_VERIFY_ATOL):
+        raise ValueError(f"푸리에 대리 모델이 QNode와 다릅니다 (최대 차이 {np.max(np.abs(actual - expected)):.3g}).")
+    surrogate.executions = 0
+    _SURROGATES[key] = surrogate
+    return surrogate
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from enum import Enum
 from itertools import product
-from typing import Callable
+from typing import Callable, Iterator
 
+import numpy as np
 import pennylane.numpy as qnp
 
 
@@ -37,6 +38,33 @@ def truth_table_inputs(num_qubits: int = 2) -> list[tuple[int, ...]]:
     return list(product((0, 1), repeat=num_qubits))
 
 
+def truth_table_batches(
+    num_inputs: int,
+    batch_size: int,
+    seed: int | None = None,
+) -> Iterator[np.ndarray]:
+    """2^num_inputs개 입력 조합을 (B, num_inputs) 비트 배열 묶음으로 차례로 생성.
+
+    행 번호의 비트를 그대로 풀어 쓰므로 `truth_table_inputs`와 같은 순서(0번 입력이
+    최상위 비트)이며, 한 번에 batch_size 행만 메모리에 둔다. seed를 주면 행 순서를
+    임의의 아핀 순열 i ↦ (a·i + c) mod 2^n (a는 홀수)으로 섞어, 전체 순열을
+    만들지 않고도 매 묶음에 진리표 전역의 행이 섞여 들어가게 한다.
+    """
+    if num_inputs < 1 or batch_size < 1:
+        raise ValueError("num_inputs와 batch_size는 1 이상이어야 합니다.")
+    num_rows = 1 << num_inputs
+    multiplier, shift = 1, 0
+    if seed is not None:
+        rng = np.random.default_rng(seed)
+        multiplier = int(rng.integers(0, num_rows)) | 1
+        shift = int(rng.integers(0, num_rows))
+    shifts = np.arange(num_inputs - 1, -1, -1, dtype=np.int64)
+    for start in range(0, num_rows, batch_size):
+        rows = np.arange(start, min(start + batch_size, num_rows), dtype=np.int64)
+        rows = (multiplier * rows + shift) & (num_rows - 1)
+        yield ((rows[:, None] >> shifts) & 1).astype(np.int8)
+
+
 def build_dataset(gate: LogicGate) -> list[tuple[qnp.ndarray, float]]:
     """해당 게이트의 진리표를 양자 회로 학습용 데이터로 변환."""
 
@@ -0,0 +1,372 @@
+"""실험 명세(JSON/TOML)를 작업 큐로 펼쳐 asyncio 스케줄러로 실행 (`python -m pqc`).
+
+명세 예 (TOML)::
+
+    output = "runs/nightly"
+    concurrency = 4        # 동시에 학습하는 작업(워커 프로세스) 수
+    timeout = 900          # 작업 하나의 제한 시간(초). 넘기면 워커를 죽이고 timeout으로 기록
+    repeats = 1            # 실험 항목에 repeats가 없을 때의 반복 수
+
+    [[experiments]]
+    families = ["basic", "entangled"]   # 또는 family = "basic". 없으면 모든 계열
+    gates = ["AND", "XOR"]              # 없으면 모든 게이트
+    repeats = 3                         # 반복 r은 `derive_seed`로 시드를 바꾼다
+    config = { max_steps = 200, backend = "numpy" }
+    grid = { learning_rate = [0.1, 0.2] }   # 설정 격자 (`expand_search_space`)
+
+config는 계열 기본 설정(`default_config`)에 덮어쓰고, noise는 `NoiseModel` 필드 표로 준다.
+
+작업마다 워커 프로세스가 `train_*_gate`를 output/cache의 `ResultCache`와 함께 호출하고,
+부모는 끝난 작업을 output/results.jsonl에 한 줄씩 덧붙인다. 작업 ID는 (계열, 게이트, 설정
+전체, 반복)의 해시라서, 같은 명세로 다시 실행하면 ok로 기록된 작업은 건너뛰고 실패·시간
+초과 작업만 다시 돌린다(시간 초과로 끊긴 학습은 캐시 체크포인트에서 이어 간다). 마지막에
+명세의 끝난 작업 전체를 output/archive에 열 단위 보관소(`save_results`)로 쓴다.
+
+워커는 concurrency개의 오래 사는 하위 프로세스로, 무거운 import는 한 번만 하고 작업을 한 줄짜리
+JSON으로 주고받는다. 제한 시간을 넘긴 워커만 죽이고 다음 작업 때 새로 띄운다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import signal
+import sys
+import time
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
+
+from pqc.gates import LogicGate
+from pqc.model import PQCConfig
+from pqc.noise import NoiseModel
+from pqc.parallel import FAMILIES, ExperimentTask, default_config, model_class, train_function
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    tomllib = None
+
+JOBS_FORMAT = 1
+
+# 작업 하나가 끝날 때마다 받는 진행 이벤트: (끝낸 작업 수, 실행할 작업 수, 결과 기록)
+JobCallback = Callable[[int, int, dict[str, Any]], None]
+
+
+@dataclass(frozen=True)
+class ExperimentSpec:
+    """펼친 명세. 작업 순서는 실험 항목 → 계열 → 설정 격자 → 게이트 → 반복이다."""
+
+    jobs: tuple[ExperimentTask, ...]
+    output: Path
+    concurrency: int
+    timeout: float | None
+
+
+def load_spec(path: str | Path) -> dict[str, Any]:
+    """확장자(.json / .toml)에 따라 명세 파일을 읽는다."""
+    path = Path(path)
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise ValueError("TOML 명세는 Python 3.11 이상(tomllib)이 필요합니다. JSON을 쓰세요.")
+        with open(path, "rb") as handle:
+            return tomllib.load(handle)
+    if path.suffix == ".json":
+        return json.loads(path.read_text(encoding="utf-8"))
+    raise ValueError(f"명세는 .json 또는 .toml 파일이어야 합니다: {path}")
+
+
+def config_from_dict(family: str, values: Mapping[str, Any]) -> PQCConfig:
+    """계열 기본 설정에 values를 덮어쓴 설정. 설정에 없는 필드 이름은 ValueError로 거부한다."""
+    base = default_config(family)
+    known = {item.name for item in fields(base)}
+    unknown = sorted(set(values) - known)
+    if unknown:
+        raise ValueError(f"{type(base).__name__}에 없는 필드입니다: {', '.join(unknown)}")
+    values = dict(values)
+    if "noise" in values:
+        values["noise"] = _noise_model(values["noise"])
+    return replace(base, **values)
+
+
+def _noise_model(value: Any) -> NoiseModel | None:
+    """명세의 noise 표({depolarizing, amplitude_damping, readout})를 `NoiseModel`로."""
+    return NoiseModel(**value) if isinstance(value, Mapping) else value
+
+
+def _as_list(entry: Mapping[str, Any], plural: str, singular: str, default: Sequence[Any]) -> list[Any]:
+    if plural in entry and singular in entry:
+        raise ValueError(f"{plural}와 {singular}는 함께 쓸 수 없습니다.")
+    if singular in entry:
+        return [entry[singular]]
+    return list(entry.get(plural, default))
+
+
+def _parse_gate(name: str) -> LogicGate:
+    try:
+        return LogicGate[str(name).upper()]
+    except KeyError:
+        raise ValueError(f"알 수 없는 게이트입니다: {name} ({'/'.join(gate.value for gate in LogicGate)})") from None
+
+
+def expand_spec(
+    spec: Mapping[str, Any],
+    output: str | Path | None = None,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+) -> ExperimentSpec:
+    """명세를 작업 목록으로 펼친다. 인자로 준 output/concurrency/timeout이 명세 값보다 우선한다.
+
+    같은 작업(계열·게이트·설정·반복이 모두 같은 것)이 여러 번 나오면 한 번만 넣는다.
+    """
+    from pqc.sweep import expand_search_space
+
+    known = {"output", "concurrency", "timeout", "repeats", "experiments"}
+    unknown = sorted(set(spec) - known)
+    if unknown:
+        raise ValueError(f"명세에 없는 항목입니다: {', '.join(unknown)}")
+    experiments = spec.get("experiments")
+    if not experiments:
+        raise ValueError("명세에 experiments가 하나 이상 있어야 합니다.")
+    default_repeats = int(spec.get("repeats", 1))
+
+    jobs: dict[str, ExperimentTask] = {}
+    for entry in experiments:
+        extra = sorted(set(entry) - {"family", "families", "gates", "gate", "repeats", "config", "grid"})
+        if extra:
+            raise ValueError(f"실험 항목에 없는 키입니다: {', '.join(extra)}")
+        repeats = int(entry.get("repeats", default_repeats))
+        if repeats < 1:
+            raise ValueError("repeats는 1 이상이어야 합니다.")
+        gates = [_parse_gate(name) for name in _as_list(entry, "gates", "gate", [gate.value for gate in LogicGate])]
+        for family in _as_list(entry, "families", "family", FAMILIES):
+            base = config_from_dict(family, entry.get("config", {}))
+            grid = dict(entry.get("grid") or {})
+            if "noise" in grid:
+                grid["noise"] = [_noise_model(value) for value in grid["noise"]]
+            for config in expand_search_space(base, grid) if grid else [base]:
+                for gate in gates:
+                    for repeat in range(repeats):
+                        task = ExperimentTask(family, gate, config, repeat)
+                        jobs.setdefault(job_id(task), task)
+
+    concurrency = int(concurrency or spec.get("concurrency") or os.cpu_count() or 1)
+    timeout = timeout if timeout is not None else spec.get("timeout")
+    if concurrency < 1:
+        raise ValueError("concurrency는 1 이상이어야 합니다.")
+    if timeout is not None and float(timeout) <= 0:
+        raise ValueError("timeout은 양수여야 합니다.")
+    return ExperimentSpec(
+        jobs=tuple(jobs.values()),
+        output=Path(output or spec.get("output") or "runs"),
+        concurrency=concurrency,
+        timeout=None if timeout is None else float(timeout),
+    )
+
+
+def _task_payload(task: ExperimentTask) -> dict[str, Any]:
+    return {"family": task.family, "gate": task.gate.value, "config": asdict(task.config), "repeat": task.repeat}
+
+
+def job_id(task: ExperimentTask) -> str:
+    """(계열, 게이트, 설정 전체, 반복)의 해시. 다시 실행할 때 끝난 작업을 알아보는 데 쓴다."""
+    encoded = json.dumps(_task_payload(task), sort_keys=True, default=repr).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def read_records(output: str | Path) -> dict[str, dict[str, Any]]:
+    """output/results.jsonl의 작업별 마지막 기록. 중간에 끊겨 깨진 마지막 줄은 무시한다."""
+    path = Path(output) / "results.jsonl"
+    records: dict[str, dict[str, Any]] = {}
+    if not path.exists():
+        return records
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("format") == JOBS_FORMAT:
+                records[record["id"]] = record
+    return records
+
+
+def _train(message: dict[str, Any], cache: Any) -> dict[str, Any]:
+    family, gate = message["family"], LogicGate(message["gate"])
+    config = config_from_dict(family, message["config"])
+    task = ExperimentTask(family, gate, config, message["repeat"])
+    seeded = task.seeded_config()
+    result = train_function(family)(gate, seeded, cache=cache)
+    return {
+        "status": "ok",
+        "seed": seeded.seed,
+        "final_loss": result.final_loss,
+        "accuracy": result.accuracy,
+        "converged": result.converged,
+        "num_steps": result.num_steps,
+        "total_shots": result.total_shots,
+        "cache_key": cache.key(model_class(family), gate, seeded),
+    }
+
+
+def _worker_main(cache_root: str, max_entries: int) -> None:
+    """stdin으로 작업 한 줄을 받아 학습하고 결과 한 줄을 돌려주는 워커 루프.
+
+    학습 중 print는 stderr로 돌려 stdout(응답 통로)을 더럽히지 않는다. Ctrl+C는 부모가 받아
+    워커를 정리하므로 워커 자신은 무시한다.
+    """
+    from pqc.cache import ResultCache
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    cache = ResultCache(cache_root, max_entries=max_entries)
+
+    def reply(payload: dict[str, Any]) -> None:
+        replies.write(json.dumps(payload) + "\n")
+        replies.flush()
+
+    reply({"status": "ready"})
+    for line in sys.stdin:
+        try:
+            payload = _train(json.loads(line), cache)
+        except Exception as error:  # 작업 하나의 실패로 워커를 죽이지 않는다
+            payload = {"status": "error", "error": f"{type(error).__name__}: {error}"}
+        reply(payload)
+
+
+class _Worker:
+    """오래 사는 워커 하위 프로세스 하나. 시간 초과나 비정상 종료 뒤에는 다음 작업 때 새로 띄운다."""
+
+    def __init__(self, cache_root: Path, max_entries: int):
+        self.args = ("-m", "pqc.jobs", str(cache_root), str(max_entries))
+        self.process: asyncio.subprocess.Process | None = None
+
+    async def _start(self) -> asyncio.subprocess.Process:
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, *self.args, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE
+        )
+        # import 시간은 작업 제한 시간에 넣지 않는다.
+        if json.loads(await process.stdout.readline() or b"{}").get("status") != "ready":
+            await self.close()
+            raise RuntimeError("워커 프로세스를 시작하지 못했습니다.")
+        return process
+
+    async def run(self, message: dict[str, Any], timeout: float | None) -> dict[str, Any]:
+        """작업 하나의 응답에 걸린 시간(elapsed, 워커 시작 시간 제외)을 더해 돌려준다."""
+        if self.process is None or self.process.returncode is not None:
+            self.process = await self._start()
+        start = time.perf_counter()
+        outcome = await self._exchange(message, timeout)
+        outcome["elapsed"] = round(time.perf_counter() - start, 3)
+        return outcome
+
+    async def _exchange(self, message: dict[str, Any], timeout: float | None) -> dict[str, Any]:
+        try:
+            self.process.stdin.write((json.dumps(message) + "\n").encode())
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            await self.close()
+            return {"status": "error", "error": "워커 프로세스가 비정상 종료했습니다."}
+        try:
+            line = await asyncio.wait_for(self.process.stdout.readline(), timeout)
+        except asyncio.TimeoutError:
+            await self.close()
+            return {"status": "timeout", "error": f"제한 시간 {timeout}초를 넘겼습니다."}
+        if not line:
+            await self.close()
+            return {"status": "error", "error": "워커 프로세스가 비정상 종료했습니다."}
+        return json.loads(line)
+
+    async def close(self) -> None:
+        if self.process is not None:
+            if self.process.returncode is None:
+                self.process.kill()
+            # communicate는 파이프까지 닫아, 이벤트 루프가 끝난 뒤 transport가 정리되지 않게 한다.
+            await self.process.communicate()
+        self.process = None
+
+
+async def _run_queue(
+    pending: Sequence[ExperimentTask],
+    spec: ExperimentSpec,
+    results: Any,
+    callback: JobCallback | None,
+) -> None:
+    queue: asyncio.Queue[ExperimentTask] = asyncio.Queue()
+    for task in pending:
+        queue.put_nowait(task)
+    finished = 0
+    max_entries = max(1024, 2 * len(spec.jobs))
+
+    async def consume() -> None:
+        nonlocal finished
+        worker = _Worker(spec.output / "cache", max_entries)
+        try:
+            while not queue.empty():
+                task = queue.get_nowait()
+                payload = _task_payload(task)
+                outcome = await worker.run(payload, spec.timeout)
+                record = {
+                    "format": JOBS_FORMAT,
+                    "id": job_id(task),
+                    "family": task.family,
+                    "gate": task.gate.value,
+                    "repeat": task.repeat,
+                    **outcome,
+                    "config": payload["config"],
+                }
+                # 기록은 이벤트 루프 스레드 하나에서만 쓰므로 줄이 섞이지 않는다.
+                results.write(json.dumps(record, ensure_ascii=False) + "\n")
+                results.flush()
+                finished += 1
+                if callback is not None:
+                    callback(finished, len(pending), record)
+        finally:
+            await worker.close()
+
+    await asyncio.gather(*(consume() for _ in range(min(spec.concurrency, len(pending)))))
+
+
+def _ends_mid_line(path: Path) -> bool:
+    with open(path, "rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        if not handle.tell():
+            return False
+        handle.seek(-1, os.SEEK_END)
+        return handle.read(1) != b"\n"
+
+
+def run_jobs(spec: ExperimentSpec, callback: JobCallback | None = None) -> dict[str, dict[str, Any]]:
+    """spec의 작업 중 ok 기록이 없는 것을 실행하고, 명세 작업 전체의 작업 ID → 마지막 기록을 반환.
+
+    끝나면 명세의 ok 작업 결과 전체를 output/archive에 다시 쓴다.
+    """
+    from pqc.cache import ResultCache
+    from pqc.results import save_results
+
+    spec.output.mkdir(parents=True, exist_ok=True)
+    previous = read_records(spec.output)
+    pending = [task for task in spec.jobs if previous.get(job_id(task), {}).get("status") != "ok"]
+    if pending:
+        path = spec.output / "results.jsonl"
+        with open(path, "a", encoding="utf-8") as results:
+            # 이전 실행이 줄 중간에서 끊겼으면 새 기록이 그 줄에 붙지 않도록 줄을 바꾼다.
+            if _ends_mid_line(path):
+                results.write("\n")
+            asyncio.run(_run_queue(pending, spec, results, callback))
+
+    records = read_records(spec.output)
+    ordered = {job_id(task): records[job_id(task)] for task in spec.jobs if job_id(task) in records}
+    cache = ResultCache(spec.output / "cache", max_entries=max(1024, 2 * len(spec.jobs)))
+    finished = [cache.get(record["cache_key"]) for record in ordered.values() if record["status"] == "ok"]
+    finished = [result for result in finished if result is not None]
+    if finished:
+        save_results(spec.output / "archive", finished)
+    return ordered
+
+
+if __name__ == "__main__":
+    _worker_main(sys.argv[1], int(sys.argv[2]))
@@ -0,0 +1,225 @@
+"""학습한 파라미터 주변의 손실 지형 스캔.
+
+중심 θ₀와 방향 d₁(, d₂)에 대해 격자 점 θ₀ + a·d₁ (+ b·d₂)의 손실을 계산한다. 방향은
+파라미터 축(`axis_directions`), 서로 직교하는 무작위 방향(`random_directions`), 헤시안
+고유벡터(`hessian_directions`) 중에서 고른다.
+
+격자 점은 `LANDSCAPE_BATCH`개씩 파라미터 배치 축으로 묶어 NumPy 엔진(`_analytic_engine`)으로
+한 번에 평가하므로, 백엔드나 shots와 상관없이 해석적 손실(잡음 모델이 있으면 잡음 있는 손실)을
+잰다. 값은 출력 디렉터리의 `values.npy`(memory-map)에 묶음마다 바로 쓰고 `progress.json`에
+끝낸 점 수를 기록하므로, 1000×1000 격자도 격자 전체를 메모리에 올리지 않고, 중단된 스캔은
+같은 설정으로 다시 부르면 이어서 계산한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Sequence
+
+import numpy as np
+import pennylane.numpy as qnp
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.model import TwoQubitPQC
+
+LANDSCAPE_FORMAT = 1
+
+# 한 번에 평가하는 격자 점 수
+LANDSCAPE_BATCH = 4096
+
+# 헤시안 중앙 차분 간격 (해석적 그라디언트의 차분)
+HESSIAN_EPSILON = 1e-4
+
+# 스캔 콜백: (끝낸 점 수, 전체 점 수) → True면 스캔 중단 (다시 부르면 이어서 계산)
+ScanCallback = Callable[[int, int], "bool | None"]
+
+
+@dataclass
+class LandscapeScan:
+    """스캔 결과. values는 (len(axes[0])[, len(axes[1])]) memory-map이며 끝나지 않은 점은 NaN이다."""
+
+    path: Path
+    center: np.ndarray
+    directions: np.ndarray
+    axes: tuple[np.ndarray, ...]
+    values: np.ndarray
+    completed: int
+
+    @property
+    def total(self) -> int:
+        return int(self.values.size)
+
+    @property
+    def done(self) -> bool:
+        return self.completed >= self.total
+
+    def minimum(self) -> tuple[float, tuple[float, ...]]:
+        """끝낸 점 중 최소 손실과 그 격자 좌표."""
+        flat = np.asarray(self.values).reshape(-1)[: self.completed]
+        if not flat.size:
+            raise ValueError("아직 평가한 격자 점이 없습니다.")
+        index = np.unravel_index(int(np.argmin(flat)), self.values.shape)
+        return float(flat.min()), tuple(float(axis[i]) for axis, i in zip(self.axes, index))
+
+
+def axis_directions(params: np.ndarray, indices: Sequence[int]) -> np.ndarray:
+    """params.flat[index] 하나만 움직이는 단위 방향들 (len(indices), *params.shape)."""
+    params = np.asarray(params, dtype=float)
+    directions = np.zeros((len(indices), params.size))
+    for row, index in enumerate(indices):
+        if not 0 <= index < params.size:
+            raise ValueError(f"파라미터 인덱스 범위를 벗어났습니다: {index}")
+        directions[row, index] = 1.0
+    return directions.reshape((len(indices),) + params.shape)
+
+
+def random_directions(params: np.ndarray, count: int = 2, seed: int = 0) -> np.ndarray:
+    """서로 직교하는 무작위 단위 방향들 (count, *params.shape). 각도라 크기 정규화 없이 라디안 단위로 둔다."""
+    params = np.asarray(params, dtype=float)
+    if not 1 <= count <= params.size:
+        raise ValueError(f"count는 1 이상 {params.size} 이하여야 합니다.")
+    gaussian = np.random.default_rng(seed).normal(size=(params.size, count))
+    orthonormal, _ = np.linalg.qr(gaussian)
+    return orthonormal.T.reshape((count,) + params.shape)
+
+
+def hessian(
+    model: "TwoQubitPQC",
+    dataset: list[tuple[qnp.ndarray, float]],
+    params: np.ndarray | None = None,
+    epsilon: float = HESSIAN_EPSILON,
+) -> np.ndarray:
+    """손실 헤시안 (P, P). 해석적 그라디언트를 ±epsilon 이동한 2P개 점에서 한 번에 계산해 중앙 차분한다."""
+    params = np.asarray(model.params if params is None else params, dtype=float)
+    features, targets = model._stack_dataset(dataset)
+    engine = model._analytic_engine()
+    size = params.size
+    shifts = np.concatenate([np.eye(size), -np.eye(size)]) * epsilon
+    batch = params.reshape(1, -1) + shifts
+    expvals, pullback = engine.expval_and_vjp(
+        model._engine_initial_states(np.asarray(features, dtype=float)), batch.reshape((2 * size,) + params.shape)
+    )
+    residual = model._expval_to_prob(expvals) - np.asarray(targets, dtype=float)
+    grads = pullback(-residual / residual.shape[-1]).reshape(2 * size, size)
+    matrix = (grads[:size] - grads[size:]) / (2.0 * epsilon)
+    return 0.5 * (matrix + matrix.T)
+
+
+def hessian_directions(
+    model: "TwoQubitPQC",
+    dataset: list[tuple[qnp.ndarray, float]],
+    params: np.ndarray | None = None,
+    count: int = 2,
+) -> tuple[np.ndarray, np.ndarray]:
+    """|고유값|이 큰 순서로 헤시안 고유값 (count,)과 고유벡터 방향 (count, *params.shape)."""
+    params = np.asarray(model.params if params is None else params, dtype=float)
+    if not 1 <= count <= params.size:
+        raise ValueError(f"count는 1 이상 {params.size} 이하여야 합니다.")
+    eigenvalues, eigenvectors = np.linalg.eigh(hessian(model, dataset, params))
+    order = np.argsort(-np.abs(eigenvalues))[:count]
+    return eigenvalues[order], eigenvectors[:, order].T.reshape((count,) + params.shape)
+
+
+def _scan_fingerprint(
+    model: "TwoQubitPQC", targets: np.ndarray, center: np.ndarray, directions: np.ndarray, axes: Sequence[np.ndarray]
+) -> str:
+    digest = hashlib.sha256(model._fingerprint(targets).encode())
+    for array in (center, directions, *axes):
+        digest.update(np.ascontiguousarray(array, dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def _write_progress(path: Path, fingerprint: str, completed: int, total: int) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    payload = {"format": LANDSCAPE_FORMAT, "fingerprint": fingerprint, "completed": completed, "total": total}
+    tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def scan_landscape(
+    model: "TwoQubitPQC",
+    dataset: list[tuple[qnp.ndarray, float]],
+    directions: np.ndarray,
+    axes: Sequence[np.ndarray],
+    path: str | Path,
+    params: np.ndarray | None = None,
+    batch_size: int = LANDSCAPE_BATCH,
+    callback: ScanCallback | None = None,
+) -> LandscapeScan:
+    """params(기본 model.params) 주변 1D/2D 손실 지형을 path 디렉터리에 스캔한다.
+
+    directions는 (D, *params.shape), axes는 방향별 계수 격자 D개(D = 1 또는 2)다. path에
+    같은 모델·설정·데이터셋·중심·방향·격자의 스캔이 있으면 끝난 점 다음부터 이어서 계산하고,
+    설정이 다르면 처음부터 다시 쓴다. callback이 True를 반환하면 그 묶음까지 기록하고 멈춘다.
+    """
+    center = np.asarray(model.params if params is None else params, dtype=float)
+    directions = np.asarray(directions, dtype=float)
+    if directions.ndim == center.ndim:
+        directions = directions[None]
+    axes = tuple(np.asarray(axis, dtype=float).reshape(-1) for axis in axes)
+    if directions.shape[1:] != center.shape:
+        raise ValueError(f"방향 모양 {directions.shape[1:]}이 파라미터 모양 {center.shape}과 다릅니다.")
+    if len(directions) not in (1, 2) or len(axes) != len(directions):
+        raise ValueError("방향과 격자 축은 1개 또는 2개씩, 같은 수만큼 주어야 합니다.")
+    if any(axis.size == 0 for axis in axes):
+        raise ValueError("격자 축은 비어 있을 수 없습니다.")
+    if batch_size < 1:
+        raise ValueError("batch_size는 1 이상이어야 합니다.")
+
+    features, targets = model._stack_dataset(dataset)
+    states = model._engine_initial_states(np.asarray(features, dtype=float))
+    targets = np.asarray(targets, dtype=float)
+    shape = tuple(axis.size for axis in axes)
+    total = int(np.prod(shape))
+    fingerprint = _scan_fingerprint(model, targets, center, directions, axes)
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    values_path, progress_path = path / "values.npy", path / "progress.json"
+    completed = 0
+    if progress_path.exists() and values_path.exists():
+        progress = json.loads(progress_path.read_text(encoding="utf-8"))
+        if progress.get("format") == LANDSCAPE_FORMAT and progress.get("fingerprint") == fingerprint:
+            completed = int(progress["completed"])
+    if completed:
+        values = np.lib.format.open_memmap(values_path, mode="r+")
+    else:
+        values = np.lib.format.open_memmap(values_path, mode="w+", dtype=np.float64, shape=shape)
+        values[...] = np.nan
+        np.savez(path / "scan.npz", center=center, directions=directions, **{f"axis{i}": a for i, a in enumerate(axes)})
+        _write_progress(progress_path, fingerprint, 0, total)
+
+    engine = model._analytic_engine()
+    flat_values = values.reshape(-1)
+    flat_directions = directions.reshape(len(directions), -1)
+    while completed < total:
+        stop = min(completed + batch_size, total)
+        coords = np.unravel_index(np.arange(completed, stop), shape)
+        coefficients = np.stack([axis[index] for axis, index in zip(axes, coords)], axis=-1)  # (B, D)
+        batch = (center.reshape(1, -1) + coefficients @ flat_directions).reshape((stop - completed,) + center.shape)
+        probs = model._expval_to_prob(engine.expval(states, batch))
+        flat_values[completed:stop] = np.mean((probs - targets) ** 2, axis=-1)
+        values.flush()
+        # 값을 디스크에 내린 뒤에 진행 상황을 갱신하므로, 기록된 점은 항상 유효하다.
+        completed = stop
+        _write_progress(progress_path, fingerprint, completed, total)
+        if callback is not None and callback(completed, total):
+            break
+    return LandscapeScan(path, center, directions, axes, values, completed)
+
+
+def load_landscape(path: str | Path) -> LandscapeScan:
+    """`scan_landscape`가 쓴 디렉터리를 읽기 전용 memory-map으로 연다."""
+    path = Path(path)
+    progress = json.loads((path / "progress.json").read_text(encoding="utf-8"))
+    if progress.get("format") != LANDSCAPE_FORMAT:
+        raise ValueError(f"지원하지 않는 손실 지형 형식입니다: {progress.get('format')} ({path})")
+    with np.load(path / "scan.npz") as data:
+        center, directions = data["center"], data["directions"]
+        axes = tuple(data[f"axis{i}"] for i in range(len(directions)))
+    values = np.load(path / "values.npy", mmap_mode="r")
+    return LandscapeScan(path, center, directions, axes, values, int(progress["completed"]))
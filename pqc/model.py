@@ -1,11 +1,39 @@
 from __future__ import annotations
 
+import hashlib
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
 
 import numpy as np
 import pennylane as qml
 import pennylane.numpy as qnp
+from autograd import make_vjp
+
+from pqc.checkpoint import TrainingCheckpoint, load_checkpoint, remove_checkpoint, save_checkpoint
+from pqc.compile import CompiledOperation, FusedConstant, FusedRotation, compile_operations, operation_angle
+from pqc.engine import Operation, StatevectorEngine, basis_states
+from pqc.diffmethod import ANALYTIC_ONLY, DIFF_METHODS, resolve_diff_method
+from pqc.fourier import FourierSurrogate, fourier_surrogate
+from pqc.noise import NoiseModel
+from pqc.optimizers import (
+    LR_SCHEDULES,
+    OPTIMIZERS,
+    QNGOptimizer,
+    make_optimizer,
+    make_schedule,
+    minimize_lbfgs,
+    select_rows,
+)
+from pqc.shots import ShotFrugalOptimizer
+from pqc.predictor import CompiledPredictor
+from pqc.profiling import TrainingProfiler
+
+BACKENDS = ("pennylane", "numpy", "fourier")
+
+# fit 콜백: (완료한 스텝 수, 손실, 갱신 후 파라미터) → True면 학습 중단
+StepCallback = Callable[[int, float, qnp.ndarray], "bool | None"]
 
 
 @dataclass(frozen=True)
@@ -18,85 +46,684 @@ class PQCConfig:
     shots: int | None = None
     convergence_tol: float = 1e-3
     num_blocks: int = 2
+    # 학습 백엔드: pennylane / numpy(pqc.engine 상태벡터) / fourier(닫힌 꼴 삼각 다항식, pqc.fourier)
+    backend: str = "pennylane"
+    # 회전 사슬·상수 게이트 구간을 합친 회로로 학습 (pqc.compile, 해석적 기대값일 때만)
+    fuse_gates: bool = True
+    # PennyLane QNode 미분 방법: best / auto(설정별 측정으로 선택) / backprop / adjoint /
+    # parameter-shift / finite-diff (pqc.diffmethod)
+    diff_method: str = "best"
+    # 최적화기: adam / qng(블록 대각 메트릭 자연 그라디언트) / lbfgs(scipy L-BFGS-B) (pqc.optimizers)
+    # / rosalin(성분별 적응 샷 수로 측정한 그라디언트, pqc.shots)
+    optimizer: str = "adam"
+    # 학습률 일정: constant / plateau(손실이 plateau_patience 스텝 동안 줄지 않으면 plateau_factor배)
+    lr_schedule: str = "constant"
+    plateau_patience: int = 20
+    plateau_factor: float = 0.5
+    # 다중 시작: 무작위 초기값 restarts개를 (K, …) 파라미터 텐서 하나로 함께 학습하고,
+    # restart_prune_every 스텝마다 손실이 중앙값보다 나쁜 시작점을 버린다.
+    restarts: int = 1
+    restart_prune_every: int = 25
+    # rosalin: 측정 한 번의 최소 샷 수, fit(다중 시작이면 시작점) 하나의 샷 예산(None이면 무제한),
+    # 그라디언트 립시츠 상수(None이면 1 / learning_rate)
+    min_shots: int = 2
+    shot_budget: int | None = None
+    shot_lipschitz: float | None = None
+    # 혼합 상태 잡음 모델 (pqc.noise). 켜면 잡음 있는 회로로 학습·평가한다.
+    noise: NoiseModel | None = None
+
+    def __post_init__(self) -> None:
+        if self.backend not in BACKENDS:
+            raise ValueError(f"backend는 {'/'.join(BACKENDS)} 중 하나여야 합니다.")
+        if self.backend in ("numpy", "fourier") and self.shots is not None:
+            raise ValueError(f"{self.backend} 백엔드는 해석적 기대값만 지원하므로 shots=None이어야 합니다.")
+        if self.diff_method not in DIFF_METHODS:
+            raise ValueError(f"diff_method는 {'/'.join(DIFF_METHODS)} 중 하나여야 합니다.")
+        if self.diff_method in ANALYTIC_ONLY and self.shots is not None:
+            raise ValueError(f"{self.diff_method}는 해석적 기대값에서만 동작하므로 shots=None이어야 합니다.")
+        if self.optimizer not in OPTIMIZERS:
+            raise ValueError(f"optimizer는 {'/'.join(OPTIMIZERS)} 중 하나여야 합니다.")
+        if self.lr_schedule not in LR_SCHEDULES:
+            raise ValueError(f"lr_schedule은 {'/'.join(LR_SCHEDULES)} 중 하나여야 합니다.")
+        if self.optimizer == "lbfgs" and self.shots is not None:
+            raise ValueError("lbfgs는 선 탐색에 정확한 손실이 필요하므로 shots=None이어야 합니다.")
+        if self.plateau_patience < 1 or not 0.0 < self.plateau_factor < 1.0:
+            raise ValueError("plateau_patience는 1 이상, plateau_factor는 0과 1 사이여야 합니다.")
+        if self.restarts < 1 or self.restart_prune_every < 1:
+            raise ValueError("restarts와 restart_prune_every는 1 이상이어야 합니다.")
+        if self.optimizer == "rosalin":
+            if self.shots is not None:
+                raise ValueError("rosalin은 스텝마다 샷 수를 정하므로 shots=None이어야 합니다.")
+            if self.min_shots < 2:
+                raise ValueError("min_shots는 분산을 추정할 수 있도록 2 이상이어야 합니다.")
+            if self.shot_budget is not None and self.shot_budget < 1:
+                raise ValueError("shot_budget은 1 이상이어야 합니다.")
+            lipschitz = self.shot_lipschitz if self.shot_lipschitz is not None else 1.0 / self.learning_rate
+            if not 0.0 < lipschitz * self.learning_rate < 2.0:
+                raise ValueError("rosalin은 0 < shot_lipschitz · learning_rate < 2여야 합니다.")
+        if self.noise is not None:
+            if self.optimizer in ("qng", "rosalin"):
+                raise ValueError(f"{self.optimizer}는 순수 상태 시뮬레이션을 가정하므로 noise와 함께 쓸 수 없습니다.")
+            if self.diff_method == "adjoint":
+                raise ValueError("adjoint는 혼합 상태 장치를 지원하지 않으므로 noise와 함께 쓸 수 없습니다.")
 
 
 class TwoQubitPQC:
     """얽힘 없이 2-큐비트 PQC를 구성해 고전 게이트를 모방."""
 
+    params_per_wire = 3
+    num_wires = 2
+
     def __init__(self, config: PQCConfig):
         self.config = config
-        self.dev = qml.device("default.qubit", wires=2, shots=config.shots)
-        self.qnode = qml.QNode(self._circuit, self.dev, interface="autograd")
+        if config.noise is not None and self.num_wires != 2:
+            raise ValueError("잡음 시뮬레이션은 2-큐비트 모델만 지원합니다.")
+        device = "default.qubit" if config.noise is None else "default.mixed"
+        self.dev = qml.device(device, wires=self.num_wires, shots=config.shots)
+        # 샷 모드는 parameter-shift가 원래 게이트 단위로 동작해야 하므로, 잡음 모드는 게이트마다
+        # 채널을 넣어야 하므로 합친 회로를 쓰지 않는다.
+        fused = config.fuse_gates and config.shots is None and config.noise is None
+        self.compiled = compile_operations(self._engine_operations()) if fused else None
         self.params = self._init_params(config.seed)
+        # 현재 파라미터의 출발점 시드. 다중 시작이면 이긴 시작점의 시드, 외부 초기값이면 None.
+        self.seed: int | None = config.seed
+        # 마지막 fit이 쓴 회로 샷 수 (rosalin만 센다. 해석적 학습이면 0)
+        self.shots_used = 0
+        self.engine: StatevectorEngine | FourierSurrogate | None = None
+        if config.backend == "numpy" and config.noise is None:
+            self.engine = self._build_engine()
+        self.qnode = self._make_qnode("best")
+        if config.backend == "fourier" or (config.backend == "numpy" and config.noise is not None):
+            # 만들 때 QNode와 비교하므로 qnode 다음에 컴파일한다. 잡음이 있으면 numpy 백엔드도
+            # 채널을 곱해 둔 대리 모델(혼합 상태 시뮬레이터)로 실행한다.
+            self.engine = fourier_surrogate(self)
+        self.diff_method = resolve_diff_method(self)
+        if self.diff_method != "best":
+            self.qnode = self._make_qnode(self.diff_method)
+
+    def _make_qnode(self, diff_method: str) -> qml.QNode:
+        if self.config.noise is not None:
+            circuit = self._noisy_circuit
+        else:
+            circuit = self._fused_circuit if self.compiled is not None else self._circuit
+        return qml.QNode(circuit, self.dev, interface="autograd", diff_method=diff_method)
+
+    def _analytic_engine(self) -> StatevectorEngine | FourierSurrogate:
+        """학습과 같은 (잡음 포함) 해석적 기대값을 주는 NumPy 엔진. 백엔드와 상관없이 쓴다."""
+        if self.engine is not None:
+            return self.engine
+        return fourier_surrogate(self) if self.config.noise is not None else self._build_engine()
 
     def _init_params(self, seed: int) -> qnp.ndarray:
         rng = np.random.default_rng(seed)
-        shape = (self.config.num_blocks, 2, 3)
+        shape = (self.config.num_blocks, self.num_wires, self.params_per_wire)
         return qnp.array(rng.uniform(-np.pi, np.pi, size=shape), requires_grad=True)
 
+    def restart_seeds(self) -> list[int]:
+        """다중 시작 초기값의 시드. 0번은 config.seed 그대로라 restarts=1과 출발점이 같다."""
+        from pqc.parallel import derive_seed
+
+        return [derive_seed(self.config.seed, restart) for restart in range(self.config.restarts)]
+
     @staticmethod
-    def _basis_encoding(bits: Iterable[float]) -> None:
-        for wire, bit in enumerate(bits):
-            if int(bit) == 1:
-                qml.PauliX(wires=wire)
+    def _basis_encoding(bits: qnp.ndarray) -> None:
+        """입력 비트를 RX(π·bit)로 인코딩한다.
+
+        RX(π) = -iX 이므로 PauliX와 전역 위상만 다르고, (N, 2) 배치 입력도
+        파라미터 브로드캐스팅으로 한 번에 처리할 수 있다.
+        """
+        for wire in range(bits.shape[-1]):
+            qml.RX(np.pi * bits[..., wire], wires=wire)
 
     @staticmethod
     def _ansatz_layer(params: qnp.ndarray) -> None:
-        for block in range(params.shape[0]):
-            for wire in range(2):
-                theta, phi, lam = params[block, wire]
-                qml.RY(theta, wires=wire)
-                qml.RZ(phi, wires=wire)
-                qml.RY(lam, wires=wire)
-
-    def _circuit(self, inputs: Sequence[float], params: qnp.ndarray) -> qnp.ndarray:
+        # 앞쪽 축은 브로드캐스트 배치 축일 수 있으므로 뒤쪽 세 축으로만 인덱싱한다.
+        for block in range(params.shape[-3]):
+            for wire in range(params.shape[-2]):
+                qml.RY(params[..., block, wire, 0], wires=wire)
+                qml.RZ(params[..., block, wire, 1], wires=wire)
+                qml.RY(params[..., block, wire, 2], wires=wire)
+
+    def _circuit(self, inputs: qnp.ndarray, params: qnp.ndarray) -> qnp.ndarray:
         self._basis_encoding(inputs)
         self._ansatz_layer(params)
         return qml.expval(qml.PauliZ(0))
 
+    def _fused_circuit(self, inputs: qnp.ndarray, params: qnp.ndarray) -> qnp.ndarray:
+        """`_circuit`과 같은 회로를 컴파일된 게이트 열(`self.compiled`)로 실행.
+
+        합친 회전 사슬은 autograd로 미분 가능한 2×2 행렬을 만들어 `QubitUnitary` 하나로,
+        상수 구간은 미리 계산한 행렬로 적용하므로 tape의 게이트 수가 줄어든다.
+        """
+        for op in self._encoding_operations():
+            getattr(qml, op.name)(operation_angle(op, inputs), wires=op.wires)
+        flat = qnp.reshape(params, params.shape[:-3] + (-1,))
+        for unit in self.compiled:
+            self._apply_compiled(unit, flat)
+        return qml.expval(qml.PauliZ(0))
+
+    def _noisy_circuit(self, inputs: qnp.ndarray, params: qnp.ndarray) -> qnp.ndarray:
+        """`_engine_operations` 게이트마다 config.noise 채널을 넣은 회로 (`default.mixed`).
+        인코딩은 잡음 없는 상태 준비로 본다."""
+        noise = self.config.noise
+        for op in self._encoding_operations():
+            getattr(qml, op.name)(operation_angle(op, inputs), wires=op.wires)
+        flat = qnp.reshape(params, params.shape[:-3] + (-1,))
+        for op in self._engine_operations():
+            if op.parametric:
+                getattr(qml, op.name)(operation_angle(op, flat), wires=op.wires)
+            else:
+                getattr(qml, op.name)(wires=op.wires)
+            noise.apply(op.wires)
+        noise.apply_readout()
+        return qml.expval(qml.PauliZ(0))
+
+    @staticmethod
+    def _apply_compiled(unit: CompiledOperation, flat: qnp.ndarray) -> None:
+        if isinstance(unit, FusedRotation):
+            qml.QubitUnitary(unit.matrix(flat, xp=qnp), wires=unit.wires)
+        elif isinstance(unit, FusedConstant):
+            qml.QubitUnitary(unit.matrix, wires=unit.wires)
+        elif unit.parametric:
+            getattr(qml, unit.name)(operation_angle(unit, flat), wires=unit.wires)
+        else:
+            getattr(qml, unit.name)(wires=unit.wires)
+
+    def _param_index(self, block: int, wire: int, slot: int) -> int:
+        """params[block, wire, slot]의 평탄화 인덱스."""
+        return (block * self.num_wires + wire) * self.params_per_wire + slot
+
+    def _engine_rotations(self, block: int, names: tuple[str, ...]) -> list[Operation]:
+        """블록 하나의 와이어별 단일 큐비트 회전 열 (params[block, wire, slot] 순서)."""
+        return [
+            Operation(name, (wire,), ((self._param_index(block, wire, slot), 1.0),))
+            for wire in range(self.num_wires)
+            for slot, name in enumerate(names)
+        ]
+
+    def _engine_operations(self) -> list[Operation]:
+        """`_ansatz_layer`와 동일한 게이트 열을 NumPy 엔진용으로 기술."""
+        operations: list[Operation] = []
+        for block in range(self.config.num_blocks):
+            operations.extend(self._engine_rotations(block, ("RY", "RZ", "RY")))
+        return operations
+
+    def _build_engine(
+        self, operations: Sequence[Operation] | None = None, param_shape: tuple[int, ...] | None = None
+    ) -> StatevectorEngine:
+        """operations(생략하면 앤사츠 전체)를 실행하는 NumPy 엔진. param_shape 기본값은 params 모양."""
+        if operations is None:
+            operations = self._engine_operations()
+        shape = self.params.shape if param_shape is None else param_shape
+        return StatevectorEngine(operations, shape, fuse=self.config.fuse_gates)
+
+    def _engine_initial_states(self, features: np.ndarray) -> np.ndarray:
+        return basis_states(features)
+
+    def _encoding_operations(self) -> list[Operation]:
+        """입력 인코딩을 `Operation`으로 기술. terms의 인덱스는 파라미터가 아니라 입력 비트를 가리킨다."""
+        return [Operation("RX", (wire,), ((wire, np.pi),)) for wire in range(self.num_wires)]
+
     @staticmethod
     def _expval_to_prob(expval: qnp.ndarray) -> qnp.ndarray:
         return 0.5 * (1 - expval)
 
+    @staticmethod
+    def _stack_dataset(
+        dataset: list[tuple[qnp.ndarray, float]]
+    ) -> tuple[qnp.ndarray, qnp.ndarray]:
+        """진리표 데이터셋을 (N, 2) 입력 텐서와 (N,) 타깃 텐서로 묶는다."""
+        features = np.stack([np.asarray(bits, dtype=float) for bits, _ in dataset])
+        targets = np.array([float(target) for _, target in dataset])
+        return qnp.array(features, requires_grad=False), qnp.array(targets, requires_grad=False)
+
+    def _expvals(self, features: qnp.ndarray, params: qnp.ndarray) -> qnp.ndarray:
+        """⟨Z0⟩를 (…, N) 형태로 계산. params의 앞쪽 축은 파라미터 배치 축이다."""
+        if self.engine is not None:
+            return self.engine.expval(self._engine_initial_states(features), params)
+        if params.ndim == 3:
+            return self.qnode(features, params)
+        # (G, …) 파라미터 × (N, 2) 입력을 G·N 크기 브로드캐스트 한 번으로 실행
+        batch_shape = params.shape[:-3]
+        num_rows = features.shape[0]
+        flat = qnp.reshape(params, (-1,) + params.shape[-3:])
+        tiled_params = qnp.repeat(flat, num_rows, axis=0)
+        tiled_features = qnp.tile(features, (flat.shape[0], 1))
+        expvals = self.qnode(tiled_features, tiled_params)
+        return qnp.reshape(expvals, batch_shape + (num_rows,))
+
+    def _batched_loss(
+        self, features: qnp.ndarray, targets: qnp.ndarray, params: qnp.ndarray
+    ) -> qnp.ndarray:
+        probs = self._expval_to_prob(self._expvals(features, params))
+        return qnp.mean((probs - targets) ** 2, axis=-1)
+
+    def _loss_and_pullback(
+        self, features: qnp.ndarray, targets: qnp.ndarray, params: qnp.ndarray
+    ) -> tuple[np.ndarray, Callable[[], np.ndarray]]:
+        """순방향으로 (파라미터 배치별) 손실을 계산하고, 그라디언트는 지연 함수로 돌려준다."""
+        if self.engine is None:
+            vjp, losses = make_vjp(lambda p: self._batched_loss(features, targets, p))(params)
+            return np.asarray(losses), lambda: vjp(np.ones_like(losses))
+        expvals, pullback = self.engine.expval_and_vjp(self._engine_initial_states(features), params)
+        residual = self._expval_to_prob(expvals) - np.asarray(targets)
+        # d/dE mean((0.5·(1 - E) - y)²) = -(p - y) / N
+        return np.mean(residual**2, axis=-1), lambda: pullback(-residual / residual.shape[-1])
+
+    def _loss_and_grad(
+        self, features: qnp.ndarray, targets: qnp.ndarray, params: qnp.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """현재 백엔드로 (파라미터 배치별) 손실과 그라디언트를 함께 계산."""
+        losses, grad_fn = self._loss_and_pullback(features, targets, params)
+        return losses, grad_fn()
+
     def loss(self, dataset: list[tuple[qnp.ndarray, float]], params: qnp.ndarray) -> qnp.ndarray:
-        errors: list[qnp.ndarray] = []
-        for features, target in dataset:
-            expval = self.qnode(features, params)
-            prob = self._expval_to_prob(expval)
-            errors.append((prob - target) ** 2)
-        return qnp.stack(errors).mean()
-
-    def fit(self, dataset: list[tuple[qnp.ndarray, float]]) -> list[float]:
-        optimizer = qml.AdamOptimizer(stepsize=self.config.learning_rate)
+        features, targets = self._stack_dataset(dataset)
+        return self._batched_loss(features, targets, params)
+
+    def _fingerprint(self, targets: qnp.ndarray) -> str:
+        """체크포인트가 같은 모델·설정·데이터셋의 것인지 확인하는 해시."""
+        payload = f"{type(self).__qualname__}|{self.config!r}|{np.asarray(targets).tolist()}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def fit(
+        self,
+        dataset: list[tuple[qnp.ndarray, float]],
+        callback: StepCallback | None = None,
+        checkpoint: str | Path | None = None,
+        checkpoint_every: int = 50,
+        profiler: TrainingProfiler | None = None,
+        restarts: int | None = None,
+    ) -> list[float]:
+        """config.optimizer(기본 Adam)로 학습하고 스텝별 손실 기록을 반환.
+
+        callback은 매 스텝 뒤에 호출되며 True를 반환하면 그 자리에서 학습을 멈춘다.
+        checkpoint 경로를 주면 checkpoint_every 스텝마다 파라미터, Adam 상태, 학습률과
+        plateau 일정 상태, 손실 기록을 저장하고, 파일이 이미 있으면 그 지점부터 이어서
+        학습한다. 학습이 끝나면 체크포인트 파일은 지운다. profiler를 주면 스텝별 구간
+        시간과 실행 수를 기록한다. lbfgs는 반복마다, rosalin은 스텝마다 샷으로 추정한
+        손실을 기록하며, 둘 다 checkpoint를 무시한다(저장하지도 이어 받지도 않는다).
+
+        config.restarts > 1이면 `_fit_multistart`로 여러 초기값을 함께 학습해 가장 좋은
+        것을 남기며(체크포인트는 쓰지 않는다), 그 시작점의 시드를 `self.seed`에 둔다.
+        restarts를 주면 이번 호출만 config.restarts 대신 쓴다(정해 둔 초기값에서 이어
+        학습할 때 1).
+        """
+        features, targets = self._stack_dataset(dataset)
+        if (self.config.restarts if restarts is None else restarts) > 1:
+            return self._fit_multistart(features, targets, callback, profiler)
+        if self.config.optimizer == "lbfgs":
+            return self._fit_lbfgs(features, targets, callback, profiler)
+        if self.config.optimizer == "rosalin":
+            return self._fit_rosalin(features, targets, callback, profiler)
+        optimizer = make_optimizer(self, features)
+        schedule = make_schedule(self)
         params = self.params
         history: list[float] = []
 
-        for _ in range(self.config.max_steps):
-            params, loss_val = optimizer.step_and_cost(lambda p: self.loss(dataset, p), params)
-            history.append(float(loss_val))
-            if loss_val < self.config.convergence_tol:
-                break
+        fingerprint = self._fingerprint(targets) if checkpoint is not None else ""
+        restored = load_checkpoint(checkpoint) if checkpoint is not None else None
+        if restored is not None:
+            if restored.fingerprint != fingerprint:
+                raise ValueError(f"다른 학습의 체크포인트입니다: {checkpoint}")
+            params = qnp.array(restored.params, requires_grad=True)
+            history = restored.loss_history
+            if isinstance(optimizer, qml.AdamOptimizer):
+                optimizer.accumulation = restored.adam_accumulation()
+            if restored.stepsize is not None:
+                optimizer.stepsize = restored.stepsize
+            if schedule is not None:
+                schedule.load_state(restored.schedule_state)
+
+        done = bool(history) and history[-1] < self.config.convergence_tol
+        with profiler.session(self) if profiler is not None else nullcontext():
+            while not done and len(history) < self.config.max_steps:
+                if profiler is None:
+                    loss_val, grad = self._loss_and_grad(features, targets, params)
+                    params = optimizer.apply_grad((grad,), (params,))[0]
+                else:
+                    loss_val, params = profiler.step(
+                        lambda: self._loss_and_pullback(features, targets, params),
+                        lambda grad: optimizer.apply_grad((grad,), (params,))[0],
+                    )
+                history.append(float(loss_val))
+                if loss_val < self.config.convergence_tol:
+                    break
+                if schedule is not None:
+                    optimizer.stepsize = schedule.update(loss_val)
+                if callback is not None and callback(len(history), history[-1], params):
+                    break
+                if checkpoint is not None and len(history) % checkpoint_every == 0:
+                    # Adam이 아니면 모멘트 자리에 0을 둔다(복원할 때 쓰지 않는다).
+                    accumulation = getattr(optimizer, "accumulation", None) or {
+                        "fm": [np.zeros(np.shape(params))],
+                        "sm": [np.zeros(np.shape(params))],
+                        "t": len(history),
+                    }
+                    save_checkpoint(
+                        checkpoint,
+                        TrainingCheckpoint(
+                            fingerprint=fingerprint,
+                            params=np.asarray(params),
+                            loss_history=history,
+                            first_moment=np.asarray(accumulation["fm"][0]),
+                            second_moment=np.asarray(accumulation["sm"][0]),
+                            adam_step=accumulation["t"],
+                            stepsize=np.asarray(optimizer.stepsize),
+                            schedule_state=schedule.state() if schedule is not None else None,
+                        ),
+                    )
 
+        if checkpoint is not None:
+            remove_checkpoint(checkpoint)
         self.params = params
         return history
 
+    def _fit_multistart(
+        self,
+        features: qnp.ndarray,
+        targets: qnp.ndarray,
+        callback: StepCallback | None,
+        profiler: TrainingProfiler | None,
+    ) -> list[float]:
+        """`restart_seeds`의 초기값 K개를 (K, …) 텐서로 한 번에 시뮬레이션하며 학습.
+
+        restart_prune_every 스텝마다 손실이 살아 있는 시작점들의 중앙값보다 큰 것을 텐서에서
+        빼므로 뒤로 갈수록 스텝 비용이 줄어든다. 어느 시작점이든 convergence_tol 아래로
+        내려가면 바로 멈추고 그것을, 아니면 마지막 손실이 가장 낮은 것을 고른다. 반환하는
+        손실 기록은 고른 시작점의 것이고, callback은 그 스텝의 최저 손실과 파라미터로 부른다.
+        """
+        seeds = self.restart_seeds()
+        tol = self.config.convergence_tol
+        if self.config.optimizer in ("lbfgs", "rosalin"):
+            # 선 탐색·샷 배분은 시작점마다 따로 진행되므로 차례로 풀고, 수렴하면 남은 시작점은 건너뛴다.
+            fit_one = self._fit_lbfgs if self.config.optimizer == "lbfgs" else self._fit_rosalin
+            best: tuple[int, qnp.ndarray, list[float]] | None = None
+            shots_used = 0
+            for seed in seeds:
+                self.params = self._init_params(seed)
+                history = fit_one(features, targets, callback, profiler)
+                shots_used += self.shots_used
+                if best is None or history[-1] < best[2][-1]:
+                    best = (seed, self.params, history)
+                if history[-1] < tol:
+                    break
+            self.seed, self.params, history = best
+            self.shots_used = shots_used
+            return history
+
+        optimizer = make_optimizer(self, features)
+        schedule = make_schedule(self)
+        params = qnp.array(np.stack([self._init_params(seed) for seed in seeds]), requires_grad=True)
+        alive = np.arange(len(seeds))
+        histories: list[list[float]] = [[] for _ in seeds]
+        losses = np.full(len(seeds), np.inf)
+
+        with profiler.session(self) if profiler is not None else nullcontext():
+            for step in range(1, self.config.max_steps + 1):
+                if profiler is None:
+                    losses, grad = self._loss_and_grad(features, targets, params)
+                    params = optimizer.apply_grad((grad,), (params,))[0]
+                else:
+                    batch: list[np.ndarray] = []
+
+                    def forward() -> tuple[float, Callable[[], np.ndarray]]:
+                        step_losses, grad_fn = self._loss_and_pullback(features, targets, params)
+                        batch.append(step_losses)
+                        return float(np.min(step_losses)), grad_fn
+
+                    _, params = profiler.step(forward, lambda grad: optimizer.apply_grad((grad,), (params,))[0])
+                    losses = batch[0]
+                losses = np.asarray(losses, dtype=float)
+                for row, restart in enumerate(alive):
+                    histories[restart].append(float(losses[row]))
+                leader = int(np.argmin(losses))
+                if losses[leader] < tol:
+                    break
+                if schedule is not None:
+                    optimizer.stepsize = schedule.update(losses).reshape((-1,) + (1,) * (params.ndim - 1))
+                if callback is not None and callback(step, float(losses[leader]), params[leader]):
+                    break
+                if step % self.config.restart_prune_every == 0 and len(alive) > 1:
+                    keep = np.flatnonzero(losses <= np.median(losses))
+                    params = qnp.array(np.asarray(params)[keep], requires_grad=True)
+                    alive, losses = alive[keep], losses[keep]
+                    select_rows(optimizer, schedule, keep)
+
+        leader = int(np.argmin(losses))
+        self.seed = seeds[alive[leader]]
+        self.params = qnp.array(np.asarray(params)[leader], requires_grad=True)
+        return histories[alive[leader]]
+
+    def _fit_rosalin(
+        self,
+        features: qnp.ndarray,
+        targets: qnp.ndarray,
+        callback: StepCallback | None,
+        profiler: TrainingProfiler | None,
+    ) -> list[float]:
+        """측정 샷으로 추정한 손실·그라디언트로 학습 (`pqc.shots.ShotFrugalOptimizer`).
+
+        pennylane 백엔드는 장치에서 샷을 실제로 실행하고, numpy/fourier 백엔드는 정확한
+        확률에서 측정값을 뽑아 샘플링 잡음만 흉내 낸다. 손실 기록은 샷으로 추정한 값이고,
+        추정값에 표준오차 두 배를 더해도 convergence_tol 아래이거나 shot_budget을 다 쓰면
+        멈춘다. 쓴 샷 수는 `self.shots_used`에 둔다. 체크포인트는 쓰지 않는다.
+        """
+        optimizer = ShotFrugalOptimizer(self, np.asarray(features, dtype=float), np.asarray(targets, dtype=float))
+        params = np.asarray(self.params, dtype=float)
+        history: list[float] = []
+        budget = self.config.shot_budget
+
+        with profiler.session(self) if profiler is not None else nullcontext():
+            for _ in range(self.config.max_steps):
+                estimate: list[float] = []
+
+                def forward() -> tuple[float, Callable[[], np.ndarray]]:
+                    loss_val, stderr = optimizer.estimate_loss(params)
+                    estimate[:] = [loss_val, stderr]
+                    return loss_val, optimizer.estimate_gradient
+
+                if profiler is None:
+                    loss_val, grad_fn = forward()
+                    params = optimizer.apply_grad(grad_fn(), params)
+                else:
+                    loss_val, params = profiler.step(forward, lambda grad: optimizer.apply_grad(grad, params))
+                history.append(float(loss_val))
+                if estimate[0] + 2.0 * estimate[1] < self.config.convergence_tol:
+                    break
+                if budget is not None and optimizer.shots_used >= budget:
+                    break
+                if callback is not None and callback(len(history), history[-1], qnp.array(params)):
+                    break
+
+        self.params = qnp.array(params, requires_grad=True)
+        self.shots_used = optimizer.shots_used
+        return history
+
+    def _fit_lbfgs(
+        self,
+        features: qnp.ndarray,
+        targets: qnp.ndarray,
+        callback: StepCallback | None,
+        profiler: TrainingProfiler | None,
+    ) -> list[float]:
+        """L-BFGS-B 학습. profiler를 주면 손실·그라디언트 평가 한 번을 한 스텝으로 기록한다."""
+
+        def loss_and_grad(params: np.ndarray) -> tuple[float, np.ndarray]:
+            params = qnp.array(params, requires_grad=True)
+            if profiler is None:
+                return self._loss_and_grad(features, targets, params)
+            captured: list[np.ndarray] = []
+            loss_val, _ = profiler.step(
+                lambda: self._loss_and_pullback(features, targets, params),
+                lambda grad: captured.append(np.asarray(grad)) or params,
+            )
+            return loss_val, captured[0]
+
+        with profiler.session(self) if profiler is not None else nullcontext():
+            params, history = minimize_lbfgs(
+                loss_and_grad,
+                np.asarray(self.params, dtype=float),
+                self.config.max_steps,
+                self.config.convergence_tol,
+                callback,
+            )
+        self.params = qnp.array(params, requires_grad=True)
+        return history
+
+    def _fit_batches(
+        self,
+        make_batches: Callable[[int], Iterable[tuple[np.ndarray, np.ndarray]]],
+        callback: StepCallback | None = None,
+        profiler: TrainingProfiler | None = None,
+        on_step: Callable[[int, qnp.ndarray], None] | None = None,
+        on_epoch_end: Callable[[int, qnp.ndarray], None] | None = None,
+    ) -> list[float]:
+        """make_batches(seed)가 내는 (입력, 타깃) 미니배치로 학습하고 스텝별 손실을 반환 (`fit_stream` 공용).
+
+        에폭마다 seed = config.seed + 에폭 번호로 새 묶음 순서를 받고, max_steps 스텝을 채우거나
+        에폭 미니배치 손실의 행 가중 평균이 convergence_tol 아래면 멈춘다. on_step은 매 스텝
+        callback 전에, on_epoch_end는 끝까지 돈 에폭마다 (스텝 수, 파라미터)로 부른다.
+        """
+        if self.config.optimizer in ("lbfgs", "rosalin"):
+            raise ValueError(f"{self.config.optimizer}는 미니배치 학습을 지원하지 않습니다. 전체 진리표로 fit을 쓰세요.")
+        if self.config.restarts > 1:
+            raise ValueError("다중 시작은 미니배치 학습을 지원하지 않습니다. 전체 진리표로 fit을 쓰세요.")
+        optimizer = make_optimizer(self, np.zeros((1, self.num_wires)))
+        schedule = make_schedule(self)
+        params = self.params
+        history: list[float] = []
+        stopped = False
+        epoch = 0
+
+        with profiler.session(self) if profiler is not None else nullcontext():
+            while not stopped and len(history) < self.config.max_steps:
+                epoch_loss, epoch_rows = 0.0, 0
+                for bits, target in make_batches(self.config.seed + epoch):
+                    features = qnp.array(bits, requires_grad=False)
+                    targets = qnp.array(target, requires_grad=False)
+                    if isinstance(optimizer, QNGOptimizer):
+                        optimizer.features = features
+                    if profiler is None:
+                        loss_val, grad = self._loss_and_grad(features, targets, params)
+                        params = optimizer.apply_grad((grad,), (params,))[0]
+                    else:
+                        loss_val, params = profiler.step(
+                            lambda: self._loss_and_pullback(features, targets, params),
+                            lambda grad: optimizer.apply_grad((grad,), (params,))[0],
+                        )
+                    history.append(float(loss_val))
+                    if schedule is not None:
+                        optimizer.stepsize = schedule.update(loss_val)
+                    epoch_loss += float(loss_val) * len(target)
+                    epoch_rows += len(target)
+                    if on_step is not None:
+                        on_step(len(history), params)
+                    if callback is not None and callback(len(history), history[-1], params):
+                        stopped = True
+                    if stopped or len(history) >= self.config.max_steps:
+                        break
+                else:
+                    stopped = epoch_loss / epoch_rows < self.config.convergence_tol
+                    if on_epoch_end is not None:
+                        on_epoch_end(len(history), params)
+                epoch += 1
+
+        self.params = params
+        return history
+
+    def _evaluate_batches(self, batches: Iterable[tuple[np.ndarray, np.ndarray]]) -> tuple[float, float]:
+        """묶음들 전체의 (평균 제곱 손실, 정확도)를 묶음 단위로 누적해 계산 (`evaluate_stream` 공용)."""
+        squared_error, correct, rows = 0.0, 0, 0
+        for bits, targets in batches:
+            probs = self.predict_probabilities(bits)
+            squared_error += float(np.sum((probs - targets) ** 2))
+            correct += int(np.sum((probs >= 0.5) == (targets >= 0.5)))
+            rows += len(targets)
+        return squared_error / rows, correct / rows
+
+    def fit_stacked(
+        self, datasets: Sequence[list[tuple[qnp.ndarray, float]]]
+    ) -> tuple[qnp.ndarray, list[list[float]]]:
+        """여러 게이트의 데이터셋을 (G, num_blocks, 2, k) 파라미터 텐서 하나로 동시에 학습.
+
+        모든 게이트는 `self.params`에서 출발하고, 한 번의 벡터화된 회로 실행과 최적화기
+        갱신을 공유한다(plateau 학습률은 게이트별로 따로 줄인다). 손실이 `convergence_tol`
+        아래로 내려간 게이트의 슬라이스는 그 스텝의 갱신까지만 반영한 뒤 고정되므로,
+        게이트별 궤적은 `fit`을 따로 호출한 결과와 같다. lbfgs는 게이트마다 차례로 푼다.
+        `self.params`는 바꾸지 않는다.
+        """
+        stacked = [self._stack_dataset(dataset) for dataset in datasets]
+        features = stacked[0][0]
+        if any(not np.array_equal(other, features) for other, _ in stacked[1:]):
+            raise ValueError("fit_stacked는 입력 행이 같은 데이터셋만 묶을 수 있습니다.")
+        targets = qnp.stack([target for _, target in stacked])
+        num_tasks = len(stacked)
+        if self.config.restarts > 1:
+            raise ValueError("fit_stacked는 모든 게이트가 self.params에서 출발하므로 restarts=1이어야 합니다.")
+        if self.config.optimizer == "rosalin":
+            raise ValueError("rosalin은 태스크마다 샷을 따로 배분하므로 fit_stacked를 지원하지 않습니다. fit을 쓰세요.")
+
+        if self.config.optimizer == "lbfgs":
+            # 선 탐색은 태스크마다 따로 진행되므로 묶지 않고 차례로 푼다.
+            solved = [
+                minimize_lbfgs(
+                    lambda p, task=task: self._loss_and_grad(features, targets[task], qnp.array(p, requires_grad=True)),
+                    np.asarray(self.params, dtype=float),
+                    self.config.max_steps,
+                    self.config.convergence_tol,
+                )
+                for task in range(num_tasks)
+            ]
+            params = qnp.array(np.stack([solution for solution, _ in solved]), requires_grad=True)
+            return params, [history for _, history in solved]
+
+        optimizer = make_optimizer(self, features)
+        schedule = make_schedule(self)
+        params = qnp.array(np.repeat(self.params[None], num_tasks, axis=0), requires_grad=True)
+        active = np.ones(num_tasks, dtype=bool)
+        histories: list[list[float]] = [[] for _ in range(num_tasks)]
+        mask_shape = (num_tasks,) + (1,) * (params.ndim - 1)
+
+        for _ in range(self.config.max_steps):
+            losses, grad = self._loss_and_grad(features, targets, params)
+            updated = optimizer.apply_grad((grad,), (params,))[0]
+            params = qnp.where(active.reshape(mask_shape), updated, params)
+            for task in np.flatnonzero(active):
+                histories[task].append(float(losses[task]))
+            active &= losses >= self.config.convergence_tol
+            if not active.any():
+                break
+            if schedule is not None:
+                optimizer.stepsize = schedule.update(losses).reshape(mask_shape)
+
+        return params, histories
+
+    def predict_probabilities(
+        self, features: qnp.ndarray, params: qnp.ndarray | None = None
+    ) -> np.ndarray:
+        """(N, 2) 입력 배치 전체의 P(1)을 한 번의 회로 실행으로 계산.
+
+        params를 생략하면 `self.params`를 쓰고, `fit_stacked`가 돌려준 (G, …) 텐서를
+        넘기면 (G, N) 확률을 반환한다.
+        """
+        params = self.params if params is None else params
+        batch = qnp.array(np.atleast_2d(np.asarray(features, dtype=float)), requires_grad=False)
+        expvals = self._expvals(batch, params)
+        probs = np.asarray(self._expval_to_prob(expvals), dtype=float)
+        return probs.reshape(params.shape[:-3] + (batch.shape[0],))
+
+    def export_predictor(self, params: np.ndarray | None = None) -> CompiledPredictor:
+        """params(생략하면 `self.params`)를 고정한 NumPy 전용 추론기로 컴파일."""
+        return CompiledPredictor.from_model(self, params)
+
     def predict_probability(self, inputs: qnp.ndarray) -> float:
-        expval = self.qnode(inputs, self.params)
-        prob = self._expval_to_prob(expval)
-        return float(prob)
+        return float(self.predict_probabilities(inputs)[0])
 
     def evaluate(
         self, dataset: list[tuple[qnp.ndarray, float]]
     ) -> tuple[list[float], list[int], list[int]]:
-        probabilities: list[float] = []
-        predictions: list[int] = []
-        targets: list[int] = []
-
-        for features, target in dataset:
-            prob = self.predict_probability(features)
-            probabilities.append(prob)
-            predictions.append(int(prob >= 0.5))
-            targets.append(int(target))
-
-        return probabilities, predictions, targets
-
+        features, targets = self._stack_dataset(dataset)
+        probabilities = [float(prob) for prob in self.predict_probabilities(features)]
+        predictions = [int(prob >= 0.5) for prob in probabilities]
+        return probabilities, predictions, [int(target) for target in targets]
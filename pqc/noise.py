@@ -0,0 +1,134 @@
+"""혼합 상태 잡음 모델 (`PQCConfig.noise`).
+
+앤사츠의 게이트마다 그 게이트가 작용한 와이어 각각에 탈분극(DepolarizingChannel) →
+진폭 감쇠(AmplitudeDamping) 채널을 넣고, 측정 직전 0번 와이어에 대칭 판독 오류
+(BitFlip)를 넣는다. 입력 인코딩은 잡음 없는 상태 준비로 본다.
+
+- pennylane 백엔드: `default.mixed` 장치에서 위 채널을 넣은 회로를 실행한다.
+- numpy / fourier 백엔드: 채널의 Pauli 전달 행렬을 게이트 코어에 곱해 둔
+  `FourierSurrogate`(16차원 Pauli 벡터로 밀도 행렬을 다루는 시뮬레이터)로 실행한다.
+  잡음은 파라미터와 무관한 상수 채널이라 코어 구조가 그대로 유지된다.
+
+`noise_sweep`은 여러 잡음 세기를 코어의 앞쪽 축으로 쌓아, 학습한 파라미터를 모든 세기 ×
+입력에서 한 번에 평가한다. 잡음을 켠 설정으로 `fit`하면 잡음 있는 손실로 학습한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as qnp
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.model import TwoQubitPQC
+
+
+@dataclass(frozen=True)
+class NoiseModel:
+    """게이트 뒤 탈분극 확률, 진폭 감쇠율, 0번 와이어 판독 뒤집힘 확률."""
+
+    depolarizing: float = 0.0
+    amplitude_damping: float = 0.0
+    readout: float = 0.0
+
+    def __post_init__(self) -> None:
+        for name in ("depolarizing", "amplitude_damping", "readout"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name}는 0 이상 1 이하여야 합니다.")
+
+    def scaled(self, factor: float) -> "NoiseModel":
+        """모든 세기에 factor를 곱한 잡음 모델 (1을 넘으면 1로 자른다)."""
+        return NoiseModel(
+            min(self.depolarizing * factor, 1.0),
+            min(self.amplitude_damping * factor, 1.0),
+            min(self.readout * factor, 1.0),
+        )
+
+    def apply(self, wires: Sequence[int]) -> None:
+        """QNode 안에서 wires 각각에 게이트 뒤 채널을 넣는다."""
+        for wire in wires:
+            if self.depolarizing:
+                qml.DepolarizingChannel(self.depolarizing, wires=wire)
+            if self.amplitude_damping:
+                qml.AmplitudeDamping(self.amplitude_damping, wires=wire)
+
+    def apply_readout(self) -> None:
+        if self.readout:
+            qml.BitFlip(self.readout, wires=0)
+
+    def kraus(self, wire: int) -> list[np.ndarray]:
+        """wire에 넣는 게이트 뒤 채널 합성의 2-큐비트 Kraus 연산자들 (4×4)."""
+        operators = [np.eye(4, dtype=complex)]
+        channels = []
+        if self.depolarizing:
+            channels.append(qml.DepolarizingChannel(self.depolarizing, wires=wire))
+        if self.amplitude_damping:
+            channels.append(qml.AmplitudeDamping(self.amplitude_damping, wires=wire))
+        for channel in channels:
+            local = [_embed(matrix, wire) for matrix in channel.kraus_matrices()]
+            operators = [after @ before for after in local for before in operators]
+        return operators
+
+    def readout_kraus(self) -> list[np.ndarray]:
+        if not self.readout:
+            return [np.eye(4, dtype=complex)]
+        return [_embed(matrix, 0) for matrix in qml.BitFlip(self.readout, wires=0).kraus_matrices()]
+
+
+def _embed(matrix: np.ndarray, wire: int) -> np.ndarray:
+    """단일 큐비트 행렬을 2-큐비트(0번 와이어가 앞) 행렬로."""
+    identity = np.eye(2)
+    return np.kron(matrix, identity) if wire == 0 else np.kron(identity, matrix)
+
+
+@dataclass(frozen=True)
+class NoiseSweepPoint:
+    """잡음 세기 하나에서 학습한 파라미터의 손실·정확도·입력별 P(1)."""
+
+    noise: NoiseModel
+    loss: float
+    accuracy: float
+    probabilities: tuple[float, ...]
+
+
+def noise_sweep(
+    model: "TwoQubitPQC",
+    dataset: list[tuple[qnp.ndarray, float]],
+    levels: Sequence[NoiseModel],
+    params: np.ndarray | None = None,
+) -> list[NoiseSweepPoint]:
+    """params(기본 model.params)를 levels의 잡음 세기마다 평가. 모든 세기 × 입력을 한 번에 계산한다.
+
+    model의 백엔드·잡음 설정과 상관없이 혼합 상태 시뮬레이터(`FourierSurrogate`)로 계산한다.
+    """
+    from pqc.fourier import FourierSurrogate
+
+    if model.num_wires != 2:
+        raise ValueError("잡음 시뮬레이션은 2-큐비트 모델만 지원합니다.")
+    if not levels:
+        raise ValueError("levels는 비어 있을 수 없습니다.")
+    params = np.asarray(model.params if params is None else params, dtype=float)
+    features, targets = model._stack_dataset(dataset)
+    targets = np.asarray(targets, dtype=float)
+    simulator = FourierSurrogate(model._engine_operations(), params.shape, noise=list(levels))
+    expvals = simulator.expval(model._engine_initial_states(np.asarray(features, dtype=float)), params)  # (S, N)
+    probs = np.asarray(model._expval_to_prob(expvals), dtype=float)
+    losses = np.mean((probs - targets) ** 2, axis=-1)
+    accuracies = np.mean((probs >= 0.5) == (targets >= 0.5), axis=-1)
+    return [
+        NoiseSweepPoint(level, float(loss), float(accuracy), tuple(float(p) for p in row))
+        for level, loss, accuracy, row in zip(levels, losses, accuracies, probs)
+    ]
+
+
+def log_noise_sweep(points: Sequence[NoiseSweepPoint]) -> None:
+    print("\n[잡음 세기별 평가] 탈분극 / 진폭 감쇠 / 판독")
+    for point in points:
+        noise = point.noise
+        print(
+            f"  p={noise.depolarizing:.4f} γ={noise.amplitude_damping:.4f} r={noise.readout:.4f}"
+            f"  손실 {point.loss:.6f}  정확도 {point.accuracy:.3f}"
+        )
@@ -0,0 +1,30 @@
+"""k-입력 불리언 함수를 학습하는 n-큐비트 PQC 패키지."""
+
+from importlib import import_module
+from typing import Any
+
+_EXPORT_MAP = {
+    "NQubitPQCConfig": ("pqc.nqubit.config", "NQubitPQCConfig"),
+    "NQubitPQC": ("pqc.nqubit.model", "NQubitPQC"),
+    "TensorStatevectorEngine": ("pqc.nqubit.engine", "TensorStatevectorEngine"),
+    "BooleanFunction": ("pqc.nqubit.functions", "BooleanFunction"),
+    "parity": ("pqc.nqubit.functions", "parity"),
+    "majority": ("pqc.nqubit.functions", "majority"),
+    "multiplexer": ("pqc.nqubit.functions", "multiplexer"),
+    "BooleanTrainingResult": ("pqc.nqubit.workflow", "BooleanTrainingResult"),
+    "train_boolean_function": ("pqc.nqubit.workflow", "train_boolean_function"),
+    "log_boolean_result": ("pqc.nqubit.workflow", "log_boolean_result"),
+    "run_boolean_experiments": ("pqc.nqubit.workflow", "run_boolean_experiments"),
+}
+
+__all__ = tuple(_EXPORT_MAP.keys())
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORT_MAP:
+        raise AttributeError(f"module 'pqc.nqubit' has no attribute '{name}'") from None
+    module_name, attr_name = _EXPORT_MAP[name]
+    module = import_module(module_name)
+    value = getattr(module, attr_name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pqc.model import PQCConfig
+
+
+@dataclass(frozen=True)
+class NQubitPQCConfig(PQCConfig):
+    """n-입력 불리언 함수용 PQC 설정.
+
+    큐비트 수가 커지면 PennyLane 경로가 급격히 느려지므로 기본 백엔드는 numpy다.
+    batch_size는 한 스텝에 쓰는 진리표 행 수로, 2^num_inputs 이상이면 전체 배치 학습과 같다.
+    """
+
+    num_inputs: int = 3
+    batch_size: int = 256
+    backend: str = "numpy"
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if self.num_inputs < 1:
+            raise ValueError("num_inputs는 1 이상이어야 합니다.")
+        if self.batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다.")
@@ -0,0 +1,232 @@
+"""n-큐비트 PQC용 텐서 상태벡터 엔진.
+
+2-큐비트 엔진(`pqc.engine`)은 게이트마다 4×4 행렬을 만들지만, 큐비트 수가 늘면
+2^n × 2^n 행렬을 만들 수 없다. 여기서는 상태를 (…, N, 2^n) 배열로 두고 게이트마다
+(…, 앞쪽, 2, 뒤쪽) 뷰로 나눠 해당 와이어 축에만 적용하므로 메모리와 게이트당
+연산량이 N · 2^n에 비례한다. 회로 기술(`Operation`)과 adjoint 그라디언트 규약은 2-큐비트 엔진과 같다.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+import numpy as np
+
+from pqc.compile import CompiledOperation, FusedConstant, FusedRotation, compile_operations, rotation_matrix
+from pqc.engine import Operation
+
+
+# 와이어 뒤쪽 진폭 수(2^(n-wire-1))가 이 값 이상이면 2×2 행렬을 matmul 한 번으로 적용한다.
+# 그보다 작으면 matmul이 아주 작은 행렬곱을 반복하게 되어 성분별 연산이 더 빠르다.
+_MATMUL_MIN_STRIDE = 8
+
+ROTATION_GATES = frozenset({"RX", "RY", "RZ"})
+FIXED_GATES = frozenset({"PauliX", "CNOT", "CZ"})
+
+
+def basis_states(features: np.ndarray, num_wires: int) -> np.ndarray:
+    """(N, n) 비트 배열을 계산 기저 상태 (N, 2^n)로 변환. 0번 와이어가 최상위 비트."""
+    bits = np.asarray(features, dtype=float).reshape(-1, num_wires).round().astype(np.int64)
+    weights = 1 << np.arange(num_wires - 1, -1, -1, dtype=np.int64)
+    states = np.zeros((bits.shape[0], 1 << num_wires), dtype=complex)
+    states[np.arange(bits.shape[0]), bits @ weights] = 1.0
+    return states
+
+
+class TensorStatevectorEngine:
+    """`Operation` 목록을 (…, N, 2^n) 상태 배열 위에서 실행하고 adjoint 그라디언트를 제공.
+
+    지원 게이트는 단일 큐비트 회전(RX/RY/RZ)과 고정 게이트(PauliX/CNOT/CZ)이며,
+    관측량은 ⟨Z0⟩ 하나다. fuse=True면 와이어별 회전 사슬을 2×2 행렬 하나로 합쳐
+    (`pqc.compile`) 사슬마다 상태 전체를 한 번만 훑는다.
+    """
+
+    def __init__(
+        self,
+        operations: Sequence[Operation],
+        param_shape: tuple[int, ...],
+        num_wires: int,
+        fuse: bool = True,
+    ):
+        unsupported = sorted(
+            {op.name for op in operations if op.name not in ROTATION_GATES | FIXED_GATES}
+        )
+        if unsupported:
+            raise ValueError(f"지원하지 않는 게이트입니다: {', '.join(unsupported)}")
+        self.operations = tuple(operations)
+        self.units: tuple[CompiledOperation, ...] = (
+            tuple(compile_operations(self.operations)) if fuse else self.operations
+        )
+        self.param_shape = tuple(param_shape)
+        self.num_params = int(np.prod(self.param_shape))
+        self.num_wires = num_wires
+        # 지금까지 시뮬레이션한 회로 수 (파라미터 배치 × 입력 행)
+        self.executions = 0
+
+    def _batch_shape(self, params: np.ndarray) -> tuple[int, ...]:
+        return params.shape[: params.ndim - len(self.param_shape)]
+
+    def _angle(self, op: Operation, flat: np.ndarray) -> np.ndarray:
+        angle = np.full(flat.shape[:-1], op.offset)
+        for index, coeff in op.terms:
+            angle = angle + coeff * flat[..., index]
+        return angle
+
+    def _matrices(self, params: np.ndarray) -> tuple[list[np.ndarray | None], list[np.ndarray | None]]:
+        """실행 단위마다 (…, 2, 2) 또는 4×4 행렬(고정 게이트는 None)과, 합친 사슬의 누적곱."""
+        flat = params.reshape(self._batch_shape(params) + (self.num_params,))
+        matrices: list[np.ndarray | None] = []
+        factors: list[np.ndarray | None] = []
+        for unit in self.units:
+            chain_factors = None
+            if isinstance(unit, FusedRotation):
+                chain_factors = unit.prefixes(unit.factors(flat))
+                matrices.append(chain_factors[..., -1, :, :])
+            elif isinstance(unit, FusedConstant):
+                matrices.append(unit.matrix)
+            elif unit.name in ROTATION_GATES:
+                matrices.append(rotation_matrix(unit.name, self._angle(unit, flat)))
+            else:
+                matrices.append(None)
+            factors.append(chain_factors)
+        return matrices, factors
+
+    def _split(self, psi: np.ndarray, wire: int, batch_ndim: int) -> np.ndarray:
+        """(…, N, 2^n) 상태를 (…, N·2^wire, 2, 2^(n-wire-1)) 뷰로 바꿔 wire 축을 가운데에 둔다."""
+        return psi.reshape(psi.shape[:batch_ndim] + (-1, 2, 1 << (self.num_wires - wire - 1)))
+
+    def _apply_matrix(self, psi: np.ndarray, matrix: np.ndarray, wire: int, batch_ndim: int) -> np.ndarray:
+        split = self._split(psi, wire, batch_ndim)
+        if split.shape[-1] >= _MATMUL_MIN_STRIDE:
+            return np.matmul(matrix[..., None, :, :], split).reshape(psi.shape)
+        # 성분을 (…, 1, 1)로 늘려 (…, N·2^wire, 2^(n-wire-1)) 진폭 절반과 브로드캐스트한다.
+        entries = matrix[..., None, None, :, :]
+        low, high = split[..., 0, :], split[..., 1, :]
+        out = np.empty(split.shape, dtype=complex)
+        out[..., 0, :] = entries[..., 0, 0] * low + entries[..., 0, 1] * high
+        out[..., 1, :] = entries[..., 1, 0] * low + entries[..., 1, 1] * high
+        return out.reshape(psi.shape)
+
+    def _apply_fixed(self, psi: np.ndarray, op: Operation, batch_ndim: int) -> np.ndarray:
+        """PauliX/CNOT/CZ는 자기 자신이 역연산이다."""
+        tensor = psi.reshape(psi.shape[: batch_ndim + 1] + (2,) * self.num_wires)
+        axes = [batch_ndim + 1 + wire for wire in op.wires]
+        if op.name == "PauliX":
+            return np.ascontiguousarray(np.flip(tensor, axis=axes[0])).reshape(psi.shape)
+        out = tensor.copy()
+        excited = [slice(None)] * tensor.ndim
+        excited[axes[0]] = 1
+        excited = tuple(excited)
+        target_axis = axes[1] - (1 if axes[1] > axes[0] else 0)
+        if op.name == "CNOT":
+            out[excited] = np.flip(tensor[excited], axis=target_axis)
+        else:
+            flipped = [slice(None)] * (tensor.ndim - 1)
+            flipped[target_axis] = 1
+            out[excited][tuple(flipped)] *= -1
+        return out.reshape(psi.shape)
+
+    def _apply_pair(self, psi: np.ndarray, matrix: np.ndarray, wires: tuple[int, ...], batch_ndim: int) -> np.ndarray:
+        """4×4 행렬을 (wires[0], wires[1]) 축 쌍에 적용."""
+        tensor = psi.reshape(psi.shape[: batch_ndim + 1] + (2,) * self.num_wires)
+        axes = [batch_ndim + 1 + wire for wire in wires]
+        moved = np.moveaxis(tensor, axes, [-2, -1])
+        pairs = moved.reshape(moved.shape[:-2] + (4,)) @ matrix.T
+        return np.moveaxis(pairs.reshape(moved.shape), [-2, -1], axes).reshape(psi.shape)
+
+    def _apply(
+        self, psi: np.ndarray, unit: CompiledOperation, matrix: np.ndarray | None, batch_ndim: int
+    ) -> np.ndarray:
+        if matrix is None:
+            return self._apply_fixed(psi, unit, batch_ndim)
+        if len(unit.wires) == 2:
+            return self._apply_pair(psi, matrix, unit.wires, batch_ndim)
+        return self._apply_matrix(psi, matrix, unit.wires[0], batch_ndim)
+
+    def _overlap(self, bra: np.ndarray, psi: np.ndarray, pauli: str, wire: int, batch_ndim: int) -> np.ndarray:
+        """⟨λ|P_wire|ψ⟩를 P|ψ⟩를 만들지 않고 (…) 배치별로 계산."""
+        bra_split, psi_split = self._split(bra, wire, batch_ndim), self._split(psi, wire, batch_ndim)
+        b0, b1 = np.conj(bra_split[..., 0, :]), np.conj(bra_split[..., 1, :])
+        p0, p1 = psi_split[..., 0, :], psi_split[..., 1, :]
+        axes = (-2, -1)
+        if pauli == "X":
+            return np.sum(b0 * p1, axis=axes) + np.sum(b1 * p0, axis=axes)
+        if pauli == "Y":
+            return -1j * np.sum(b0 * p1, axis=axes) + 1j * np.sum(b1 * p0, axis=axes)
+        return np.sum(b0 * p0, axis=axes) - np.sum(b1 * p1, axis=axes)
+
+    def _wire_weight(self, bra: np.ndarray, psi: np.ndarray, wire: int, batch_ndim: int) -> np.ndarray:
+        """W_ab = Σ conj(λ_a) ψ_b (…, 2, 2). 입력 행과 다른 와이어 축은 합산한다."""
+        bra_split = np.conj(self._split(bra, wire, batch_ndim))
+        psi_split = self._split(psi, wire, batch_ndim)
+        axes = (-2, -1)
+        rows = [
+            np.stack([np.sum(bra_split[..., a, :] * psi_split[..., b, :], axis=axes) for b in (0, 1)], axis=-1)
+            for a in (0, 1)
+        ]
+        return np.stack(rows, axis=-2)
+
+    def _initial(self, states: np.ndarray, batch_shape: tuple[int, ...]) -> np.ndarray:
+        flat = np.asarray(states, dtype=complex).reshape(-1, 1 << self.num_wires)
+        return np.broadcast_to(flat, batch_shape + flat.shape)
+
+    def _z0(self, psi: np.ndarray, batch_ndim: int) -> np.ndarray:
+        """Z0 |ψ⟩."""
+        out = np.array(self._split(psi, 0, batch_ndim))
+        out[..., 1, :] *= -1
+        return out.reshape(psi.shape)
+
+    def _expval_of(self, psi: np.ndarray, batch_ndim: int) -> np.ndarray:
+        probs = np.abs(self._split(psi, 0, batch_ndim)) ** 2
+        return np.sum(probs[..., 0, :], axis=-1) - np.sum(probs[..., 1, :], axis=-1)
+
+    def state(self, states: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """초기 상태 (N, 2^n)를 진화시킨 최종 상태 (…, N, 2, …, 2)."""
+        params = np.asarray(params, dtype=float)
+        batch_shape = self._batch_shape(params)
+        psi = self._initial(states, batch_shape)
+        for unit, matrix in zip(self.units, self._matrices(params)[0]):
+            psi = self._apply(psi, unit, matrix, len(batch_shape))
+        self.executions += int(np.prod(psi.shape[:-1]))
+        return psi.reshape(psi.shape[:-1] + (2,) * self.num_wires)
+
+    def expval(self, states: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """⟨Z0⟩ (…, N)."""
+        psi = self.state(states, params)
+        flat = psi.reshape(psi.shape[: psi.ndim - self.num_wires] + (-1,))
+        return self._expval_of(flat, flat.ndim - 2)
+
+    def expval_and_vjp(
+        self, states: np.ndarray, params: np.ndarray
+    ) -> tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]:
+        """⟨Z0⟩와, cotangent (…, N)를 파라미터 그라디언트로 보내는 pullback을 반환."""
+        params = np.asarray(params, dtype=float)
+        batch_shape = self._batch_shape(params)
+        batch_ndim = len(batch_shape)
+        matrices, factors = self._matrices(params)
+        final = self._initial(states, batch_shape)
+        for unit, matrix in zip(self.units, matrices):
+            final = self._apply(final, unit, matrix, batch_ndim)
+        self.executions += int(np.prod(final.shape[:-1]))
+        expvals = self._expval_of(final, batch_ndim)
+
+        def pullback(cotangent: np.ndarray) -> np.ndarray:
+            grad = np.zeros(batch_shape + (self.num_params,))
+            psi = final
+            bra = np.asarray(cotangent, dtype=float)[..., None] * self._z0(final, batch_ndim)
+            for unit, matrix, chain_factors in zip(reversed(self.units), reversed(matrices), reversed(factors)):
+                if isinstance(unit, Operation) and matrix is not None and unit.terms:
+                    # dU/dθ = -i/2 P U  →  ∂θ = Im⟨λ|P|ψ⟩ (입력 행·진폭 축 합산)
+                    overlap = self._overlap(bra, psi, unit.name[1], unit.wires[0], batch_ndim)
+                    for index, coeff in unit.terms:
+                        grad[..., index] += coeff * overlap.imag
+                inverse = None if matrix is None else np.conj(np.swapaxes(matrix, -1, -2))
+                psi = self._apply(psi, unit, inverse, batch_ndim)
+                if chain_factors is not None:
+                    # 사슬은 적용 전 ψ와 적용 후 λ의 2×2 가중치로 곱의 미분을 계산
+                    weight = self._wire_weight(bra, psi, unit.wire, batch_ndim)
+                    unit.backprop(chain_factors, weight, grad)
+                bra = self._apply(bra, unit, inverse, batch_ndim)
+            return grad.reshape(batch_shape + self.param_shape)
+
+        return expvals, pullback
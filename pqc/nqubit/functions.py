@@ -0,0 +1,112 @@
+"""k-입력 불리언 함수 정의와 진리표 스트리밍."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Iterator, Sequence
+
+import numpy as np
+
+from pqc.gates import GATE_FUNCTIONS, LogicGate, truth_table_batches
+
+# (B, k) 정수 비트 배열 → (B,) 0/1 배열
+BitRule = Callable[[np.ndarray], np.ndarray]
+
+
+def _lookup(table: np.ndarray, bits: np.ndarray) -> np.ndarray:
+    weights = 1 << np.arange(bits.shape[1] - 1, -1, -1, dtype=np.int64)
+    return table[bits.astype(np.int64) @ weights]
+
+
+def _rowwise(fn: Callable[..., int], bits: np.ndarray) -> np.ndarray:
+    return np.array([int(fn(*row)) for row in bits.tolist()], dtype=np.int8)
+
+
+def _parity(bits: np.ndarray) -> np.ndarray:
+    return np.bitwise_xor.reduce(bits, axis=1)
+
+
+def _majority(bits: np.ndarray) -> np.ndarray:
+    return (2 * bits.sum(axis=1) > bits.shape[1]).astype(np.int8)
+
+
+def _multiplexer(select_bits: int, bits: np.ndarray) -> np.ndarray:
+    weights = 1 << np.arange(select_bits - 1, -1, -1, dtype=np.int64)
+    address = bits[:, :select_bits].astype(np.int64) @ weights
+    return bits[np.arange(bits.shape[0]), select_bits + address]
+
+
+@dataclass(frozen=True)
+class BooleanFunction:
+    """k개 비트를 받아 0/1을 내는 함수. 진리표 행을 묶음 단위로 계산한다.
+
+    rule은 (B, k) 비트 배열을 받아 (B,) 출력을 돌려주는 벡터화 함수이며, 내장 함수는
+    모듈 수준 함수의 partial이라 프로세스 간에 피클로 넘길 수 있다.
+    """
+
+    name: str
+    num_inputs: int
+    rule: BitRule
+
+    def __post_init__(self) -> None:
+        if self.num_inputs < 1:
+            raise ValueError("num_inputs는 1 이상이어야 합니다.")
+
+    @classmethod
+    def from_truth_table(cls, table: Sequence[int], name: str = "table") -> "BooleanFunction":
+        """`truth_table_inputs` 순서의 출력 2^k개로 정의."""
+        values = np.asarray(table, dtype=np.int8).ravel()
+        num_inputs = int(values.size).bit_length() - 1
+        if values.size < 2 or values.size != 1 << num_inputs:
+            raise ValueError("진리표 길이는 2 이상의 2의 거듭제곱이어야 합니다.")
+        if not np.isin(values, (0, 1)).all():
+            raise ValueError("진리표 값은 0 또는 1이어야 합니다.")
+        return cls(name, num_inputs, partial(_lookup, values))
+
+    @classmethod
+    def from_callable(
+        cls,
+        fn: Callable[..., int] | BitRule,
+        num_inputs: int,
+        name: str | None = None,
+        vectorized: bool = False,
+    ) -> "BooleanFunction":
+        """fn(*bits) → 0/1 형태의 함수로 정의. vectorized=True면 fn이 (B, k) 배열을 직접 받는다."""
+        rule = fn if vectorized else partial(_rowwise, fn)
+        return cls(name or getattr(fn, "__name__", "callable"), num_inputs, rule)
+
+    @classmethod
+    def from_gate(cls, gate: LogicGate) -> "BooleanFunction":
+        return cls.from_callable(GATE_FUNCTIONS[gate], 2, name=gate.value)
+
+    @property
+    def num_rows(self) -> int:
+        return 1 << self.num_inputs
+
+    def targets(self, bits: np.ndarray) -> np.ndarray:
+        """(B, k) 비트 배열의 출력을 float (B,)로 계산."""
+        return np.asarray(self.rule(np.asarray(bits, dtype=np.int8)), dtype=float).reshape(-1)
+
+    def batches(self, batch_size: int, seed: int | None = None) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """진리표를 (입력 (B, k), 타깃 (B,)) 묶음으로 차례로 생성. seed를 주면 행 순서를 섞는다."""
+        for bits in truth_table_batches(self.num_inputs, batch_size, seed=seed):
+            yield bits.astype(float), self.targets(bits)
+
+
+def parity(num_inputs: int) -> BooleanFunction:
+    """입력 비트의 XOR."""
+    return BooleanFunction(f"parity{num_inputs}", num_inputs, _parity)
+
+
+def majority(num_inputs: int) -> BooleanFunction:
+    """1인 비트가 절반을 넘으면 1. 짝수 입력에서 동률은 0."""
+    return BooleanFunction(f"majority{num_inputs}", num_inputs, _majority)
+
+
+def multiplexer(select_bits: int) -> BooleanFunction:
+    """앞쪽 select_bits개 주소 비트가 가리키는 데이터 비트를 출력 (입력 수 s + 2^s)."""
+    if select_bits < 1:
+        raise ValueError("select_bits는 1 이상이어야 합니다.")
+    num_inputs = select_bits + (1 << select_bits)
+    return BooleanFunction(f"mux{num_inputs}", num_inputs, partial(_multiplexer, select_bits))
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as qnp
+
+from pqc.engine import Operation
+from pqc.model import StepCallback, TwoQubitPQC
+from pqc.profiling import TrainingProfiler
+
+from .config import NQubitPQCConfig
+from .engine import TensorStatevectorEngine, basis_states
+from .functions import BooleanFunction
+
+
+class NQubitPQC(TwoQubitPQC):
+    """k개 입력 비트를 k-큐비트에 기저 인코딩해 k-입력 불리언 함수를 학습하는 PQC.
+
+    블록마다 와이어별 RY → RZ → RY 회전 뒤에 CNOT 고리(w → w+1)로 얽힘을 만들고,
+    0번 큐비트의 ⟨Z⟩를 측정한다.
+    """
+
+    config: NQubitPQCConfig
+
+    def __init__(self, config: NQubitPQCConfig | None = None):
+        config = config or NQubitPQCConfig()
+        self.config = config
+        self.num_wires = config.num_inputs
+        super().__init__(config)
+
+    @staticmethod
+    def entangler_pairs(num_wires: int) -> list[tuple[int, int]]:
+        """블록 끝 CNOT의 (제어, 타깃) 목록. 3큐비트 이상은 고리, 2큐비트는 CNOT 하나."""
+        if num_wires < 2:
+            return []
+        if num_wires == 2:
+            return [(0, 1)]
+        return [(wire, (wire + 1) % num_wires) for wire in range(num_wires)]
+
+    def _ansatz_layer(self, params: qnp.ndarray) -> None:
+        pairs = self.entangler_pairs(params.shape[-2])
+        for block in range(params.shape[-3]):
+            for wire in range(params.shape[-2]):
+                qml.RY(params[..., block, wire, 0], wires=wire)
+                qml.RZ(params[..., block, wire, 1], wires=wire)
+                qml.RY(params[..., block, wire, 2], wires=wire)
+            for control, target in pairs:
+                qml.CNOT(wires=(control, target))
+
+    def _engine_operations(self) -> list[Operation]:
+        operations: list[Operation] = []
+        pairs = self.entangler_pairs(self.num_wires)
+        for block in range(self.config.num_blocks):
+            operations.extend(self._engine_rotations(block, ("RY", "RZ", "RY")))
+            operations.extend(Operation("CNOT", pair) for pair in pairs)
+        return operations
+
+    def _build_engine(
+        self, operations: Sequence[Operation] | None = None, param_shape: tuple[int, ...] | None = None
+    ) -> TensorStatevectorEngine:
+        if operations is None:
+            operations = self._engine_operations()
+        shape = self.params.shape if param_shape is None else param_shape
+        return TensorStatevectorEngine(operations, shape, self.num_wires, fuse=self.config.fuse_gates)
+
+    def _engine_initial_states(self, features: np.ndarray) -> np.ndarray:
+        return basis_states(features, self.num_wires)
+
+    def _check_function(self, function: BooleanFunction) -> None:
+        if function.num_inputs != self.num_wires:
+            raise ValueError(
+                f"{function.name}의 입력 수({function.num_inputs})가 큐비트 수({self.num_wires})와 다릅니다."
+            )
+
+    def fit_stream(
+        self,
+        function: BooleanFunction,
+        callback: StepCallback | None = None,
+        profiler: TrainingProfiler | None = None,
+    ) -> list[float]:
+        """진리표를 batch_size 행씩 흘려보내며 미니배치 학습하고 스텝별 손실을 반환.
+
+        에폭마다 행 순서를 (seed, 에폭) 시드로 섞는다. 수렴 판정은 에폭이 끝날 때
+        그 에폭 미니배치 손실의 행 가중 평균으로 하므로, 2^k ≤ batch_size이면
+        `fit`과 같은 전체 배치 학습이 된다. 메모리는 batch_size · 2^k에 비례한다.
+        """
+        self._check_function(function)
+        return self._fit_batches(
+            lambda seed: function.batches(self.config.batch_size, seed=seed), callback=callback, profiler=profiler
+        )
+
+    def evaluate_stream(
+        self, function: BooleanFunction, batch_size: int | None = None
+    ) -> tuple[float, float]:
+        """진리표 전체의 (평균 제곱 손실, 정확도)를 묶음 단위로 누적해 계산."""
+        self._check_function(function)
+        return self._evaluate_batches(function.batches(batch_size or self.config.batch_size))
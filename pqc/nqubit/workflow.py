@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Sequence
+
+import numpy as np
+
+from pqc.model import StepCallback
+from pqc.profiling import TrainingProfiler
+from pqc.results import TrainingResult
+
+from .config import NQubitPQCConfig
+from .functions import BooleanFunction, majority, multiplexer, parity
+from .model import NQubitPQC
+
+DEFAULT_NQUBIT_CONFIG = NQubitPQCConfig(
+    learning_rate=0.1,
+    max_steps=600,
+    num_blocks=4,
+)
+
+
+# n-입력 함수 결과도 `pqc.results.TrainingResult`를 쓴다(gate는 None, 행별 출력 배열은 비어 있음).
+BooleanTrainingResult = TrainingResult
+
+
+def train_boolean_function(
+    function: BooleanFunction,
+    config: NQubitPQCConfig | None = None,
+    callback: StepCallback | None = None,
+    profiler: TrainingProfiler | None = None,
+) -> BooleanTrainingResult:
+    """함수의 입력 수로 큐비트 수를 맞춰 `fit_stream`으로 학습하고 진리표 전체로 평가.
+
+    final_loss는 마지막 미니배치 손실이 아니라 학습 후 진리표 전체의 손실이다.
+    """
+    config = replace(config or DEFAULT_NQUBIT_CONFIG, num_inputs=function.num_inputs)
+    pqc = NQubitPQC(config)
+    history = pqc.fit_stream(function, callback=callback, profiler=profiler)
+    final_loss, accuracy = pqc.evaluate_stream(function)
+    return BooleanTrainingResult(
+        function=function.name,
+        num_inputs=function.num_inputs,
+        final_loss=final_loss,
+        accuracy=accuracy,
+        converged=final_loss < config.convergence_tol,
+        params=pqc.params,
+        loss_history=history,
+        max_steps=config.max_steps,
+        seed=pqc.seed,
+    )
+
+
+def log_boolean_result(result: BooleanTrainingResult, config: NQubitPQCConfig) -> None:
+    status = "성공" if result.accuracy == 1.0 else "제한"
+    print(f"\n[{result.function}] {result.num_inputs}-입력 학습 {status}")
+    print(f"  최종 손실: {result.final_loss:.6f} (수렴 기준 {config.convergence_tol})")
+    print(f"  정확도: {result.accuracy * 100:.1f}% / 학습 스텝: {len(result.loss_history)}")
+    print(f"  블록 수: {config.num_blocks} / 배치: {config.batch_size} / 러닝레이트: {config.learning_rate}")
+    print(f"  매개변수 노름: {np.linalg.norm(result.params):.3f}")
+
+
+def run_boolean_experiments(
+    functions: Sequence[BooleanFunction] | None = None,
+    config: NQubitPQCConfig | None = None,
+) -> list[BooleanTrainingResult]:
+    bool_config = config or DEFAULT_NQUBIT_CONFIG
+    functions_to_learn = functions or [parity(3), majority(3), multiplexer(1), parity(4)]
+    results = []
+    for function in functions_to_learn:
+        result = train_boolean_function(function, bool_config)
+        log_boolean_result(result, replace(bool_config, num_inputs=function.num_inputs))
+        results.append(result)
+    return results
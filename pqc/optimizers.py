@@ -0,0 +1,260 @@
+"""`PQCConfig.optimizer`로 고르는 최적화기와 학습률 일정.
+
+- ``adam``: `qml.AdamOptimizer` (기존 동작).
+- ``qng``: 블록 대각 Fubini–Study 메트릭으로 전처리한 양자 자연 그라디언트.
+  서로 다른 와이어에 작용하는 연속된 매개변수 게이트를 한 층으로 묶고, 층 직전 상태에서
+  생성자 공분산으로 층 블록을 계산해 입력 행 평균을 낸다(`BlockDiagonalMetric`).
+- ``lbfgs``: 해석적 그라디언트로 돌리는 scipy L-BFGS-B (`minimize_lbfgs`).
+- ``rosalin``: 성분별 적응 샷 수로 측정한 그라디언트의 SGD (`pqc.shots`).
+
+`PlateauSchedule`은 손실이 patience 스텝 동안 줄지 않으면 학습률을 factor배로 줄이며,
+adam/qng 모두에 쓴다. 파라미터 배치 축((G, …) 묶음 학습)은 태스크별로 따로 추적한다.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as qnp
+
+from pqc.engine import Operation, local_generator
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.model import TwoQubitPQC
+
+OPTIMIZERS = ("adam", "qng", "lbfgs", "rosalin")
+LR_SCHEDULES = ("constant", "plateau")
+
+# 메트릭이 특이할 때(예: |0⟩에 바로 걸린 RZ)를 위한 대각 정규화 항
+QNG_REGULARIZATION = 1e-3
+
+# plateau 판정: 최저 손실보다 이 비율 이상 줄어야 개선으로 본다.
+PLATEAU_THRESHOLD = 1e-3
+
+
+class PlateauSchedule:
+    """손실 정체를 감지해 학습률을 줄이는 일정. losses가 (G,)면 태스크별 학습률 (G,)을 돌려준다."""
+
+    def __init__(self, learning_rate: float, patience: int, factor: float, min_lr: float = 1e-6):
+        self.initial = learning_rate
+        self.patience = patience
+        self.factor = factor
+        self.min_lr = min_lr
+        self.lr: np.ndarray | None = None
+        self._best: np.ndarray | None = None
+        self._wait: np.ndarray | None = None
+
+    def update(self, losses: Any) -> np.ndarray:
+        losses = np.asarray(losses, dtype=float)
+        if self.lr is None:
+            self.lr = np.full(losses.shape, self.initial)
+            self._best = losses.copy()
+            self._wait = np.zeros(losses.shape, dtype=int)
+            return self.lr
+        improved = losses < self._best * (1.0 - PLATEAU_THRESHOLD)
+        self._best = np.where(improved, losses, self._best)
+        self._wait = np.where(improved, 0, self._wait + 1)
+        reduce = self._wait >= self.patience
+        self.lr = np.where(reduce, np.maximum(self.lr * self.factor, self.min_lr), self.lr)
+        self._wait = np.where(reduce, 0, self._wait)
+        return self.lr
+
+    def state(self) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """체크포인트용 (lr, best, wait). 첫 update 전이면 None."""
+        if self.lr is None:
+            return None
+        return self.lr.copy(), self._best.copy(), self._wait.copy()
+
+    def load_state(self, state: tuple[np.ndarray, np.ndarray, np.ndarray] | None) -> None:
+        if state is None:
+            self.lr = self._best = self._wait = None
+            return
+        lr, best, wait = state
+        self.lr = np.array(lr, dtype=float)
+        self._best = np.array(best, dtype=float)
+        self._wait = np.array(wait, dtype=int)
+
+    def select(self, rows: np.ndarray) -> None:
+        """태스크 축에서 rows만 남긴다."""
+        if self.lr is not None:
+            self.lr, self._best, self._wait = self.lr[rows], self._best[rows], self._wait[rows]
+
+
+class BlockDiagonalMetric:
+    """모델 앤사츠의 블록 대각 메트릭 텐서 (num_params, num_params).
+
+    층 ℓ의 블록은 g_ab = ¼(⟨G_a G_b⟩ − ⟨G_a⟩⟨G_b⟩)이고(G는 exp(-iθG/2)의 생성자),
+    게이트 각도 = 계수 행렬 A_ℓ · θ 이므로 파라미터 메트릭은 Σ_ℓ A_ℓᵀ g_ℓ A_ℓ 이다.
+    층 사이 구간은 모델의 NumPy 엔진으로 실행하므로 PennyLane 백엔드 모델에도 쓸 수 있다.
+    """
+
+    def __init__(self, model: "TwoQubitPQC"):
+        self.model = model
+        self.num_wires = model.num_wires
+        self.param_shape = tuple(model.params.shape)
+        self.num_params = int(np.prod(self.param_shape))
+        operations = model._engine_operations()
+
+        # (시작 위치, 게이트들): 서로 다른 와이어에 작용하는 연속된 학습 게이트 묶음. 각도가 고정된
+        # 매개변수 게이트(각도 인코딩 앤사츠의 CRX(π/2))는 고정 게이트처럼 층 사이 구간에 둔다.
+        layers: list[tuple[int, list[Operation]]] = []
+        current: list[Operation] = []
+        start, wires = 0, set()
+        for position, op in enumerate(operations):
+            trainable = op.parametric and bool(op.terms)
+            if trainable and current and not wires & set(op.wires):
+                current.append(op)
+                wires |= set(op.wires)
+                continue
+            if current:
+                layers.append((start, current))
+                current = []
+            if trainable:
+                current, start, wires = [op], position, set(op.wires)
+        if current:
+            layers.append((start, current))
+
+        # 층마다 직전 층 시작부터 이 층 시작 전까지의 구간을 실행하는 엔진
+        self.layers = [layer for _, layer in layers]
+        self._segments: list[Any] = []
+        previous = 0
+        for start, _ in layers:
+            segment = operations[previous:start]
+            self._segments.append(model._build_engine(segment) if segment else None)
+            previous = start
+        self._coefficients = []
+        for layer in self.layers:
+            matrix = np.zeros((len(layer), self.num_params))
+            for row, op in enumerate(layer):
+                for index, coeff in op.terms:
+                    matrix[row, index] += coeff
+            self._coefficients.append(matrix)
+        self._generators = [[local_generator(op) for op in layer] for layer in self.layers]
+
+    def _apply_local(self, psi: np.ndarray, matrix: np.ndarray, wires: tuple[int, ...]) -> np.ndarray:
+        """(N, 2, …, 2) 상태에 wires의 국소 행렬을 곱한다."""
+        k = len(wires)
+        tensor = matrix.reshape((2,) * (2 * k))
+        axes = [1 + wire for wire in wires]
+        out = np.tensordot(tensor, psi, axes=(list(range(k, 2 * k)), axes))
+        return np.moveaxis(out, list(range(k)), axes)
+
+    def __call__(self, states: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """초기 상태 (N, 2^n)와 파라미터 하나(배치 축 없음)의 메트릭 (P, P). 입력 행 평균."""
+        params = np.asarray(params, dtype=float)
+        psi = np.asarray(states, dtype=complex).reshape((-1,) + (2,) * self.num_wires)
+        metric = np.zeros((self.num_params, self.num_params))
+        for segment, layer, generators, coefficients in zip(
+            self._segments, self.layers, self._generators, self._coefficients
+        ):
+            if segment is not None:
+                psi = segment.state(psi.reshape(psi.shape[0], -1), params).reshape(psi.shape)
+            applied = np.stack([self._apply_local(psi, g, op.wires) for op, g in zip(layer, generators)])
+            num_rows = psi.shape[0]
+            # ⟨G_a⟩ (m, N)와 행 평균 ⟨G_a G_b⟩ (m, m). 한 층의 생성자는 서로 교환하므로 실수다.
+            means = np.sum(np.conj(psi)[None] * applied, axis=tuple(range(2, applied.ndim))).real
+            flat = applied.reshape(len(layer), -1)
+            second = (np.conj(flat) @ flat.T).real / num_rows
+            block = 0.25 * (second - means @ means.T / num_rows)
+            metric += coefficients.T @ block @ coefficients
+        return metric
+
+
+class QNGOptimizer:
+    """θ ← θ − η (g + λI)⁻¹ ∇L. `qml.AdamOptimizer.apply_grad`와 같은 호출 규약을 따른다.
+
+    features는 메트릭을 계산할 입력 배치로, fit 중 바뀌면(미니배치) `features` 속성을 갱신한다.
+    """
+
+    def __init__(self, model: "TwoQubitPQC", features: np.ndarray, stepsize: Any):
+        self.metric = BlockDiagonalMetric(model)
+        self.model = model
+        self.features = features
+        self.stepsize = stepsize
+
+    def apply_grad(self, grad: tuple[Any, ...], args: tuple[Any, ...]) -> tuple[Any, ...]:
+        params = np.asarray(args[0], dtype=float)
+        gradient = np.asarray(grad[0], dtype=float)
+        states = self.model._engine_initial_states(np.asarray(self.features, dtype=float))
+        flat_params = params.reshape((-1, self.metric.num_params))
+        flat_grad = gradient.reshape((-1, self.metric.num_params))
+        steps = np.empty_like(flat_grad)
+        regularizer = QNG_REGULARIZATION * np.eye(self.metric.num_params)
+        for task in range(flat_params.shape[0]):
+            metric = self.metric(states, flat_params[task].reshape(self.metric.param_shape))
+            steps[task] = np.linalg.solve(metric + regularizer, flat_grad[task])
+        # stepsize는 스칼라이거나 파라미터 배치에 맞춰 브로드캐스트되는 (G, 1, …) 배열이다.
+        updated = params - np.asarray(self.stepsize, dtype=float) * steps.reshape(params.shape)
+        return (qnp.array(updated, requires_grad=True),)
+
+
+def select_rows(optimizer: Any, schedule: PlateauSchedule | None, rows: np.ndarray) -> None:
+    """파라미터 배치의 rows 행만 남길 때 최적화기 상태(Adam 모멘트, 태스크별 학습률)도 맞춰 줄인다."""
+    accumulation = getattr(optimizer, "accumulation", None)
+    if accumulation:
+        optimizer.accumulation = {
+            "fm": [accumulation["fm"][0][rows]],
+            "sm": [accumulation["sm"][0][rows]],
+            "t": accumulation["t"],
+        }
+    if np.ndim(optimizer.stepsize):
+        optimizer.stepsize = np.asarray(optimizer.stepsize)[rows]
+    if schedule is not None:
+        schedule.select(rows)
+
+
+def make_optimizer(model: "TwoQubitPQC", features: np.ndarray) -> Any:
+    """config.optimizer가 adam/qng일 때의 스텝 단위 최적화기."""
+    if model.config.optimizer == "qng":
+        return QNGOptimizer(model, features, model.config.learning_rate)
+    if model.config.optimizer == "adam":
+        return qml.AdamOptimizer(stepsize=model.config.learning_rate)
+    raise ValueError(f"스텝 단위로 실행할 수 없는 최적화기입니다: {model.config.optimizer}")
+
+
+def make_schedule(model: "TwoQubitPQC") -> PlateauSchedule | None:
+    if model.config.lr_schedule == "plateau":
+        return PlateauSchedule(model.config.learning_rate, model.config.plateau_patience, model.config.plateau_factor)
+    return None
+
+
+def minimize_lbfgs(
+    loss_and_grad: Callable[[np.ndarray], tuple[float, np.ndarray]],
+    initial: np.ndarray,
+    max_iterations: int,
+    convergence_tol: float,
+    callback: Callable[[int, float, np.ndarray], "bool | None"] | None = None,
+) -> tuple[np.ndarray, list[float]]:
+    """L-BFGS-B로 최소화하고 (최종 파라미터, 반복별 손실 기록)을 반환.
+
+    손실이 convergence_tol 아래로 내려가거나 callback이 True를 반환하면 그 반복에서 멈춘다.
+    """
+    from scipy.optimize import minimize
+
+    shape = np.shape(initial)
+    history: list[float] = []
+
+    def objective(flat: np.ndarray) -> tuple[float, np.ndarray]:
+        loss, grad = loss_and_grad(flat.reshape(shape))
+        return float(loss), np.asarray(grad, dtype=float).ravel()
+
+    def on_iteration(intermediate_result: Any) -> None:
+        history.append(float(intermediate_result.fun))
+        if history[-1] < convergence_tol:
+            raise StopIteration
+        if callback is not None and callback(len(history), history[-1], intermediate_result.x.reshape(shape)):
+            raise StopIteration
+
+    result = minimize(
+        objective,
+        np.asarray(initial, dtype=float).ravel(),
+        jac=True,
+        method="L-BFGS-B",
+        callback=on_iteration,
+        options={"maxiter": max_iterations},
+    )
+    if not history:
+        history.append(float(result.fun))
+    return result.x.reshape(shape), history
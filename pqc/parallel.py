@@ -0,0 +1,144 @@
+"""게이트 × 모델 계열 × 시드 실험을 프로세스 풀로 병렬 실행."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from importlib import import_module
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+import numpy as np
+
+from pqc.gates import LogicGate
+from pqc.model import PQCConfig
+
+# 계열 이름 → (워크플로 모듈, 학습 함수, 로그 함수, 기본 설정 이름, 모델 클래스)
+_FAMILY_MAP = {
+    "basic": ("pqc.workflow", "train_gate", "log_result", "DEFAULT_CONFIG", "TwoQubitPQC"),
+    "entangled": (
+        "pqc.tangle.workflow",
+        "train_entangled_gate",
+        "log_entangled_result",
+        "DEFAULT_ENTANGLED_CONFIG",
+        "EntangledTwoQubitPQC",
+    ),
+    "angle": (
+        "pqc.angle.workflow",
+        "train_angle_gate",
+        "log_angle_result",
+        "DEFAULT_ANGLE_CONFIG",
+        "AngleEncodedTwoQubitPQC",
+    ),
+}
+
+FAMILIES = tuple(_FAMILY_MAP.keys())
+
+
+def _family_attr(family: str, position: int) -> Any:
+    if family not in _FAMILY_MAP:
+        raise ValueError(f"family는 {'/'.join(FAMILIES)} 중 하나여야 합니다: {family}")
+    entry = _FAMILY_MAP[family]
+    return getattr(import_module(entry[0]), entry[position])
+
+
+def default_config(family: str) -> PQCConfig:
+    """`run_*_experiments`가 쓰는 계열별 기본 설정."""
+    return _family_attr(family, 3)
+
+
+def model_class(family: str) -> type:
+    """계열의 PQC 모델 클래스."""
+    return _family_attr(family, 4)
+
+
+def train_function(family: str) -> Callable[..., Any]:
+    """계열의 `train_*_gate` 함수."""
+    return _family_attr(family, 1)
+
+
+def log_function(family: str) -> Callable[..., None]:
+    """계열의 `log_*_result` 함수."""
+    return _family_attr(family, 2)
+
+
+def derive_seed(base_seed: int, repeat: int) -> int:
+    """반복 번호별 결정적 시드. repeat=0은 설정의 시드를 그대로 써서 순차 실행과 같은 결과를 낸다."""
+    if repeat == 0:
+        return base_seed
+    state = np.random.SeedSequence([base_seed, repeat]).generate_state(1)
+    return int(state[0])
+
+
+@dataclass(frozen=True)
+class ExperimentTask:
+    """워커 하나가 실행할 학습 작업. 프로세스 간 전달을 위해 피클 가능한 값만 담는다."""
+
+    family: str
+    gate: LogicGate
+    config: PQCConfig
+    repeat: int = 0
+
+    def seeded_config(self) -> PQCConfig:
+        return replace(self.config, seed=derive_seed(self.config.seed, self.repeat))
+
+
+def build_tasks(
+    families: Sequence[str] = FAMILIES,
+    gates: Sequence[LogicGate] = tuple(LogicGate),
+    repeats: int = 1,
+    configs: dict[str, PQCConfig] | None = None,
+) -> list[ExperimentTask]:
+    """계열 → 게이트 → 반복 순서의 결정적 작업 목록을 만든다."""
+    configs = configs or {}
+    return [
+        ExperimentTask(family, gate, configs.get(family) or default_config(family), repeat)
+        for family in families
+        for gate in gates
+        for repeat in range(repeats)
+    ]
+
+
+def run_task(task: ExperimentTask) -> Any:
+    """워커 진입점: 작업의 계열에 맞는 `train_*_gate`를 호출한다."""
+    return train_function(task.family)(task.gate, task.seeded_config())
+
+
+def iter_parallel_results(
+    tasks: Sequence[ExperimentTask],
+    max_workers: int | None = None,
+) -> Iterator[tuple[int, Any]]:
+    """완료되는 순서대로 (작업 인덱스, 학습 결과)를 내보낸다."""
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_task, task): index for index, task in enumerate(tasks)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def run_parallel_experiments(
+    tasks: Iterable[ExperimentTask] | None = None,
+    max_workers: int | None = None,
+    on_result: Callable[[ExperimentTask, Any], None] | None = None,
+) -> list[Any]:
+    """작업을 병렬로 실행하고 결과를 작업 순서대로 반환.
+
+    결과는 완료 즉시 `on_result`로 전달되지만, `log_*_result` 출력은 앞선 작업이
+    모두 끝난 시점에 작업 순서대로 내보내므로 워커 수와 무관하게 같은 로그가 나온다.
+    """
+    task_list = list(tasks) if tasks is not None else build_tasks()
+    results: list[Any] = [None] * len(task_list)
+    done = [False] * len(task_list)
+    next_to_log = 0
+
+    for index, result in iter_parallel_results(task_list, max_workers):
+        results[index] = result
+        done[index] = True
+        if on_result is not None:
+            on_result(task_list[index], result)
+        while next_to_log < len(task_list) and done[next_to_log]:
+            task = task_list[next_to_log]
+            log_function(task.family)(results[next_to_log], task.seeded_config())
+            next_to_log += 1
+
+    return results
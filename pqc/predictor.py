@@ -0,0 +1,188 @@
+"""학습된 PQC를 NumPy만으로 돌리는 고속 배치 추론기.
+
+`CompiledPredictor`는 학습이 끝난 파라미터를 고정하고 회로를 미리 계산해 둔다.
+큐비트가 `DENSE_MAX_WIRES`개 이하면 회로 전체의 유니터리 하나로, 그보다 크면 합친 게이트
+열(`pqc.compile`)을 NumPy 엔진으로 묶음 단위 실행한다. 0/1 입력은 입력 패턴별
+확률을 2^k 표에 한 번만 계산해 두고 조회하며, 연속 입력은 행마다 벡터화해 계산한다.
+이 모듈은 PennyLane을 불러오지 않는다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+
+from pqc.compile import rotation_matrix
+from pqc.engine import Operation, StatevectorEngine
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.model import PQCConfig, TwoQubitPQC
+
+# 저장 형식이 바뀌면 올린다.
+PREDICTOR_FORMAT = 1
+
+# 이 큐비트 수까지는 회로 유니터리 (2^n, 2^n)를 미리 계산한다.
+DENSE_MAX_WIRES = 10
+
+# 이 입력 수까지는 0/1 입력 패턴 표(2^k 칸)를 둔다.
+TABLE_MAX_INPUTS = 20
+
+
+def _encode_operations(operations: Sequence[Operation]) -> str:
+    return json.dumps(
+        [[op.name, list(op.wires), [list(term) for term in op.terms], op.offset] for op in operations]
+    )
+
+
+def _decode_operations(payload: str) -> list[Operation]:
+    return [
+        Operation(name, tuple(wires), tuple((int(index), float(coeff)) for index, coeff in terms), float(offset))
+        for name, wires, terms, offset in json.loads(payload)
+    ]
+
+
+class CompiledPredictor:
+    """고정 파라미터 PQC의 NumPy 전용 추론기.
+
+    encoding은 입력 열을 terms 인덱스로 쓰는 와이어별 단일 큐비트 회전이고(`_encoding_operations`),
+    operations는 학습에 쓴 게이트 열(`_engine_operations`)이다.
+    """
+
+    def __init__(
+        self,
+        num_wires: int,
+        encoding: Sequence[Operation],
+        operations: Sequence[Operation],
+        params: np.ndarray,
+        name: str = "",
+        chunk_size: int = 65536,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 합니다.")
+        unsupported = sorted(
+            {op.name for op in encoding if op.name not in {"RX", "RY", "RZ"} or len(op.wires) != 1}
+        )
+        if unsupported:
+            raise ValueError(f"인코딩은 단일 큐비트 RX/RY/RZ만 지원합니다: {', '.join(unsupported)}")
+        self.num_wires = num_wires
+        self.encoding = tuple(encoding)
+        self.operations = tuple(operations)
+        self.params = np.array(params, dtype=float)
+        self.name = name
+        self.chunk_size = chunk_size
+        self.num_inputs = 1 + max((index for op in self.encoding for index, _ in op.terms), default=-1)
+
+        if num_wires == 2:
+            self._engine: Any = StatevectorEngine(self.operations, self.params.shape)
+        else:
+            from pqc.nqubit.engine import TensorStatevectorEngine
+
+            self._engine = TensorStatevectorEngine(self.operations, self.params.shape, num_wires)
+        # 회로 유니터리의 전치 (입력 상태 행 @ _unitary_t = 출력 상태 행)
+        self._unitary_t: np.ndarray | None = None
+        if num_wires <= DENSE_MAX_WIRES:
+            basis = np.eye(1 << num_wires, dtype=complex)
+            self._unitary_t = self._engine.state(basis, self.params).reshape(basis.shape)
+        # ⟨Z0⟩ 관측량의 대각 성분 (0번 와이어가 최상위 비트)
+        self._z0 = np.where(np.arange(1 << num_wires) >> (num_wires - 1) & 1, -1.0, 1.0)
+        self._table = np.full(1 << self.num_inputs, np.nan) if self.num_inputs <= TABLE_MAX_INPUTS else None
+        self._weights = 1 << np.arange(self.num_inputs - 1, -1, -1, dtype=np.int64)
+
+    @classmethod
+    def from_model(
+        cls, model: "TwoQubitPQC", params: np.ndarray | None = None, name: str | None = None
+    ) -> "CompiledPredictor":
+        """모델의 인코딩·게이트 열과 params(생략하면 model.params)로 추론기를 만든다."""
+        return cls(
+            model.num_wires,
+            model._encoding_operations(),
+            model._engine_operations(),
+            np.asarray(model.params if params is None else params, dtype=float),
+            name=name or type(model).__name__,
+        )
+
+    @classmethod
+    def from_result(
+        cls, result: Any, model_cls: type["TwoQubitPQC"], config: "PQCConfig"
+    ) -> "CompiledPredictor":
+        """학습 결과(`result.params`)를 같은 계열·설정의 회로로 컴파일한다."""
+        gate = getattr(result, "gate", None)
+        label = gate.value if gate is not None else str(getattr(result, "function", model_cls.__name__))
+        return cls.from_model(model_cls(config), result.params, name=label)
+
+    def _initial_states(self, rows: np.ndarray) -> np.ndarray:
+        """(M, k) 입력을 인코딩한 곱 상태 (M, 2^n)."""
+        states = np.ones((rows.shape[0], 1), dtype=complex)
+        for wire in range(self.num_wires):
+            single = np.zeros((rows.shape[0], 2), dtype=complex)
+            single[:, 0] = 1.0
+            for op in self.encoding:
+                if op.wires[0] == wire:
+                    angle = op.offset + rows[:, [index for index, _ in op.terms]] @ [c for _, c in op.terms]
+                    single = np.einsum("mab,mb->ma", rotation_matrix(op.name, angle), single)
+            states = (states[:, :, None] * single[:, None, :]).reshape(rows.shape[0], -1)
+        return states
+
+    def _probabilities(self, rows: np.ndarray) -> np.ndarray:
+        """(M, k) 입력의 P(1)을 chunk_size 행씩 계산."""
+        out = np.empty(rows.shape[0])
+        for start in range(0, rows.shape[0], self.chunk_size):
+            states = self._initial_states(rows[start : start + self.chunk_size])
+            if self._unitary_t is not None:
+                expvals = (np.abs(states @ self._unitary_t) ** 2) @ self._z0
+            else:
+                expvals = self._engine.expval(states, self.params)
+            out[start : start + self.chunk_size] = 0.5 * (1.0 - expvals)
+        return out
+
+    def predict_batch(self, bits: np.ndarray) -> np.ndarray:
+        """(N, k) 입력 배치의 P(1) (N,)."""
+        rows = np.asarray(bits, dtype=float).reshape(-1, self.num_inputs)
+        if self._table is not None and np.all((rows == 0.0) | (rows == 1.0)):
+            indices = rows.astype(np.int64) @ self._weights
+            missing = np.unique(indices[np.isnan(self._table[indices])])
+            if missing.size:
+                patterns = (missing[:, None] & self._weights) != 0
+                self._table[missing] = self._probabilities(patterns.astype(float))
+            return self._table[indices]
+        # 연속 입력은 패턴이 거의 겹치지 않아 중복 제거(np.unique)가 직접 계산보다 비싸다.
+        return self._probabilities(rows)
+
+    def predict_labels(self, bits: np.ndarray, threshold: float = 0.5) -> np.ndarray:
+        """(N,) 0/1 예측 (int8)."""
+        return (self.predict_batch(bits) >= threshold).astype(np.int8)
+
+    def save(self, path: str | Path) -> None:
+        """npz 한 파일로 저장. 임시 파일에 쓴 뒤 교체한다."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as handle:
+            np.savez(
+                handle,
+                format=np.array(PREDICTOR_FORMAT),
+                name=np.array(self.name),
+                num_wires=np.array(self.num_wires),
+                encoding=np.array(_encode_operations(self.encoding)),
+                operations=np.array(_encode_operations(self.operations)),
+                params=self.params,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path, chunk_size: int = 65536) -> "CompiledPredictor":
+        with np.load(path) as data:
+            if int(data["format"]) != PREDICTOR_FORMAT:
+                raise ValueError(f"지원하지 않는 추론기 형식입니다: {int(data['format'])} ({path})")
+            return cls(
+                int(data["num_wires"]),
+                _decode_operations(str(data["encoding"])),
+                _decode_operations(str(data["operations"])),
+                data["params"],
+                name=str(data["name"]),
+                chunk_size=chunk_size,
+            )
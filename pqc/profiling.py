@@ -0,0 +1,181 @@
+"""`TwoQubitPQC.fit` 스텝 단위 계측과 JSONL / Chrome trace 내보내기."""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+import numpy as np
+import pennylane as qml
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.model import TwoQubitPQC
+
+
+@dataclass
+class StepProfile:
+    """한 학습 스텝의 계측 값. 시간은 초 단위, start는 프로파일러 생성 시점 기준."""
+
+    run: str
+    step: int
+    loss: float
+    start: float
+    forward: float
+    gradient: float
+    update: float
+    circuit_executions: int
+    tapes: int
+    grad_norm: float
+    peak_memory: int | None
+
+    @property
+    def total(self) -> float:
+        return self.forward + self.gradient + self.update
+
+
+class TrainingProfiler:
+    """`fit(profiler=...)`로 넘기면 스텝마다 `StepProfile`을 기록한다.
+
+    forward/gradient/update 구간 시간, 회로 실행 수(입력 행 단위)와 디바이스가
+    실행한 tape 수, 그라디언트 노름을 기록한다. track_memory=True면 tracemalloc으로
+    스텝별 최대 메모리도 잰다(tracemalloc 자체 비용이 커서 기본은 꺼 둔다).
+    프로파일러를 넘기지 않은 fit은 계측 코드를 전혀 거치지 않는다.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self.records: list[StepProfile] = []
+        self._origin = time.perf_counter()
+        self._run = ""
+        # 실행 이름별로 기록한 스텝 수와, 이름을 주지 않은 세션에 붙인 자동 번호
+        self._steps: dict[str, int] = {}
+        self._sessions = 0
+        self._counter: Callable[[], tuple[int, int]] = lambda: (0, 0)
+
+    @contextmanager
+    def session(self, model: "TwoQubitPQC", run: str | None = None) -> Iterator[None]:
+        """fit 한 번의 계측 구간. PennyLane 경로는 qml.Tracker로 실행 수를 센다."""
+        if run is None:
+            run = f"{type(model).__name__}#{self._sessions}"
+            while run in self._steps:
+                self._sessions += 1
+                run = f"{type(model).__name__}#{self._sessions}"
+            self._sessions += 1
+        self._run = run
+        self._steps.setdefault(run, 0)
+        with ExitStack() as stack:
+            if model.engine is not None:
+                engine = model.engine
+                self._counter = lambda: (engine.executions, 0)
+            else:
+                tracker = stack.enter_context(qml.Tracker(model.dev))
+                self._counter = lambda: (
+                    int(tracker.totals.get("executions", 0)),
+                    int(tracker.totals.get("simulations", 0)),
+                )
+            if self.track_memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                stack.callback(tracemalloc.stop)
+            yield
+
+    def step(
+        self,
+        forward: Callable[[], tuple[Any, Callable[[], Any]]],
+        update: Callable[[Any], Any],
+    ) -> tuple[float, Any]:
+        """forward() → (손실, 그라디언트 함수), update(grad) → 새 파라미터 순서로 실행하며 계측."""
+        executions_before, tapes_before = self._counter()
+        if self.track_memory:
+            tracemalloc.reset_peak()
+
+        t0 = time.perf_counter()
+        loss, grad_fn = forward()
+        t1 = time.perf_counter()
+        grad = grad_fn()
+        t2 = time.perf_counter()
+        params = update(grad)
+        t3 = time.perf_counter()
+
+        executions_after, tapes_after = self._counter()
+        self._steps[self._run] = self._steps.get(self._run, 0) + 1
+        self.records.append(
+            StepProfile(
+                run=self._run,
+                step=self._steps[self._run],
+                loss=float(loss),
+                start=t0 - self._origin,
+                forward=t1 - t0,
+                gradient=t2 - t1,
+                update=t3 - t2,
+                circuit_executions=executions_after - executions_before,
+                tapes=tapes_after - tapes_before,
+                grad_norm=float(np.linalg.norm(np.asarray(grad))),
+                peak_memory=tracemalloc.get_traced_memory()[1] if self.track_memory else None,
+            )
+        )
+        return float(loss), params
+
+    def summary(self) -> dict[str, float]:
+        """스텝 평균 구간 시간(초)과 스텝당 회로 실행 수."""
+        if not self.records:
+            return {}
+        keys = ("forward", "gradient", "update", "circuit_executions", "tapes")
+        summary = {key: float(np.mean([getattr(r, key) for r in self.records])) for key in keys}
+        summary["steps"] = len(self.records)
+        summary["steps_per_sec"] = len(self.records) / sum(r.total for r in self.records)
+        return summary
+
+    def to_jsonl(self, path: str | Path) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            for record in self.records:
+                handle.write(json.dumps(asdict(record)) + "\n")
+
+    def to_chrome_trace(self, path: str | Path) -> None:
+        """chrome://tracing / Perfetto에서 열 수 있는 trace 이벤트 파일."""
+        tids = {run: tid for tid, run in enumerate(dict.fromkeys(record.run for record in self.records))}
+        events: list[dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": 0, "tid": tid, "args": {"name": run}}
+            for run, tid in tids.items()
+        ]
+        for record in self.records:
+            tid = tids[record.run]
+            start = record.start * 1e6
+            events.append(
+                {
+                    "name": f"step {record.step}",
+                    "ph": "X",
+                    "pid": 0,
+                    "tid": tid,
+                    "ts": start,
+                    "dur": record.total * 1e6,
+                    "args": {
+                        "loss": record.loss,
+                        "grad_norm": record.grad_norm,
+                        "circuit_executions": record.circuit_executions,
+                        "tapes": record.tapes,
+                    },
+                }
+            )
+            for phase in ("forward", "gradient", "update"):
+                duration = getattr(record, phase) * 1e6
+                events.append(
+                    {"name": phase, "ph": "X", "pid": 0, "tid": tid, "ts": start, "dur": duration}
+                )
+                start += duration
+            events.append(
+                {
+                    "name": "loss",
+                    "ph": "C",
+                    "pid": 0,
+                    "tid": tid,
+                    "ts": record.start * 1e6,
+                    "args": {record.run: record.loss},
+                }
+            )
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, handle)
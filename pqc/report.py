@@ -1,50 +1,307 @@
+"""학습된 PQC의 Qiskit 회로 보고서.
+
+모델 계열마다 입력과 파라미터를 Qiskit `Parameter`로 둔 템플릿 회로를 한 번만 만들고,
+결과마다 값만 바인딩한다. 템플릿은 모델의 `_encoding_operations`와
+`_engine_operations`에서 만들어지므로 얽힘/각도 인코딩/n-큐비트 앤사츠도 학습에
+쓴 회로 그대로 그려진다. Qiskit은 회로를 실제로 만들 때만 불러온다.
+"""
+
 from __future__ import annotations
 
-from typing import Sequence, Tuple, TYPE_CHECKING
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence, Tuple
 
 import numpy as np
 
-from qiskit import QuantumCircuit
+if TYPE_CHECKING:  # 순환 참조 회피용, Qiskit은 회로를 실제로 그릴 때만 불러온다
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import ParameterExpression
+
+    from pqc.engine import Operation
+    from pqc.model import PQCConfig, TwoQubitPQC
+    from pqc.results import TrainingResult
+
+# `Operation.name` → QuantumCircuit 메서드 (PennyLane과 각도 규약이 같은 게이트만)
+_QISKIT_GATES = {
+    "RX": "rx",
+    "RY": "ry",
+    "RZ": "rz",
+    "IsingXX": "rxx",
+    "IsingYY": "ryy",
+    "IsingZZ": "rzz",
+    "CRX": "crx",
+    "CRY": "cry",
+    "CRZ": "crz",
+    "PauliX": "x",
+    "CNOT": "cx",
+    "CZ": "cz",
+}
+
+
+def _angle_expression(op: "Operation", vector: Sequence[Any]) -> "ParameterExpression | float":
+    if len(op.terms) == 1 and op.terms[0][1] == 1.0 and op.offset == 0.0:
+        return vector[op.terms[0][0]]
+    angle: Any = op.offset
+    for index, coeff in op.terms:
+        angle = angle + coeff * vector[index]
+    return angle
+
+
+class CircuitTemplate:
+    """모델 한 계열·설정의 매개변수화된 회로. 입력 x[w]와 평탄화 파라미터 θ[i]를 값으로 바인딩한다.
+
+    입력을 RX(π·x)로 기저 인코딩하는 모델(`bit_encoded`)은 0/1 입력을 바인딩할 때 인코딩을
+    1인 와이어의 PauliX로 그린다. RX(π)는 X와 전역 위상만 다르므로 같은 회로다.
+    """
+
+    def __init__(self, model: "TwoQubitPQC", name: str | None = None):
+        from qiskit import QuantumCircuit
+        from qiskit.circuit import ParameterVector
+
+        self.name = name or type(model).__name__
+        self.param_shape = tuple(model.params.shape)
+        self.num_wires = model.num_wires
+        self.weights = ParameterVector("θ", int(np.prod(self.param_shape)))
+        self.inputs = ParameterVector("x", self.num_wires)
+
+        encoding = model._encoding_operations()
+        self.bit_encoded = all(
+            op.name == "RX" and op.terms == ((op.wires[0], np.pi),) and op.offset == 0.0 for op in encoding
+        )
+        ansatz = QuantumCircuit(self.num_wires, 1, name=self.name)
+        for op in model._engine_operations():
+            self._append(ansatz, op, self.weights)
+        ansatz.barrier()
+        ansatz.measure(0, 0)
+        circuit = QuantumCircuit(self.num_wires, 1, name=self.name)
+        for op in encoding:
+            self._append(circuit, op, self.inputs)
+        circuit.barrier()
+        self.circuit = circuit.compose(ansatz)
+        self._ansatz = ansatz
+
+        # circuit.parameters 순서에 맞춰 [θ..., x...] 값 배열을 재배열할 인덱스
+        position = {param: index for index, param in enumerate([*self.weights, *self.inputs])}
+        self._order = np.array([position[param] for param in self.circuit.parameters], dtype=int)
+        self._weight_order = np.array([position[param] for param in ansatz.parameters], dtype=int)
+
+    @staticmethod
+    def _append(circuit: "QuantumCircuit", op: "Operation", vector: Sequence[Any]) -> None:
+        if op.name not in _QISKIT_GATES:
+            raise ValueError(f"Qiskit 보고서가 지원하지 않는 게이트입니다: {op.name}")
+        gate = getattr(circuit, _QISKIT_GATES[op.name])
+        if op.parametric:
+            gate(_angle_expression(op, vector), *op.wires)
+        else:
+            gate(*op.wires)
+
+    def bind(self, params: np.ndarray, inputs: Sequence[float]) -> "QuantumCircuit":
+        return self.bind_many(params, inputs)[0]
+
+    def bind_many(self, params: np.ndarray, inputs: Sequence[float]) -> list["QuantumCircuit"]:
+        """(G, …) 파라미터 배치를 같은 입력으로 한꺼번에 바인딩.
+
+        회로 순서로 재배열한 (G, 매개변수 수) 값 배열을 한 번에 만들고 회로마다 대입만 한다.
+        """
+        from qiskit import QuantumCircuit
+
+        flat = np.asarray(params, dtype=float).reshape(-1, len(self.weights))
+        bits = np.asarray(inputs, dtype=float)
+        if self.bit_encoded and np.all((bits == 0.0) | (bits == 1.0)):
+            prefix = QuantumCircuit(self.num_wires, 1, name=self.name)
+            for wire in np.flatnonzero(bits):
+                prefix.x(int(wire))
+            prefix.barrier()
+            return [prefix.compose(self._ansatz.assign_parameters(row)) for row in flat[:, self._weight_order]]
+        values = np.concatenate([flat, np.broadcast_to(bits, (len(flat), len(bits)))], axis=1)[:, self._order]
+        return [self.circuit.assign_parameters(row) for row in values]
+
 
-if TYPE_CHECKING:  # 순환 참조 회피용
-    from pqc.workflow import TrainingResult
+def _label(result: Any) -> str:
+    gate = getattr(result, "gate", None)
+    return gate.value if gate is not None else str(getattr(result, "function", "result"))
 
 
-def _basis_encode(circuit: QuantumCircuit, inputs: Sequence[int]) -> None:
-    for wire, bit in enumerate(inputs):
-        if int(bit):
-            circuit.x(wire)
+def _titled(label: str, inputs: Sequence[float], diagram: str) -> str:
+    return f"[{label}] Qiskit 회로 시각화 (입력 {tuple(inputs)})\n{diagram}"
 
 
-def _ansatz_layers(circuit: QuantumCircuit, params: np.ndarray) -> None:
-    for block in range(params.shape[0]):
-        for wire in range(2):
-            theta, phi, lam = params[block, wire]
-            circuit.ry(theta, wire)
-            circuit.rz(phi, wire)
-            circuit.ry(lam, wire)
+class ReportEngine:
+    """템플릿과 그린 회로도를 캐시하는 보고서 생성기.
+
+    템플릿은 (모델 클래스, 설정)마다 한 번 만들고, 회로도 텍스트는 (템플릿, 반올림한
+    파라미터, 입력)을 키로 최대 max_diagrams개까지 LRU로 보관한다.
+    """
+
+    def __init__(self, max_diagrams: int = 512, fold: int = 120, decimals: int = 6):
+        self.max_diagrams = max_diagrams
+        self.fold = fold
+        self.decimals = decimals
+        self._templates: dict[tuple[type, Any], CircuitTemplate] = {}
+        self._diagrams: OrderedDict[tuple[int, bytes, tuple[float, ...]], str] = OrderedDict()
+
+    def template(self, model_cls: type["TwoQubitPQC"], config: "PQCConfig") -> CircuitTemplate:
+        key = (model_cls, config)
+        if key not in self._templates:
+            self._templates[key] = CircuitTemplate(model_cls(config))
+        return self._templates[key]
+
+    def _cached(self, key: tuple[int, bytes, tuple[float, ...]]) -> str | None:
+        if key not in self._diagrams:
+            return None
+        self._diagrams.move_to_end(key)
+        return self._diagrams[key]
+
+    def _store(self, key: tuple[int, bytes, tuple[float, ...]], text: str) -> str:
+        self._diagrams[key] = text
+        if len(self._diagrams) > self.max_diagrams:
+            self._diagrams.popitem(last=False)
+        return text
+
+    def diagram(
+        self,
+        template: CircuitTemplate,
+        params: np.ndarray | None = None,
+        inputs: Sequence[float] | None = None,
+    ) -> str:
+        """바인딩한 회로도 텍스트. params/inputs를 모두 생략하면 기호 템플릿을 그린다."""
+        if params is not None or inputs is not None:
+            return self.diagrams(
+                template,
+                np.zeros(template.param_shape) if params is None else params,
+                np.zeros(template.num_wires) if inputs is None else inputs,
+            )[0]
+        key = (id(template), b"", ())
+        text = self._cached(key)
+        if text is None:
+            text = self._store(key, str(template.circuit.draw(output="text", fold=self.fold)))
+        return text
+
+    def diagrams(self, template: CircuitTemplate, params: np.ndarray, inputs: Sequence[float]) -> list[str]:
+        """(G, …) 파라미터 배치를 같은 입력으로 바인딩한 회로도 텍스트 G개.
+
+        캐시에 없는 것만 모아 `CircuitTemplate.bind_many`로 한꺼번에 바인딩해 그린다.
+        """
+        rounded = np.round(np.asarray(params, dtype=float), self.decimals).reshape((-1,) + template.param_shape)
+        bits = tuple(float(bit) for bit in inputs)
+        keys = [(id(template), row.tobytes(), bits) for row in rounded]
+        texts = [self._cached(key) for key in keys]
+        missing = [index for index, text in enumerate(texts) if text is None]
+        if missing:
+            for index, circuit in zip(missing, template.bind_many(rounded[missing], inputs)):
+                texts[index] = self._store(keys[index], str(circuit.draw(output="text", fold=self.fold)))
+        return texts
+
+    def render(
+        self,
+        result: Any,
+        model_cls: type["TwoQubitPQC"],
+        config: "PQCConfig",
+        inputs: Sequence[float] = (1, 1),
+    ) -> str:
+        template = self.template(model_cls, config)
+        return _titled(_label(result), inputs, self.diagram(template, result.params, inputs))
+
+    def write_reports(
+        self,
+        results: Sequence[Any],
+        directory: str | Path,
+        model_cls: type["TwoQubitPQC"],
+        config: "PQCConfig",
+        inputs: Sequence[float] = (1, 1),
+        bind_diagrams: bool = False,
+    ) -> list[Path]:
+        """결과 묶음의 보고서를 파일로 쓰고 결과별 파일 경로를 반환.
+
+        `template.txt`에 기호 회로도를 한 번 그리고, 결과마다 `<라벨>.txt`에 손실·정확도와
+        θ 인덱스별 학습 파라미터 표를 쓴다. 같은 라벨이 반복되면 `<라벨>-2.txt`처럼 번호를
+        붙인다. bind_diagrams=True면 결과 묶음의 파라미터를 `diagrams`로 한꺼번에 바인딩해
+        결과별 파일에 회로도도 넣는다(결과 수만큼 그리므로 느리다). `index.json`에는 결과
+        요약과 파일 이름을 모은다.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        template = self.template(model_cls, config)
+        (directory / "template.txt").write_text(
+            f"{template.name} ({type(config).__name__})\n{self.diagram(template)}\n", encoding="utf-8"
+        )
+
+        diagrams: list[str] = []
+        if bind_diagrams and results:
+            diagrams = self.diagrams(template, np.stack([np.asarray(result.params) for result in results]), inputs)
+
+        paths: list[Path] = []
+        index: list[dict[str, Any]] = []
+        seen: dict[str, int] = {}
+        for row, result in enumerate(results):
+            label = _label(result)
+            seen[label] = seen.get(label, 0) + 1
+            stem = label if seen[label] == 1 else f"{label}-{seen[label]}"
+            params = np.asarray(result.params, dtype=float)
+            lines = [
+                f"[{label}] {template.name}",
+                f"최종 손실: {result.final_loss:.6f}",
+                f"정확도: {result.accuracy * 100:.1f}%",
+                "",
+                "θ 인덱스 (block, wire, slot) 값",
+            ]
+            for flat_index, position in enumerate(np.ndindex(params.shape)):
+                lines.append(f"θ[{flat_index}] {position} {params[position]:+.6f}")
+            if bind_diagrams:
+                lines += ["", _titled(label, inputs, diagrams[row])]
+            path = directory / f"{stem}.txt"
+            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            paths.append(path)
+            index.append(
+                {
+                    "label": label,
+                    "file": path.name,
+                    "final_loss": float(result.final_loss),
+                    "accuracy": float(result.accuracy),
+                }
+            )
+        (directory / "index.json").write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8")
+        return paths
+
+
+_default_engine: ReportEngine | None = None
+
+
+def default_report_engine() -> ReportEngine:
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = ReportEngine()
+    return _default_engine
 
 
 def build_quantum_circuit(
     params: np.ndarray,
     inputs: Sequence[int],
     circuit_name: str = "TwoQubitPQC",
-) -> QuantumCircuit:
-    circuit = QuantumCircuit(2, 1, name=circuit_name)
-    _basis_encode(circuit, inputs)
-    _ansatz_layers(circuit, params)
-    circuit.barrier()
-    circuit.measure(0, 0)
+) -> "QuantumCircuit":
+    """비얽힘 PQC의 템플릿에 params와 inputs를 바인딩한 회로."""
+    from pqc.model import PQCConfig, TwoQubitPQC
+
+    params = np.asarray(params, dtype=float)
+    template = default_report_engine().template(TwoQubitPQC, PQCConfig(num_blocks=params.shape[0]))
+    circuit = template.bind(params, inputs)
+    circuit.name = circuit_name
     return circuit
 
 
 def display_qiskit_report(
     result: "TrainingResult",
     inputs: Tuple[int, int] = (1, 1),
+    model_cls: type["TwoQubitPQC"] | None = None,
+    config: "PQCConfig | None" = None,
 ) -> None:
-    params = np.asarray(result.params, dtype=float)
-    circuit = build_quantum_circuit(params, inputs, circuit_name=f"{result.gate.value}_PQC")
-    diagram = circuit.draw(output="text", fold=120)
-    print(f"\n[{result.gate.value}] Qiskit 회로 시각화 (입력 {inputs})")
-    print(diagram)
+    """결과의 회로도를 출력. model_cls/config를 생략하면 비얽힘 PQC로 간주한다."""
+    if model_cls is None or config is None:
+        from pqc.model import PQCConfig, TwoQubitPQC
 
+        model_cls = model_cls or TwoQubitPQC
+        config = config or PQCConfig(num_blocks=np.shape(result.params)[0])
+    print()
+    print(default_report_engine().render(result, model_cls, config, inputs))
@@ -0,0 +1,282 @@
+"""모든 PQC 계열이 함께 쓰는 학습 결과 타입과 열 단위(columnar) 보관소.
+
+`TrainingResult`는 `__slots__`와 NumPy 배열만으로 이루어져 있어 autograd 텐서를
+붙잡지 않고, 피클 크기도 작다. 많은 결과는 `save_results`로 열마다 `.npy` 파일 하나씩
+쓰고, `ResultArchive`로 memory-map해서 필요한 열·행만 읽는다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.gates import LogicGate
+
+# 보관소 형식이 바뀌면 올린다.
+ARCHIVE_FORMAT = 1
+
+
+class TrainingResult:
+    """학습 한 번의 결과.
+
+    gate는 논리 게이트 학습일 때만 있고, function은 결과 이름(게이트면 gate.value)이다.
+    손실 기록은 max_steps 크기로 미리 잡은 배열에 담고 `loss_history`는 실제 스텝
+    수만큼의 뷰를 돌려준다. probabilities/predictions/targets는 진리표 행 순서다
+    (n-입력 함수처럼 행별 출력을 두지 않는 결과는 빈 배열). seed는 params의 출발점
+    시드로, 다중 시작이면 이긴 시작점의 것이고 warm-start처럼 시드가 없으면 None이다.
+    total_shots는 학습에 쓴 회로 샷 수다(샷을 세는 rosalin 학습만, 아니면 0).
+    """
+
+    __slots__ = (
+        "gate",
+        "function",
+        "num_inputs",
+        "final_loss",
+        "accuracy",
+        "converged",
+        "params",
+        "probabilities",
+        "predictions",
+        "targets",
+        "num_steps",
+        "seed",
+        "total_shots",
+        "_losses",
+    )
+
+    def __init__(
+        self,
+        function: str,
+        num_inputs: int,
+        final_loss: float,
+        accuracy: float,
+        converged: bool,
+        params: Any,
+        loss_history: Sequence[float] | np.ndarray,
+        max_steps: int | None = None,
+        probabilities: Any = (),
+        predictions: Any = (),
+        targets: Any = (),
+        gate: "LogicGate | None" = None,
+        seed: int | None = None,
+        total_shots: int = 0,
+    ):
+        self.gate = gate
+        self.seed = None if seed is None else int(seed)
+        self.total_shots = int(total_shots)
+        self.function = function
+        self.num_inputs = int(num_inputs)
+        self.final_loss = float(final_loss)
+        self.accuracy = float(accuracy)
+        self.converged = bool(converged)
+        # np.array(qnp.tensor, dtype=float)는 autograd 정보가 없는 일반 ndarray를 만든다.
+        self.params = np.array(params, dtype=float)
+        self.probabilities = np.array(probabilities, dtype=float)
+        self.predictions = np.array(predictions, dtype=np.int8)
+        self.targets = np.array(targets, dtype=np.int8)
+        history = np.asarray(loss_history, dtype=float)
+        self.num_steps = len(history)
+        self._losses = np.full(max(max_steps or 0, self.num_steps), np.nan)
+        self._losses[: self.num_steps] = history
+
+    @classmethod
+    def for_gate(
+        cls,
+        gate: "LogicGate",
+        params: Any,
+        probabilities: Sequence[float] | np.ndarray,
+        targets: Sequence[float] | np.ndarray,
+        loss_history: Sequence[float],
+        max_steps: int,
+        convergence_tol: float,
+        seed: int | None = None,
+        total_shots: int = 0,
+    ) -> "TrainingResult":
+        """게이트 진리표의 확률·정답과 손실 기록으로 예측·정확도·수렴 여부까지 채운 결과."""
+        probabilities = np.asarray(probabilities, dtype=float)
+        targets = np.asarray(targets, dtype=float)
+        predictions = (probabilities >= 0.5).astype(np.int8)
+        final_loss = loss_history[-1] if len(loss_history) else float("inf")
+        return cls(
+            function=gate.value,
+            num_inputs=2,
+            final_loss=final_loss,
+            accuracy=float(np.mean(predictions == targets)),
+            converged=final_loss < convergence_tol,
+            params=params,
+            loss_history=loss_history,
+            max_steps=max_steps,
+            probabilities=probabilities,
+            predictions=predictions,
+            targets=targets,
+            gate=gate,
+            seed=seed,
+            total_shots=total_shots,
+        )
+
+    @property
+    def loss_history(self) -> np.ndarray:
+        return self._losses[: self.num_steps]
+
+    @property
+    def max_steps(self) -> int:
+        return len(self._losses)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = {name: getattr(self, name) for name in self.__slots__ if name != "_losses"}
+        state["loss_history"] = self.loss_history.copy()
+        state["max_steps"] = self.max_steps
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        history = state.pop("loss_history")
+        max_steps = state.pop("max_steps")
+        state.setdefault("seed", None)
+        state.setdefault("total_shots", 0)
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._losses = np.full(max(max_steps, len(history)), np.nan)
+        self._losses[: len(history)] = history
+
+    def __repr__(self) -> str:
+        return (
+            f"TrainingResult({self.function!r}, final_loss={self.final_loss:.6g}, "
+            f"accuracy={self.accuracy:.3f}, converged={self.converged}, steps={self.num_steps})"
+        )
+
+
+# 행마다 길이가 다른 배열 열: (열 이름, dtype)
+_RAGGED_COLUMNS = (
+    ("params", np.float64),
+    ("loss_history", np.float64),
+    ("probabilities", np.float64),
+    ("predictions", np.int8),
+    ("targets", np.int8),
+)
+
+
+def _ragged(values: Iterable[np.ndarray], dtype: Any) -> tuple[np.ndarray, np.ndarray]:
+    """배열 목록을 (이어 붙인 값, 길이 N+1의 오프셋)으로."""
+    arrays = [np.asarray(value, dtype=dtype).ravel() for value in values]
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum([array.size for array in arrays], out=offsets[1:])
+    flat = np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+    return flat, offsets
+
+
+def save_results(path: str | Path, results: Sequence[TrainingResult]) -> Path:
+    """결과 묶음을 path 디렉터리에 열 단위 `.npy` 파일로 저장.
+
+    스칼라 필드는 길이 N 열로, params·손실 기록 같은 배열 필드는 값 열과 오프셋 열
+    쌍으로 쓴다. 임시 디렉터리에 모두 쓴 뒤 교체하므로 중간에 멈춰도 이전 보관소가 남는다.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    tmp_path.mkdir(parents=True)
+
+    param_ndim = max((result.params.ndim for result in results), default=0)
+    columns: dict[str, np.ndarray] = {
+        "function": np.array([result.function for result in results], dtype=str),
+        "gate": np.array([result.gate.value if result.gate is not None else "" for result in results], dtype=str),
+        "num_inputs": np.array([result.num_inputs for result in results], dtype=np.int32),
+        "final_loss": np.array([result.final_loss for result in results], dtype=np.float64),
+        "accuracy": np.array([result.accuracy for result in results], dtype=np.float64),
+        "converged": np.array([result.converged for result in results], dtype=bool),
+        "num_steps": np.array([result.num_steps for result in results], dtype=np.int32),
+        "max_steps": np.array([result.max_steps for result in results], dtype=np.int32),
+        # 시드가 없는 결과는 -1
+        "seed": np.array([-1 if result.seed is None else result.seed for result in results], dtype=np.int64),
+        "total_shots": np.array([result.total_shots for result in results], dtype=np.int64),
+        "params_shape": np.array(
+            [(1,) * (param_ndim - result.params.ndim) + result.params.shape for result in results], dtype=np.int32
+        ).reshape(len(results), param_ndim),
+    }
+    for name, dtype in _RAGGED_COLUMNS:
+        values, offsets = _ragged((getattr(result, name) for result in results), dtype)
+        columns[f"{name}_values"] = values
+        columns[f"{name}_offsets"] = offsets
+
+    for name, column in columns.items():
+        np.save(tmp_path / f"{name}.npy", column)
+    meta = {"format": ARCHIVE_FORMAT, "rows": len(results), "columns": sorted(columns)}
+    (tmp_path / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+    if path.exists():
+        shutil.rmtree(path)
+    os.replace(tmp_path, path)
+    return path
+
+
+class ResultArchive:
+    """`save_results`로 쓴 보관소를 memory-map으로 여는 읽기 전용 뷰.
+
+    `column(name)`은 스칼라 열 전체를, `archive[i]`는 i번째 결과를 `TrainingResult`로
+    만들어 돌려준다. 파일 내용은 실제로 접근한 부분만 읽힌다.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        meta = json.loads((self.path / "meta.json").read_text(encoding="utf-8"))
+        if meta["format"] != ARCHIVE_FORMAT:
+            raise ValueError(f"지원하지 않는 결과 보관소 형식입니다: {meta['format']} ({self.path})")
+        self._rows = int(meta["rows"])
+        self._columns = {
+            name: np.load(self.path / f"{name}.npy", mmap_mode="r", allow_pickle=False) for name in meta["columns"]
+        }
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in self._columns:
+            raise KeyError(f"보관소에 없는 열입니다: {name}")
+        return self._columns[name]
+
+    def array(self, name: str, index: int) -> np.ndarray:
+        """index번째 결과의 배열 필드(params, loss_history, …) 뷰."""
+        offsets = self.column(f"{name}_offsets")
+        values = self.column(f"{name}_values")[offsets[index] : offsets[index + 1]]
+        if name == "params":
+            return values.reshape(tuple(self.column("params_shape")[index]))
+        return values
+
+    def __getitem__(self, index: int) -> TrainingResult:
+        if not -self._rows <= index < self._rows:
+            raise IndexError(f"결과 인덱스 범위를 벗어났습니다: {index}")
+        index %= self._rows
+        gate_value = str(self.column("gate")[index])
+        gate = None
+        if gate_value:
+            from pqc.gates import LogicGate
+
+            gate = LogicGate(gate_value)
+        # seed·total_shots 열이 생기기 전에 쓴 보관소에는 열이 없다.
+        seed = int(self._columns["seed"][index]) if "seed" in self._columns else -1
+        total_shots = int(self._columns["total_shots"][index]) if "total_shots" in self._columns else 0
+        return TrainingResult(
+            function=str(self.column("function")[index]),
+            num_inputs=int(self.column("num_inputs")[index]),
+            final_loss=float(self.column("final_loss")[index]),
+            accuracy=float(self.column("accuracy")[index]),
+            converged=bool(self.column("converged")[index]),
+            params=self.array("params", index),
+            loss_history=self.array("loss_history", index),
+            max_steps=int(self.column("max_steps")[index]),
+            probabilities=self.array("probabilities", index),
+            predictions=self.array("predictions", index),
+            targets=self.array("targets", index),
+            gate=gate,
+            seed=None if seed < 0 else seed,
+            total_shots=total_shots,
+        )
+
+    def __iter__(self) -> Iterator[TrainingResult]:
+        for index in range(self._rows):
+            yield self[index]
@@ -0,0 +1,232 @@
+"""유한 샷 측정으로 샷을 아껴 쓰는 학습 (`PQCConfig.optimizer="rosalin"`).
+
+iCANS(Kübler et al., 2020)처럼 그라디언트 성분마다 샷 수를 따로 정한다. 성분 i의
+다음 샷 수는 지수 이동 평균한 그라디언트 ḡ_i와 단일 샷 분산 ξ_i로
+s_i = ⌈2Lα/(2 − Lα) · ξ_i / (ḡ_i² + bμ^k)⌉ 이며, 그라디언트가 작아질수록(손실이 바닥에
+가까울수록) 샷이 늘어난다. Rosalin처럼 한 성분의 샷은 손실 가중치 |∂L/∂E_n|와 게이트 계수에
+비례하는 확률로 (게이트, 입력) 칸에 나눠 뽑으므로, 진리표 입력 전체를 한 묶음으로 측정한다.
+
+그라디언트 샷 하나는 게이트 각도를 ±π/2 옮긴 회로(매개변수 이동 규칙)를 한 번씩 재는 것이고,
+손실은 이동하지 않은 회로를 입력마다 같은 샷 수로 잰다. 손실 샷 수는 손실 추정의 표준오차가
+convergence_tol과의 거리의 절반(`LOSS_RESOLUTION`)이 되도록 정하므로 수렴 기준에 가까울수록 늘어난다.
+
+pennylane 백엔드는 설정한 장치(`model.dev`와 같은 종류, config.seed로 시드를 준 복제본)에서
+회로마다 정한 샷 수로 `qml.sample`을 실제로 실행한다. 장치 없이 해석적 기대값만 내는
+numpy/fourier 백엔드는 NumPy 엔진의 정확한 확률에서 이항·다항 분포로 측정값을 뽑는
+샘플링 잡음 시뮬레이션이며, 샷 시뮬레이터와 같은 통계를 낸다.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pennylane as qml
+
+from pqc.compile import operation_angle
+from pqc.engine import Operation
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.model import TwoQubitPQC
+
+# iCANS 이동 평균 계수 μ와 분모 안정화 항 b
+SHOT_MOMENTUM = 0.99
+SHOT_BIAS = 1e-6
+
+# 한 스텝에서 성분 하나·입력 하나에 쓰는 샷 상한 (손실이 바닥에서 0에 가까운 그라디언트를 쫓지 않도록)
+MAX_SHOTS = 10**6
+
+# 손실 추정의 입력당 최소 샷 수. 표준오차 목표는 max(|L − tol|, LOSS_FLOOR · tol) / LOSS_RESOLUTION.
+MIN_LOSS_SHOTS = 16
+LOSS_RESOLUTION = 2.0
+LOSS_FLOOR = 0.5
+
+
+class ShotFrugalOptimizer:
+    """모델 하나의 (N, …) 입력 묶음에 대한 Rosalin/iCANS 최적화기.
+
+    `estimate_loss` → `estimate_gradient` → `apply_grad` 순으로 한 스텝을 진행하며,
+    지금까지 쓴 회로 샷 수를 `shots_used`에 더한다.
+    """
+
+    def __init__(self, model: "TwoQubitPQC", features: np.ndarray, targets: np.ndarray):
+        config = model.config
+        self.model = model
+        self.learning_rate = config.learning_rate
+        self.lipschitz = config.shot_lipschitz if config.shot_lipschitz is not None else 1.0 / config.learning_rate
+        self.min_shots = config.min_shots
+        self.tol = config.convergence_tol
+        self.rng = np.random.default_rng((config.seed, 1))
+        self.features = np.asarray(features, dtype=float)
+        self.states = model._engine_initial_states(self.features)
+        self.targets = np.asarray(targets, dtype=float)
+        self.param_shape = tuple(model.params.shape)
+        num_params = int(np.prod(self.param_shape))
+
+        # 학습 게이트마다 각도 슬롯 하나를 덧붙인 회로: 슬롯 값을 ±π/2로 두면 그 게이트만 이동한다.
+        operations: list[Operation] = []
+        trainable: list[Operation] = []
+        for op in model._engine_operations():
+            if op.parametric and op.terms:
+                op = Operation(op.name, op.wires, op.terms + ((num_params + len(trainable), 1.0),), op.offset)
+                trainable.append(op)
+            operations.append(op)
+        self.operations = operations
+        # pennylane 백엔드는 장치에서 샘플링하고, 나머지는 엔진의 정확한 확률에서 뽑는다.
+        self.qnode: qml.QNode | None = None
+        self.engine = None
+        if config.backend == "pennylane":
+            device = qml.device(model.dev.name, wires=model.num_wires, seed=np.random.default_rng((config.seed, 2)))
+            self.qnode = qml.QNode(self._sample_circuit, device, diff_method=None)
+        else:
+            self.engine = model._build_engine(operations, (num_params + len(trainable),))
+        self.num_params = num_params
+        self.num_gates = len(trainable)
+
+        # 성분 i의 (게이트, 계수) 목록을 (P, J) 배열로. 빈 칸은 계수 0.
+        slots: list[list[tuple[int, float]]] = [[] for _ in range(num_params)]
+        for gate, op in enumerate(trainable):
+            for index, coeff in op.terms[:-1]:
+                slots[index].append((gate, coeff))
+        width = max(1, max(len(entries) for entries in slots))
+        self._gates = np.zeros((num_params, width), dtype=int)
+        self._coeffs = np.zeros((num_params, width))
+        for index, entries in enumerate(slots):
+            for slot, (gate, coeff) in enumerate(entries):
+                self._gates[index, slot] = gate
+                self._coeffs[index, slot] = coeff
+
+        self.shots = np.full(num_params, self.min_shots, dtype=np.int64)
+        self.loss_shots = max(self.min_shots, MIN_LOSS_SHOTS)
+        self.shots_used = 0
+        self._mean_grad = np.zeros(num_params)
+        self._mean_var = np.zeros(num_params)
+        self._step = 0
+        self._probs: np.ndarray | None = None
+        self._expvals: np.ndarray | None = None
+        self._shifted: np.ndarray | None = None
+
+    def _sample_circuit(self, inputs: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """인코딩 뒤 각도 슬롯을 덧붙인 게이트 열을 실행하고 ⟨Z0⟩ 측정값(±1)을 샷마다 반환."""
+        for op in self.model._encoding_operations():
+            getattr(qml, op.name)(operation_angle(op, inputs), wires=op.wires)
+        for op in self.operations:
+            if op.parametric:
+                getattr(qml, op.name)(operation_angle(op, params), wires=op.wires)
+            else:
+                getattr(qml, op.name)(wires=op.wires)
+        return qml.sample(qml.PauliZ(0))
+
+    def _shifted_params(self, params: np.ndarray) -> np.ndarray:
+        """(2K+1, P+K) 파라미터 묶음: 0행은 이동 없음, 1+2k/2+2k행은 게이트 k를 +π/2/−π/2 이동."""
+        base = np.concatenate([np.asarray(params, dtype=float).ravel(), np.zeros(self.num_gates)])
+        batch = np.tile(base, (2 * self.num_gates + 1, 1))
+        for gate in range(self.num_gates):
+            batch[1 + 2 * gate, self.num_params + gate] = 0.5 * np.pi
+            batch[2 + 2 * gate, self.num_params + gate] = -0.5 * np.pi
+        return batch
+
+    def _measure_ones(self, shots: int) -> np.ndarray:
+        """이동하지 않은 회로를 입력마다 shots번 재서 1(⟨Z0⟩ = −1)이 나온 횟수 (N,)."""
+        if self.qnode is None:
+            return self.rng.binomial(shots, 0.5 * (1.0 - self._expvals[0]))
+        samples = qml.set_shots(self.qnode, shots=shots)(self.features, self._shifted[0])
+        return np.sum(np.asarray(samples).reshape(len(self.features), shots) < 0, axis=1)
+
+    def _measure_shifts(self, counts: np.ndarray, gates: np.ndarray) -> np.ndarray:
+        """칸 (a, j, n)마다 counts번 잰 (z₊ − z₋)/2의 +1/0/−1 횟수 (A, J, N, 3).
+
+        gates[a, j]는 칸이 이동하는 게이트다. 장치에서는 (게이트, 입력)마다 두 이동 회로를
+        칸들의 샷 합만큼 한 번에 재고, 샷 순서대로 칸에 나눠 준다.
+        """
+        if self.qnode is None:
+            plus = 0.5 * (1.0 + self._expvals[1::2][gates])  # (A, J, N) P(z₊ = +1)
+            minus = 0.5 * (1.0 + self._expvals[2::2][gates])
+            outcome = np.stack([plus * (1.0 - minus), plus * minus + (1.0 - plus) * (1.0 - minus), (1.0 - plus) * minus], -1)
+            return self.rng.multinomial(counts, outcome)
+        tally = np.zeros(counts.shape + (3,), dtype=np.int64)
+        for gate in np.unique(gates):
+            cells = np.argwhere(gates == gate)
+            for row, bits in enumerate(self.features):
+                cell_counts = counts[cells[:, 0], cells[:, 1], row]
+                total = int(cell_counts.sum())
+                if total == 0:
+                    continue
+                shifted = self._shifted[1 + 2 * gate : 3 + 2 * gate]
+                samples = np.asarray(qml.set_shots(self.qnode, shots=total)(bits, shifted)).reshape(2, total)
+                values = (samples[0] - samples[1]) / 2.0
+                bounds = np.concatenate([[0], np.cumsum(cell_counts)])
+                for (a, j), start, stop in zip(cells, bounds[:-1], bounds[1:]):
+                    tally[a, j, row, 0] = np.sum(values[start:stop] > 0)
+                    tally[a, j, row, 2] = np.sum(values[start:stop] < 0)
+        tally[..., 1] = counts - tally[..., 0] - tally[..., 2]
+        return tally
+
+    def estimate_loss(self, params: np.ndarray) -> tuple[float, float]:
+        """입력마다 loss_shots번 재서 (손실 추정, 표준오차)를 반환하고 다음 손실 샷 수를 정한다.
+
+        p̂(1 − p̂)/(n − 1)을 빼서 유한 샷 때문에 생기는 손실의 양의 치우침을 없앤다.
+        """
+        self._shifted = self._shifted_params(params)
+        if self.engine is not None:
+            self._expvals = self.engine.expval(self.states, self._shifted)
+        n = self.loss_shots
+        ones = self._measure_ones(n)
+        probs = ones / n
+        self._probs = probs
+        self.shots_used += n * len(probs)
+        num_rows = len(probs)
+        loss = float(np.mean((probs - self.targets) ** 2 - probs * (1.0 - probs) / (n - 1)))
+        # 분산 근사에는 0/1로 몰린 추정이 분산 0이 되지 않도록 (k+1)/(n+2)를 쓴다.
+        smoothed = (ones + 1.0) / (n + 2.0)
+        variance = float(np.sum((2.0 * (smoothed - self.targets) / num_rows) ** 2 * smoothed * (1.0 - smoothed)))
+        stderr = float(np.sqrt(variance / n))
+        target = max(abs(loss - self.tol), LOSS_FLOOR * self.tol) / LOSS_RESOLUTION
+        self.loss_shots = int(np.clip(np.ceil(variance / target**2), max(self.min_shots, MIN_LOSS_SHOTS), MAX_SHOTS))
+        return loss, stderr
+
+    def estimate_gradient(self) -> np.ndarray:
+        """직전 `estimate_loss`의 파라미터에서 성분별 shots[i]번으로 그라디언트를 추정.
+
+        ∂L/∂θ_i = Σ_n w_n Σ_j c_ij ∂E_n/∂φ_j (w_n = −(p_n − y_n)/N)이므로 샷마다 (게이트 j, 입력 n)을
+        |c_ij w_n|에 비례해 뽑고, 이동한 두 회로의 측정값 차 (z₊ − z₋)/2에 부호와 정규화 상수
+        M_i = Σ|c_ij w_n|를 곱한 것이 불편 추정값이다. 샷별 값의 표본 분산으로 iCANS 샷 수를 갱신한다.
+        """
+        weights = -(self._probs - self.targets) / len(self.targets)
+        cells = self._coeffs[:, :, None] * weights[None, None, :]  # (P, J, N)
+        scale = np.sum(np.abs(cells), axis=(1, 2))
+        grad = np.zeros(self.num_params)
+        variance = np.zeros(self.num_params)
+        active = scale > 0
+        if np.any(active):
+            pvals = np.abs(cells[active]).reshape(int(active.sum()), -1) / scale[active, None]
+            counts = self.rng.multinomial(self.shots[active], pvals).reshape(cells[active].shape)
+            tally = self._measure_shifts(counts, self._gates[active])
+            signs = np.sign(cells[active])
+            shots = self.shots[active].astype(float)
+            total = scale[active] * np.sum(signs * (tally[..., 0] - tally[..., 2]), axis=(1, 2))
+            squares = scale[active] ** 2 * np.sum(tally[..., 0] + tally[..., 2], axis=(1, 2))
+            grad[active] = total / shots
+            variance[active] = np.maximum(squares - total**2 / shots, 0.0) / np.maximum(shots - 1.0, 1.0)
+            self.shots_used += int(2 * self.shots[active].sum())
+        self._update_shots(grad, variance)
+        return grad.reshape(self.param_shape)
+
+    def _update_shots(self, grad: np.ndarray, variance: np.ndarray) -> None:
+        """iCANS1: 이동 평균으로 다음 스텝 성분별 샷 수를 정하고, 기대 이득이 가장 큰 성분의 샷 수로 상한을 둔다."""
+        mu, alpha, lipschitz = SHOT_MOMENTUM, self.learning_rate, self.lipschitz
+        self._mean_grad = mu * self._mean_grad + (1.0 - mu) * grad
+        self._mean_var = mu * self._mean_var + (1.0 - mu) * variance
+        correction = 1.0 - mu ** (self._step + 1)
+        mean_grad, mean_var = self._mean_grad / correction, self._mean_var / correction
+        shots = np.ceil(
+            2.0 * lipschitz * alpha / (2.0 - lipschitz * alpha) * mean_var / (mean_grad**2 + SHOT_BIAS * mu**self._step)
+        )
+        shots = np.clip(shots, self.min_shots, MAX_SHOTS)
+        gain = ((alpha - lipschitz * alpha**2 / 2.0) * mean_grad**2 - lipschitz * alpha**2 * mean_var / (2.0 * shots)) / shots
+        self.shots = np.minimum(shots, shots[int(np.argmax(gain))]).astype(np.int64)
+        self.shots = np.maximum(self.shots, self.min_shots)
+        self._step += 1
+
+    def apply_grad(self, grad: np.ndarray, params: np.ndarray) -> np.ndarray:
+        return np.asarray(params, dtype=float) - self.learning_rate * np.asarray(grad, dtype=float)
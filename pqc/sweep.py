@@ -0,0 +1,155 @@
+"""PQC 설정 하이퍼파라미터 스윕과 successive halving 조기 종료."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field, fields, replace
+from itertools import product
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from pqc.gates import LogicGate
+from pqc.model import PQCConfig
+from pqc.parallel import default_config, train_function
+
+SearchSpace = Mapping[str, Sequence[Any]]
+
+
+def expand_search_space(
+    base_config: PQCConfig,
+    space: SearchSpace,
+    num_trials: int | None = None,
+    seed: int = 0,
+) -> list[PQCConfig]:
+    """탐색 공간을 frozen 설정 목록으로 전개.
+
+    num_trials가 없으면 전체 격자를, 있으면 격자에서 중복 없이 무작위로 뽑은
+    조합을 반환한다. 설정에 없는 필드 이름은 ValueError로 거부한다.
+    """
+    known = {item.name for item in fields(base_config)}
+    unknown = sorted(set(space) - known)
+    if unknown:
+        raise ValueError(f"{type(base_config).__name__}에 없는 필드입니다: {', '.join(unknown)}")
+
+    names = list(space)
+    grid = list(product(*(space[name] for name in names)))
+    if num_trials is not None and num_trials < len(grid):
+        rng = np.random.default_rng(seed)
+        picked = sorted(rng.choice(len(grid), size=num_trials, replace=False))
+        grid = [grid[index] for index in picked]
+    return [replace(base_config, **dict(zip(names, values))) for values in grid]
+
+
+class SuccessiveHalvingPruner:
+    """비동기 successive halving(ASHA) 방식의 조기 종료 규칙.
+
+    rung 스텝은 min_steps·η^k 이다. 학습이 rung에 도달하면 그 시점 손실을 rung 기록에
+    더하고, 지금까지 같은 rung에 도달한 trial 중 상위 1/η 안에 들지 못하면 중단시킨다.
+    trial을 멈췄다가 재개할 필요가 없어 `fit`의 스텝 콜백만으로 동작한다.
+    """
+
+    def __init__(self, min_steps: int = 50, reduction_factor: int = 3, max_steps: int = 800):
+        if min_steps < 1 or reduction_factor < 2:
+            raise ValueError("min_steps는 1 이상, reduction_factor는 2 이상이어야 합니다.")
+        self.reduction_factor = reduction_factor
+        self.rungs: list[int] = []
+        step = min_steps
+        while step < max_steps:
+            self.rungs.append(step)
+            step *= reduction_factor
+        self._records: dict[int, list[float]] = {rung: [] for rung in self.rungs}
+
+    def should_prune(self, step: int, loss: float) -> bool:
+        if step not in self._records:
+            return False
+        values = self._records[step]
+        values.append(loss)
+        keep = max(1, len(values) // self.reduction_factor)
+        return loss > sorted(values)[keep - 1]
+
+    def callback(self, trial: "Trial"):
+        def on_step(step: int, loss: float, params: Any) -> bool:
+            if self.should_prune(step, loss):
+                trial.pruned_at = step
+                return True
+            return False
+
+        return on_step
+
+
+@dataclass
+class Trial:
+    gate: LogicGate
+    config: PQCConfig
+    result: Any = None
+    pruned_at: int | None = None
+
+    @property
+    def pruned(self) -> bool:
+        return self.pruned_at is not None
+
+    @property
+    def steps(self) -> int:
+        return len(self.result.loss_history) if self.result is not None else 0
+
+    @property
+    def score(self) -> float:
+        return self.result.final_loss if self.result is not None else math.inf
+
+
+@dataclass
+class SweepResult:
+    family: str
+    leaderboards: dict[LogicGate, list[Trial]] = field(default_factory=dict)
+
+    def best(self, gate: LogicGate) -> Trial:
+        return self.leaderboards[gate][0]
+
+    @property
+    def total_steps(self) -> int:
+        return sum(trial.steps for trials in self.leaderboards.values() for trial in trials)
+
+
+def run_sweep(
+    family: str,
+    gates: Sequence[LogicGate],
+    space: SearchSpace,
+    base_config: PQCConfig | None = None,
+    num_trials: int | None = None,
+    seed: int = 0,
+    min_steps: int = 50,
+    reduction_factor: int = 3,
+) -> SweepResult:
+    """게이트마다 탐색 공간의 설정을 학습하고 순위표를 만든다.
+
+    게이트별로 별도의 pruner를 쓰며, 순위는 (조기 종료 여부, 최종 손실, 스텝 수) 순이다.
+    """
+    base = base_config or default_config(family)
+    configs = expand_search_space(base, space, num_trials=num_trials, seed=seed)
+    train = train_function(family)
+    max_steps = max(config.max_steps for config in configs)
+
+    sweep = SweepResult(family)
+    for gate in gates:
+        pruner = SuccessiveHalvingPruner(min_steps, reduction_factor, max_steps)
+        trials: list[Trial] = []
+        for config in configs:
+            trial = Trial(gate, config)
+            trial.result = train(gate, config, callback=pruner.callback(trial))
+            trials.append(trial)
+        trials.sort(key=lambda trial: (trial.pruned, trial.score, trial.steps))
+        sweep.leaderboards[gate] = trials
+    return sweep
+
+
+def log_sweep(sweep: SweepResult, space: SearchSpace, top: int = 5) -> None:
+    names = list(space)
+    print(f"\n[{sweep.family} 스윕] 총 학습 스텝: {sweep.total_steps}")
+    for gate, trials in sweep.leaderboards.items():
+        pruned = sum(trial.pruned for trial in trials)
+        print(f"\n[{gate.value}] trial {len(trials)}개 / 조기 종료 {pruned}개")
+        for rank, trial in enumerate(trials[:top], start=1):
+            settings = ", ".join(f"{name}={getattr(trial.config, name)}" for name in names)
+            status = f"중단@{trial.pruned_at}" if trial.pruned else f"{trial.steps} step"
+            print(f"  {rank}. 손실 {trial.score:.6f} ({status}) {settings}")
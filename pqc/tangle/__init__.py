@@ -8,6 +8,7 @@ _EXPORT_MAP = {
     "EntangledTwoQubitPQC": ("pqc.tangle.model", "EntangledTwoQubitPQC"),
     "EntangledTrainingResult": ("pqc.tangle.workflow", "EntangledTrainingResult"),
     "train_entangled_gate": ("pqc.tangle.workflow", "train_entangled_gate"),
+    "train_entangled_gates": ("pqc.tangle.workflow", "train_entangled_gates"),
     "log_entangled_result": ("pqc.tangle.workflow", "log_entangled_result"),
     "run_entangled_experiments": ("pqc.tangle.workflow", "run_entangled_experiments"),
 }
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
 import pennylane as qml
 import pennylane.numpy as qnp
 
+from pqc.engine import Operation
 from pqc.model import PQCConfig, TwoQubitPQC
 
 
@@ -15,32 +17,43 @@ class EntangledTwoQubitPQC(TwoQubitPQC):
 
     @staticmethod
     def _basis_encoding(bits: qnp.ndarray) -> None:
-        """Figure 1의 첫 단계: 입력 비트를 Pauli-X로 인코딩."""
-        for wire, bit in enumerate(bits):
-            if int(bit) == 1:
-                qml.PauliX(wires=wire)
+        """Figure 1의 첫 단계: 입력 비트를 Pauli-X(= 전역 위상을 뺀 RX(π))로 인코딩."""
+        for wire in range(2):
+            qml.RX(np.pi * bits[..., wire], wires=wire)
 
     @staticmethod
     def _ansatz_layer(params: qnp.ndarray) -> None:
         """단일 레이어에서 회전 게이트와 얽힘 게이트를 모두 적용."""
-        for block in range(params.shape[0]):
-            block_params = params[block]
+        for block in range(params.shape[-3]):
+            block_params = params[..., block, :, :]
 
             # 1) 비얽힘(단일 큐비트) 회전
             for wire in range(2):
-                theta, phi, lam = block_params[wire]
-                qml.RY(theta, wires=wire)
-                qml.RZ(phi, wires=wire)
-                qml.RY(lam, wires=wire)
+                qml.RY(block_params[..., wire, 0], wires=wire)
+                qml.RZ(block_params[..., wire, 1], wires=wire)
+                qml.RY(block_params[..., wire, 2], wires=wire)
 
             # 2) 얽힘 게이트 체인 (파라미터 재활용)
-            zz_angle = 0.5 * (block_params[0, 0] + block_params[1, 0])
-            xx_angle = 0.5 * (block_params[0, 2] + block_params[1, 2])
+            zz_angle = 0.5 * (block_params[..., 0, 0] + block_params[..., 1, 0])
+            xx_angle = 0.5 * (block_params[..., 0, 2] + block_params[..., 1, 2])
             qml.IsingZZ(zz_angle, wires=(0, 1))
             qml.CNOT(wires=(0, 1))
             qml.IsingXX(xx_angle, wires=(0, 1))
             qml.CNOT(wires=(1, 0))
 
+    def _engine_operations(self) -> list[Operation]:
+        """`_ansatz_layer`의 회전 + IsingZZ/CNOT/IsingXX/CNOT 체인을 엔진용으로 기술."""
+        operations: list[Operation] = []
+        for block in range(self.config.num_blocks):
+            operations.extend(self._engine_rotations(block, ("RY", "RZ", "RY")))
+            zz_terms = ((self._param_index(block, 0, 0), 0.5), (self._param_index(block, 1, 0), 0.5))
+            xx_terms = ((self._param_index(block, 0, 2), 0.5), (self._param_index(block, 1, 2), 0.5))
+            operations.append(Operation("IsingZZ", (0, 1), zz_terms))
+            operations.append(Operation("CNOT", (0, 1)))
+            operations.append(Operation("IsingXX", (0, 1), xx_terms))
+            operations.append(Operation("CNOT", (1, 0)))
+        return operations
+
     def _circuit(self, inputs: qnp.ndarray, params: qnp.ndarray) -> qnp.ndarray:
         """Figure 1 구조(기저 인코딩 → 앤사츠 → 측정)를 명시적으로 구현."""
         self._basis_encoding(inputs)
@@ -1,50 +1,49 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
 
 import numpy as np
-import pennylane.numpy as qnp
 
-from pqc.gates import LogicGate, build_dataset, truth_table_inputs
-from pqc.model import PQCConfig
-from pqc.report import display_qiskit_report
+from pqc.cache import ResultCache
+from pqc.gates import LogicGate, truth_table_inputs
+from pqc.model import PQCConfig, StepCallback
+from pqc.profiling import TrainingProfiler
+from pqc.report import default_report_engine, display_qiskit_report
+from pqc.results import TrainingResult
+from pqc.workflow import train_gate_with, train_gates_stacked, train_gates_warm
 
 from .model import EntangledTwoQubitPQC
 
+DEFAULT_ENTANGLED_CONFIG = PQCConfig(
+    learning_rate=0.1,
+    max_steps=800,
+    num_blocks=4,
+    seed=13,
+)
 
-@dataclass
-class EntangledTrainingResult:
-    gate: LogicGate
-    final_loss: float
-    accuracy: float
-    converged: bool
-    params: qnp.ndarray
-    probabilities: list[float]
-    predictions: list[int]
-    targets: list[int]
-    loss_history: list[float]
-
-
-def train_entangled_gate(gate: LogicGate, config: PQCConfig | None = None) -> EntangledTrainingResult:
-    dataset = build_dataset(gate)
-    pqc = EntangledTwoQubitPQC(config)
-    history = pqc.fit(dataset)
-    probabilities, predictions, targets = pqc.evaluate(dataset)
-    accuracy = sum(int(p == t) for p, t in zip(predictions, targets)) / len(targets)
-    final_loss = history[-1] if history else float("inf")
-    tol = pqc.config.convergence_tol
-    converged = final_loss < tol
-    return EntangledTrainingResult(
-        gate=gate,
-        final_loss=final_loss,
-        accuracy=accuracy,
-        converged=converged,
-        params=pqc.params,
-        probabilities=probabilities,
-        predictions=predictions,
-        targets=targets,
-        loss_history=history,
-    )
+
+# 모든 계열이 `pqc.results.TrainingResult` 하나를 공유한다. 예전 이름은 별칭으로 남긴다.
+EntangledTrainingResult = TrainingResult
+
+
+def train_entangled_gate(
+    gate: LogicGate,
+    config: PQCConfig | None = None,
+    callback: StepCallback | None = None,
+    cache: ResultCache | None = None,
+    profiler: TrainingProfiler | None = None,
+) -> EntangledTrainingResult:
+    config = config or PQCConfig()
+    return train_gate_with(EntangledTwoQubitPQC(config), gate, callback=callback, cache=cache, profiler=profiler)
+
+
+def train_entangled_gates(
+    gates: Sequence[LogicGate],
+    config: PQCConfig | None = None,
+    cache: ResultCache | None = None,
+) -> list[EntangledTrainingResult]:
+    return train_gates_stacked(EntangledTwoQubitPQC(config), gates, cache=cache)
 
 
 def log_entangled_result(result: EntangledTrainingResult, config: PQCConfig) -> None:
@@ -59,13 +58,17 @@ def log_entangled_result(result: EntangledTrainingResult, config: PQCConfig) ->
         print(f"    입력 {bits} -> P(1)={prob:.3f} / 예측={pred} / 정답={target}")
 
 
-def run_entangled_experiments(config: PQCConfig | None = None) -> None:
-    ent_config = config or PQCConfig(
-        learning_rate=0.1,
-        max_steps=800,
-        num_blocks=4,
-        seed=13,
-    )
+def run_entangled_experiments(
+    config: PQCConfig | None = None,
+    stacked: bool = False,
+    cache: ResultCache | None = None,
+    report_dir: str | Path | None = None,
+    warm_start: bool = False,
+) -> None:
+    """warm_start=True면 반전 관계인 게이트를 원본 뒤에 학습해 변환한 초기값에서 출발한다."""
+    if stacked and warm_start:
+        raise ValueError("stacked 학습은 모든 게이트가 같은 초기값에서 출발하므로 warm_start와 함께 쓸 수 없습니다.")
+    ent_config = config or DEFAULT_ENTANGLED_CONFIG
     gates_to_learn = [
         LogicGate.AND,
         LogicGate.OR,
@@ -74,8 +77,18 @@ def run_entangled_experiments(config: PQCConfig | None = None) -> None:
         LogicGate.XOR,
         LogicGate.XNOR,
     ]
-    for gate in gates_to_learn:
-        result = train_entangled_gate(gate, ent_config)
+    if stacked:
+        results = train_entangled_gates(gates_to_learn, ent_config, cache=cache)
+    elif warm_start:
+        results = train_gates_warm(EntangledTwoQubitPQC, gates_to_learn, ent_config, cache=cache)
+    else:
+        results = (train_entangled_gate(gate, ent_config, cache=cache) for gate in gates_to_learn)
+    finished = []
+    for result in results:
         log_entangled_result(result, ent_config)
-        display_qiskit_report(result)
+        if report_dir is None:
+            display_qiskit_report(result, model_cls=EntangledTwoQubitPQC, config=ent_config)
+        finished.append(result)
+    if report_dir is not None:
+        default_report_engine().write_reports(finished, report_dir, EntangledTwoQubitPQC, ent_config)
 
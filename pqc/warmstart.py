@@ -0,0 +1,285 @@
+"""관련 게이트의 학습 결과로 초기 파라미터를 만드는 warm-start.
+
+NAND/NOR/XNOR는 AND/OR/XOR의 출력 반전이고, OR(a, b) = NOT AND(NOT a, NOT b)처럼
+2입력 게이트들은 입력 비트 반전과 출력 반전으로 서로 이어진다(`gate_relations`).
+출력 반전은 ⟨Z0⟩의 부호 반전이므로, 회로 계열에 따라 파라미터 변환 하나로 정확히
+옮길 수 있다. 어떤 변환이 되는지는 계열·설정마다 `parameter_symmetry`가 후보 변환
+(와이어별 부호 반전 + 파라미터 하나의 π 이동)을 무작위 파라미터로 직접 검증해 찾는다.
+
+`ParameterStore`는 학습을 마친 게이트의 파라미터를 (모델 클래스, 구조 설정, 게이트)로
+보관하고, `warm_start`는 저장소의 관련 게이트 파라미터를 변환한 후보 중 목표 게이트
+손실이 가장 낮은 것을 고른다. `order_gates`는 변환으로 이어지는 게이트가 원본 뒤에
+오도록 학습 순서를 정한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass, fields, replace
+from itertools import product
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+
+from pqc.gates import GATE_FUNCTIONS, LogicGate, build_dataset, truth_table_inputs
+
+if TYPE_CHECKING:  # 순환 참조 회피용
+    from pqc.model import PQCConfig, TwoQubitPQC
+
+# 파라미터 저장소 키에서 빼는 설정 필드: 학습 경로만 바꾸고 회로 구조는 바꾸지 않는다.
+TRAINING_ONLY_FIELDS = (
+    "learning_rate",
+    "max_steps",
+    "seed",
+    "convergence_tol",
+    "backend",
+    "fuse_gates",
+    "diff_method",
+    "optimizer",
+    "lr_schedule",
+    "plateau_patience",
+    "plateau_factor",
+    "restarts",
+    "restart_prune_every",
+    "batch_size",
+    "min_shots",
+    "shot_budget",
+    "shot_lipschitz",
+)
+
+# 대칭 검증에 쓰는 무작위 파라미터 묶음 수와 허용 오차
+_PROBE_SETS = 3
+_PROBE_ATOL = 1e-9
+
+
+@dataclass(frozen=True)
+class GateRelation:
+    """target(x) = complement ⊕ source(x ⊕ input_flip)."""
+
+    source: LogicGate
+    input_flip: tuple[int, ...]
+    complement: bool
+
+    @property
+    def is_identity(self) -> bool:
+        return not self.complement and not any(self.input_flip)
+
+
+def gate_relations(target: LogicGate) -> list[GateRelation]:
+    """target을 다른 게이트의 입력·출력 반전으로 얻는 모든 관계. 반전이 적은 관계부터."""
+    inputs = truth_table_inputs()
+    expected = [GATE_FUNCTIONS[target](*bits) for bits in inputs]
+    relations = []
+    for source in LogicGate:
+        for flip in product((0, 1), repeat=2):
+            for complement in (False, True):
+                values = [GATE_FUNCTIONS[source](*(bit ^ mask for bit, mask in zip(bits, flip))) for bits in inputs]
+                if [value ^ complement for value in values] == expected:
+                    relations.append(GateRelation(source, flip, complement))
+    return sorted(relations, key=lambda relation: (sum(relation.input_flip) + relation.complement, relation.source.value))
+
+
+@dataclass(frozen=True)
+class ParameterSymmetry:
+    """params ↦ signs · params + shift. 입력 비트를 input_flip으로 반전한 회로가 원래 회로의
+    ⟨Z0⟩에 (complement면 부호를 바꿔) 정확히 대응한다."""
+
+    input_flip: tuple[int, ...]
+    complement: bool
+    signs: np.ndarray
+    shift: np.ndarray
+
+    def apply(self, params: np.ndarray) -> np.ndarray:
+        return self.signs * np.asarray(params, dtype=float) + self.shift
+
+
+def _candidate_transforms(param_shape: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+    """(C, *param_shape) 부호 배열과 이동 배열. 와이어(뒤에서 두 번째 축)별 부호 반전 조합 ×
+    이동 없음 또는 파라미터 하나를 π만큼 이동."""
+    num_wires, size = param_shape[-2], int(np.prod(param_shape))
+    signs, shifts = [], []
+    for negated in product((False, True), repeat=num_wires):
+        sign = np.ones(param_shape)
+        sign[..., list(np.flatnonzero(negated)), :] = -1.0
+        for index in range(-1, size):
+            shift = np.zeros(size)
+            if index >= 0:
+                shift[index] = np.pi
+            signs.append(sign)
+            shifts.append(shift.reshape(param_shape))
+    return np.stack(signs), np.stack(shifts)
+
+
+_SYMMETRIES: dict[tuple[type, Any, tuple[int, ...], bool], ParameterSymmetry | None] = {}
+
+
+def parameter_symmetry(
+    model: "TwoQubitPQC", input_flip: Sequence[int], complement: bool
+) -> ParameterSymmetry | None:
+    """모델 계열·설정에서 (input_flip, complement) 관계를 정확히 구현하는 파라미터 변환.
+
+    후보 변환을 무작위 파라미터 `_PROBE_SETS`묶음 × 진리표 전체에서 NumPy 엔진으로 한 번에
+    검증하고, 모든 묶음에서 성립하는 첫 변환을 (계열, 설정)별로 캐시한다. 없으면 None.
+    """
+    flip = tuple(int(bit) for bit in input_flip)
+    key = (type(model), model.config, flip, bool(complement))
+    if key in _SYMMETRIES:
+        return _SYMMETRIES[key]
+
+    engine = model._analytic_engine()
+    shape = tuple(model.params.shape)
+    features = np.array(truth_table_inputs(), dtype=float)
+    flipped = np.abs(features - np.array(flip, dtype=float))
+    probes = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(_PROBE_SETS,) + shape)
+    signs, shifts = _candidate_transforms(shape)
+
+    reference = engine.expval(model._engine_initial_states(features), probes)
+    if complement:
+        reference = -reference
+    transformed = signs[:, None] * probes[None] + shifts[:, None]
+    expvals = engine.expval(model._engine_initial_states(flipped), transformed)
+    valid = np.all(np.abs(expvals - reference[None]) < _PROBE_ATOL, axis=(1, 2))
+
+    symmetry = None
+    if valid.any():
+        best = int(np.argmax(valid))
+        symmetry = ParameterSymmetry(flip, bool(complement), signs[best], shifts[best])
+    _SYMMETRIES[key] = symmetry
+    return symmetry
+
+
+def structural_config(config: "PQCConfig") -> "PQCConfig":
+    """학습 경로만 바꾸는 필드를 기본값으로 되돌린 설정. 같은 회로면 같은 값이 된다."""
+    defaults = {
+        field.name: field.default for field in fields(config) if field.name in TRAINING_ONLY_FIELDS
+    }
+    return replace(config, **defaults)
+
+
+class ParameterStore:
+    """학습을 마친 게이트 파라미터 저장소.
+
+    (모델 클래스, `structural_config`, 게이트)마다 최종 손실이 가장 낮은 파라미터 하나를
+    둔다. path를 주면 npz 파일에서 읽고 `save`로 임시 파일에 쓴 뒤 교체한다.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path is not None else None
+        self._params: dict[str, np.ndarray] = {}
+        self._losses: dict[str, float] = {}
+        if self.path is not None and self.path.exists():
+            with np.load(self.path) as data:
+                for name in data.files:
+                    if name.startswith("loss_"):
+                        continue
+                    self._params[name] = np.array(data[name], dtype=float)
+                    self._losses[name] = float(data[f"loss_{name}"])
+
+    @staticmethod
+    def key(model_cls: type, config: "PQCConfig", gate: LogicGate) -> str:
+        payload = f"{model_cls.__module__}.{model_cls.__qualname__}|{gate.value}|{structural_config(config)!r}"
+        return "p" + hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def get(self, model_cls: type, config: "PQCConfig", gate: LogicGate) -> np.ndarray | None:
+        params = self._params.get(self.key(model_cls, config, gate))
+        return None if params is None else params.copy()
+
+    def loss(self, model_cls: type, config: "PQCConfig", gate: LogicGate) -> float | None:
+        return self._losses.get(self.key(model_cls, config, gate))
+
+    def put(
+        self, model_cls: type, config: "PQCConfig", gate: LogicGate, params: np.ndarray, final_loss: float
+    ) -> None:
+        """이미 있는 항목보다 final_loss가 낮을 때만 바꾼다."""
+        key = self.key(model_cls, config, gate)
+        if key in self._losses and self._losses[key] <= final_loss:
+            return
+        self._params[key] = np.array(params, dtype=float)
+        self._losses[key] = float(final_loss)
+
+    def __len__(self) -> int:
+        return len(self._params)
+
+    def save(self, path: str | Path | None = None) -> Path:
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("저장할 경로가 없습니다. path를 지정하세요.")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        arrays: dict[str, np.ndarray] = dict(self._params)
+        arrays.update({f"loss_{key}": np.array(loss) for key, loss in self._losses.items()})
+        with open(tmp_path, "wb") as handle:
+            np.savez(handle, **arrays)
+        os.replace(tmp_path, path)
+        return path
+
+
+@dataclass(frozen=True)
+class WarmStart:
+    """warm-start 초기값과 그 출처. loss는 목표 게이트 데이터셋에서의 초기 손실이다."""
+
+    params: np.ndarray
+    relation: GateRelation
+    loss: float
+
+
+def warm_start(model: "TwoQubitPQC", gate: LogicGate, store: ParameterStore) -> WarmStart | None:
+    """저장소의 관련 게이트 파라미터를 변환한 후보 중 가장 좋은 초기값.
+
+    후보와 모델의 현재 초기 파라미터를 목표 게이트 손실로 한 번에 비교하며, 현재
+    초기값보다 나은 후보가 없으면 None이다.
+    """
+    candidates: list[np.ndarray] = []
+    relations: list[GateRelation] = []
+    for relation in gate_relations(gate):
+        params = store.get(type(model), model.config, relation.source)
+        if params is None:
+            continue
+        symmetry = parameter_symmetry(model, relation.input_flip, relation.complement)
+        if symmetry is None:
+            continue
+        candidates.append(symmetry.apply(params))
+        relations.append(relation)
+    if not candidates:
+        return None
+
+    features, targets = model._stack_dataset(build_dataset(gate))
+    stacked = np.stack(candidates + [np.asarray(model.params, dtype=float)])
+    losses = np.asarray(model._batched_loss(features, targets, stacked), dtype=float)
+    best = int(np.argmin(losses))
+    if best == len(candidates):
+        return None
+    return WarmStart(candidates[best], relations[best], float(losses[best]))
+
+
+def order_gates(gates: Sequence[LogicGate], model: "TwoQubitPQC | None" = None) -> list[LogicGate]:
+    """변환으로 얻을 수 있는 게이트가 원본 바로 뒤에 오도록 학습 순서를 정한다.
+
+    주어진 순서대로 아직 놓이지 않은 게이트를 하나 놓고, 이미 놓인 게이트에서 변환으로
+    이어지는 남은 게이트를 모두 뒤에 붙이기를 반복한다. model을 주면 그 계열에서 정확한
+    변환이 있는 관계만 따진다.
+    """
+
+    def reachable(gate: LogicGate, placed: Sequence[LogicGate]) -> bool:
+        for relation in gate_relations(gate):
+            if relation.source not in placed or relation.is_identity:
+                continue
+            if model is None or parameter_symmetry(model, relation.input_flip, relation.complement) is not None:
+                return True
+        return False
+
+    ordered: list[LogicGate] = []
+    remaining = list(dict.fromkeys(gates))
+    while remaining:
+        ordered.append(remaining.pop(0))
+        grown = True
+        while grown:
+            grown = False
+            for gate in list(remaining):
+                if reachable(gate, ordered):
+                    ordered.append(gate)
+                    remaining.remove(gate)
+                    grown = True
+    return ordered
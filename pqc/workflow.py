@@ -1,48 +1,162 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import replace
+from pathlib import Path
+from typing import Sequence
 
 import numpy as np
 import pennylane.numpy as qnp
 
+from pqc.cache import ResultCache
 from pqc.gates import LogicGate, build_dataset, truth_table_inputs
-from pqc.model import PQCConfig, TwoQubitPQC
-from pqc.report import display_qiskit_report
+from pqc.model import PQCConfig, StepCallback, TwoQubitPQC
+from pqc.profiling import TrainingProfiler
+from pqc.report import default_report_engine, display_qiskit_report
+from pqc.results import TrainingResult
+from pqc.warmstart import ParameterStore, order_gates, warm_start
 
+DEFAULT_CONFIG = PQCConfig()
 
-@dataclass
-class TrainingResult:
-    gate: LogicGate
-    final_loss: float
-    accuracy: float
-    converged: bool
-    params: qnp.ndarray
-    probabilities: list[float]
-    predictions: list[int]
-    targets: list[int]
-    loss_history: list[float]
 
+def _store_result(store: ParameterStore, pqc: TwoQubitPQC, gate: LogicGate, result: TrainingResult) -> None:
+    # final_loss는 마지막 갱신 전 손실이므로, 저장하는 파라미터 자체의 손실을 진리표 확률로 다시 계산한다.
+    loss = float(np.mean((result.probabilities - result.targets) ** 2))
+    store.put(type(pqc), pqc.config, gate, result.params, loss)
+
+
+def train_gate_with(
+    pqc: TwoQubitPQC,
+    gate: LogicGate,
+    callback: StepCallback | None = None,
+    cache: ResultCache | None = None,
+    profiler: TrainingProfiler | None = None,
+    store: ParameterStore | None = None,
+) -> TrainingResult:
+    """주어진 모델로 게이트 하나를 학습하고 진리표로 평가한 결과. 모든 2-큐비트 계열이 공유한다.
+
+    store를 주면 저장소의 관련 게이트에서 변환한 초기값(`pqc.warmstart.warm_start`)이
+    더 나을 때 그 값에서 출발하고, 학습한 파라미터를 저장소에 넣는다. 초기값의 손실이
+    이미 수렴 기준 아래면 학습을 건너뛴다. warm-start한 학습은 그 초기값 하나에서
+    이어 가므로 이번 fit만 restarts=1로 돌리며, pqc.config와 pqc.seed는 바꾸지 않는다
+    (결과의 seed는 None).
+    """
+    initial = warm_start(pqc, gate, store) if store is not None else None
+    # warm-start 초기값 하나에서 이어 학습하므로 다중 시작은 이번 학습에서만 끈다.
+    restarts = 1 if initial is not None else None
+    if initial is not None:
+        pqc.params = qnp.array(initial.params, requires_grad=True)
+
+    key = None
+    if cache is not None and callback is None:
+        config = pqc.config if initial is None else replace(pqc.config, restarts=1)
+        key = cache.key(type(pqc), gate, config, initial.params if initial is not None else None)
+        cached = cache.get(key)
+        if cached is not None:
+            if store is not None:
+                _store_result(store, pqc, gate, cached)
+            return cached
 
-def train_gate(gate: LogicGate, config: PQCConfig) -> TrainingResult:
     dataset = build_dataset(gate)
-    pqc = TwoQubitPQC(config)
-    history = pqc.fit(dataset)
-    probabilities, predictions, targets = pqc.evaluate(dataset)
-    accuracy = sum(int(p == t) for p, t in zip(predictions, targets)) / len(targets)
-    final_loss = history[-1] if history else float("inf")
-    converged = final_loss < config.convergence_tol
-
-    return TrainingResult(
-        gate=gate,
-        final_loss=final_loss,
-        accuracy=accuracy,
-        converged=converged,
+    if initial is not None and initial.loss < pqc.config.convergence_tol:
+        # 변환한 초기값이 이미 수렴했으므로 다시 학습하지 않고 손실 평가 한 번으로 끝낸다.
+        # 원본이 max_steps에서 멈췄다면 fit으로 이어서 학습한다(Adam 상태는 새로 시작).
+        history = [initial.loss]
+    else:
+        checkpoint = cache.checkpoint_path(key) if key is not None else None
+        history = pqc.fit(dataset, callback=callback, checkpoint=checkpoint, profiler=profiler, restarts=restarts)
+    features = [bits for bits, _ in dataset]
+    result = TrainingResult.for_gate(
+        gate,
         params=pqc.params,
-        probabilities=probabilities,
-        predictions=predictions,
-        targets=targets,
+        probabilities=pqc.predict_probabilities(features),
+        targets=[target for _, target in dataset],
         loss_history=history,
+        max_steps=pqc.config.max_steps,
+        convergence_tol=pqc.config.convergence_tol,
+        seed=pqc.seed if initial is None else None,
+        total_shots=pqc.shots_used,
     )
+    if key is not None:
+        cache.put(key, result)
+    if store is not None:
+        _store_result(store, pqc, gate, result)
+    return result
+
+
+def train_gate(
+    gate: LogicGate,
+    config: PQCConfig,
+    callback: StepCallback | None = None,
+    cache: ResultCache | None = None,
+    profiler: TrainingProfiler | None = None,
+) -> TrainingResult:
+    return train_gate_with(TwoQubitPQC(config), gate, callback=callback, cache=cache, profiler=profiler)
+
+
+def train_gates_warm(
+    model_cls: type[TwoQubitPQC],
+    gates: Sequence[LogicGate],
+    config: PQCConfig,
+    cache: ResultCache | None = None,
+    store: ParameterStore | None = None,
+) -> list[TrainingResult]:
+    """`order_gates` 순서로 하나씩 학습해 앞서 푼 게이트에서 warm-start한다. 결과는 gates 순서."""
+    store = store if store is not None else ParameterStore()
+    results: dict[LogicGate, TrainingResult] = {}
+    for gate in order_gates(gates, model_cls(config)):
+        results[gate] = train_gate_with(model_cls(config), gate, cache=cache, store=store)
+    return [results[gate] for gate in gates]
+
+
+def train_gates_stacked(
+    pqc: TwoQubitPQC,
+    gates: Sequence[LogicGate],
+    cache: ResultCache | None = None,
+) -> list[TrainingResult]:
+    """여러 게이트를 `fit_stacked`로 한꺼번에 학습하고 게이트별 결과 객체로 나눈다.
+
+    cache가 있으면 캐시에 없는 게이트만 묶어서 학습한다.
+    """
+    results: dict[LogicGate, TrainingResult] = {}
+    keys: dict[LogicGate, str] = {}
+    if cache is not None:
+        for gate in gates:
+            keys[gate] = cache.key(type(pqc), gate, pqc.config)
+            cached = cache.get(keys[gate])
+            if cached is not None:
+                results[gate] = cached
+
+    pending = [gate for gate in gates if gate not in results]
+    if pending:
+        datasets = [build_dataset(gate) for gate in pending]
+        params, histories = pqc.fit_stacked(datasets)
+        features = [bits for bits, _ in datasets[0]]
+        probabilities = pqc.predict_probabilities(features, params)
+
+        for index, (gate, dataset, history) in enumerate(zip(pending, datasets, histories)):
+            results[gate] = TrainingResult.for_gate(
+                gate,
+                params=params[index],
+                probabilities=probabilities[index],
+                targets=[target for _, target in dataset],
+                loss_history=history,
+                max_steps=pqc.config.max_steps,
+                convergence_tol=pqc.config.convergence_tol,
+                seed=pqc.seed,
+            )
+            if cache is not None:
+                cache.put(keys[gate], results[gate])
+
+    return [results[gate] for gate in gates]
+
+
+def train_gates(
+    gates: Sequence[LogicGate],
+    config: PQCConfig,
+    cache: ResultCache | None = None,
+) -> list[TrainingResult]:
+    """여러 게이트를 하나의 (G, num_blocks, 2, 3) 파라미터 텐서로 동시에 학습."""
+    return train_gates_stacked(TwoQubitPQC(config), gates, cache=cache)
 
 
 def log_result(result: TrainingResult, config: PQCConfig) -> None:
@@ -50,14 +164,27 @@ def log_result(result: TrainingResult, config: PQCConfig) -> None:
     print(f"\n[{result.gate.value}] 학습 {status}")
     print(f"  최종 손실: {result.final_loss:.6f} (수렴 기준 {config.convergence_tol})")
     print(f"  정확도: {result.accuracy * 100:.1f}%")
+    if result.total_shots:
+        print(f"  사용한 샷: {result.total_shots}")
     print(f"  매개변수: {np.round(result.params, 3)}")
     print("  입력별 추정 확률/예측/정답:")
     for bits, prob, pred, target in zip(truth_table_inputs(), result.probabilities, result.predictions, result.targets):
         print(f"    입력 {bits} -> P(1)={prob:.3f} / 예측={pred} / 정답={target}")
 
 
-def run_all_experiments() -> None:
-    config = PQCConfig()
+def run_all_experiments(
+    stacked: bool = False,
+    cache: ResultCache | None = None,
+    report_dir: str | Path | None = None,
+    warm_start: bool = False,
+) -> None:
+    """report_dir를 주면 회로도를 출력하지 않고 보고서 묶음을 그 디렉터리에 쓴다.
+
+    warm_start=True면 반전 관계인 게이트를 원본 뒤에 학습해 변환한 초기값에서 출발한다.
+    """
+    if stacked and warm_start:
+        raise ValueError("stacked 학습은 모든 게이트가 같은 초기값에서 출발하므로 warm_start와 함께 쓸 수 없습니다.")
+    config = DEFAULT_CONFIG
     gates_to_learn = [
         LogicGate.AND,
         LogicGate.OR,
@@ -67,7 +194,18 @@ def run_all_experiments() -> None:
         LogicGate.XNOR,
     ]
 
-    for gate in gates_to_learn:
-        result = train_gate(gate, config)
+    if stacked:
+        results = train_gates(gates_to_learn, config, cache=cache)
+    elif warm_start:
+        results = train_gates_warm(TwoQubitPQC, gates_to_learn, config, cache=cache)
+    else:
+        results = (train_gate(gate, config, cache=cache) for gate in gates_to_learn)
+
+    finished = []
+    for result in results:
         log_result(result, config)
-        display_qiskit_report(result)
\ No newline at end of file
+        if report_dir is None:
+            display_qiskit_report(result, model_cls=TwoQubitPQC, config=config)
+        finished.append(result)
+    if report_dir is not None:
+        default_report_engine().write_reports(finished, report_dir, TwoQubitPQC, config)
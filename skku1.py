@@ -1,10 +1,11 @@
 """비얽힘 PQC 학습 스크립트."""
 
+from pqc.cache import ResultCache
 from pqc.workflow import run_all_experiments
 
 
 def main() -> None:
-    run_all_experiments()
+    run_all_experiments(cache=ResultCache())
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 """얽힘 PQC 학습 스크립트."""
 
+from pqc.cache import ResultCache
 from pqc.tangle import run_entangled_experiments
 
 
 def main() -> None:
-    run_entangled_experiments()
+    run_entangled_experiments(cache=ResultCache())
 
 
 if __name__ == "__main__":
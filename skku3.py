@@ -1,10 +1,11 @@
 """각도 인코딩 PQC 학습 스크립트."""
 
+from pqc.cache import ResultCache
 from pqc.angle import run_angle_experiments
 
 
 def main() -> None:
-    run_angle_experiments()
+    run_angle_experiments(cache=ResultCache())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 설치하지 않고 저장소 루트에서 `pytest`로 실행해도 pqc를 찾도록 한다.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,33 @@
+"""`pqc.benchmark` 기준값 비교 검사."""
+
+import math
+
+import pytest
+
+from pqc.benchmark import Measurement, compare
+
+
+def _measurement(value: float, higher_is_better: bool, benchmark: str = "converged") -> Measurement:
+    return Measurement(benchmark, "basic", "AND", 2, "numpy", value, "", higher_is_better)
+
+
+@pytest.mark.parametrize("higher_is_better", [True, False])
+def test_compare_from_zero_baseline(higher_is_better):
+    pairs, regressions = compare([_measurement(0.0, higher_is_better)], [_measurement(1.0, higher_is_better)])
+
+    assert len(pairs) == 1
+    if higher_is_better:
+        assert pairs[0].change == -math.inf
+        assert regressions == []
+    else:
+        assert pairs[0].change == math.inf
+        assert regressions == pairs
+
+
+def test_compare_relative_change_and_threshold():
+    baseline = [_measurement(10.0, True, "steps_per_sec"), _measurement(2.0, False, "seconds"), _measurement(0.0, True)]
+    current = [_measurement(7.0, True, "steps_per_sec"), _measurement(2.2, False, "seconds"), _measurement(0.0, True)]
+    pairs, regressions = compare(baseline, current, threshold=0.2)
+
+    assert [pair.change for pair in pairs] == pytest.approx([0.3, 0.1, 0.0])
+    assert [pair.baseline.benchmark for pair in regressions] == ["steps_per_sec"]
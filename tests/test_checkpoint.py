@@ -0,0 +1,79 @@
+"""체크포인트 저장·복원과 중단 후 이어 학습한 결과의 일치 검사."""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from pqc.checkpoint import TrainingCheckpoint, load_checkpoint, save_checkpoint
+from pqc.gates import LogicGate, build_dataset
+from pqc.model import PQCConfig, TwoQubitPQC
+
+
+class _Interrupt(Exception):
+    pass
+
+
+def test_checkpoint_file_round_trip(tmp_path):
+    rng = np.random.default_rng(0)
+    checkpoint = TrainingCheckpoint(
+        fingerprint="abc",
+        params=rng.normal(size=(2, 2, 3)),
+        loss_history=[0.5, 0.25],
+        first_moment=rng.normal(size=(2, 2, 3)),
+        second_moment=rng.uniform(size=(2, 2, 3)),
+        adam_step=2,
+        stepsize=np.array(0.05),
+        schedule_state=(np.array(0.05), np.array(0.25), np.array(1)),
+    )
+    path = tmp_path / "ckpt.npz"
+    save_checkpoint(path, checkpoint)
+    loaded = load_checkpoint(path)
+
+    assert loaded.fingerprint == checkpoint.fingerprint
+    assert loaded.loss_history == checkpoint.loss_history
+    assert loaded.adam_step == checkpoint.adam_step
+    for name in ("params", "first_moment", "second_moment", "stepsize"):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(checkpoint, name), err_msg=name)
+    for actual, expected in zip(loaded.schedule_state, checkpoint.schedule_state):
+        np.testing.assert_array_equal(actual, expected)
+    assert load_checkpoint(tmp_path / "missing.npz") is None
+
+
+@pytest.mark.parametrize("backend", ["numpy", "pennylane"])
+@pytest.mark.parametrize("lr_schedule", ["constant", "plateau"])
+def test_resume_matches_uninterrupted_fit(tmp_path, backend, lr_schedule):
+    config = PQCConfig(backend=backend, lr_schedule=lr_schedule, plateau_patience=5, max_steps=80, convergence_tol=0.0)
+    dataset = build_dataset(LogicGate.XOR)
+    reference = TwoQubitPQC(config)
+    expected = reference.fit(dataset)
+
+    def interrupt(step, loss, params):
+        if step == 65:
+            raise _Interrupt
+
+    path = tmp_path / "ckpt.npz"
+    with pytest.raises(_Interrupt):
+        TwoQubitPQC(config).fit(dataset, callback=interrupt, checkpoint=path, checkpoint_every=30)
+    assert len(load_checkpoint(path).loss_history) == 60
+
+    resumed = TwoQubitPQC(config)
+    history = resumed.fit(dataset, checkpoint=path, checkpoint_every=30)
+    np.testing.assert_allclose(history, expected, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(resumed.params, reference.params, rtol=0, atol=1e-12)
+    assert not path.exists()
+
+
+def test_resume_rejects_other_training(tmp_path):
+    config = PQCConfig(backend="numpy", max_steps=40, convergence_tol=0.0)
+    path = tmp_path / "ckpt.npz"
+
+    def interrupt(step, loss, params):
+        if step == 25:
+            raise _Interrupt
+
+    with pytest.raises(_Interrupt):
+        TwoQubitPQC(config).fit(build_dataset(LogicGate.XOR), callback=interrupt, checkpoint=path, checkpoint_every=20)
+    other = TwoQubitPQC(replace(config, learning_rate=config.learning_rate * 2))
+    with pytest.raises(ValueError):
+        other.fit(build_dataset(LogicGate.XOR), checkpoint=path)
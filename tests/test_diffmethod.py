@@ -0,0 +1,30 @@
+"""`pqc.diffmethod` auto 선택 검사."""
+
+import pytest
+
+import pqc.diffmethod as diffmethod
+from pqc.model import PQCConfig, TwoQubitPQC
+from pqc.noise import NoiseModel
+
+
+@pytest.fixture(autouse=True)
+def fresh_choices(monkeypatch):
+    monkeypatch.setattr(diffmethod, "_CHOICES", {})
+
+
+def test_auto_records_unsupported_methods():
+    model = TwoQubitPQC(PQCConfig(noise=NoiseModel(depolarizing=0.01)))
+    choice = diffmethod.benchmark_diff_methods(model)
+
+    # default.mixed는 adjoint를 지원하지 않는다.
+    assert "adjoint" in choice.skipped and "adjoint" not in choice.timings
+    assert choice.method in choice.timings
+    assert choice.timings[choice.method] == min(choice.timings.values())
+
+
+def test_auto_with_shots_takes_first_runnable_without_timing():
+    model = TwoQubitPQC(PQCConfig(shots=100))
+    choice = diffmethod.benchmark_diff_methods(model)
+
+    assert choice.method == "parameter-shift"
+    assert choice.timings == {} and choice.skipped == {}
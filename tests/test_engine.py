@@ -0,0 +1,53 @@
+"""`StatevectorEngine`(numpy 백엔드)과 PennyLane QNode 경로의 일치 검사."""
+
+from dataclasses import replace
+
+import numpy as np
+import pennylane.numpy as qnp
+import pytest
+
+from pqc.engine import StatevectorEngine
+from pqc.gates import LogicGate, build_dataset
+from pqc.parallel import FAMILIES, default_config, model_class
+
+ATOL = 1e-10
+
+
+def _models(family: str, fuse_gates: bool):
+    config = replace(default_config(family), fuse_gates=fuse_gates)
+    cls = model_class(family)
+    return cls(replace(config, backend="numpy")), cls(replace(config, backend="pennylane"))
+
+
+@pytest.mark.parametrize("fuse_gates", [True, False])
+@pytest.mark.parametrize("family", FAMILIES)
+def test_engine_matches_qnode(family, fuse_gates):
+    engine_model, qnode_model = _models(family, fuse_gates)
+    assert isinstance(engine_model.engine, StatevectorEngine)
+    assert qnode_model.engine is None
+
+    features, targets = engine_model._stack_dataset(build_dataset(LogicGate.XOR))
+    rng = np.random.default_rng(1234)
+    for _ in range(3):
+        params = qnp.array(rng.uniform(-np.pi, np.pi, size=engine_model.params.shape), requires_grad=True)
+        np.testing.assert_allclose(
+            engine_model._expvals(features, params), qnode_model._expvals(features, params), rtol=0, atol=ATOL
+        )
+        loss, grad = engine_model._loss_and_grad(features, targets, params)
+        expected_loss, expected_grad = qnode_model._loss_and_grad(features, targets, params)
+        np.testing.assert_allclose(loss, expected_loss, rtol=0, atol=ATOL)
+        np.testing.assert_allclose(grad, expected_grad, rtol=0, atol=ATOL)
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_engine_matches_qnode_for_parameter_batch(family):
+    engine_model, qnode_model = _models(family, fuse_gates=True)
+    features, targets = engine_model._stack_dataset(build_dataset(LogicGate.AND))
+    rng = np.random.default_rng(99)
+    params = qnp.array(rng.uniform(-np.pi, np.pi, size=(4,) + engine_model.params.shape), requires_grad=True)
+
+    losses, grads = engine_model._loss_and_grad(features, targets, params)
+    expected_losses, expected_grads = qnode_model._loss_and_grad(features, targets, params)
+    assert losses.shape == (4,)
+    np.testing.assert_allclose(losses, expected_losses, rtol=0, atol=ATOL)
+    np.testing.assert_allclose(grads, expected_grads, rtol=0, atol=ATOL)
@@ -0,0 +1,51 @@
+"""`FourierSurrogate`(fourier 백엔드)와 PennyLane QNode 경로의 일치 검사."""
+
+from dataclasses import replace
+
+import numpy as np
+import pennylane.numpy as qnp
+import pytest
+
+from pqc.fourier import FourierSurrogate
+from pqc.gates import LogicGate, build_dataset
+from pqc.noise import NoiseModel
+from pqc.parallel import FAMILIES, default_config, model_class
+
+ATOL = 1e-10
+
+# 잡음이 있으면 QNode 경로는 default.mixed에서 게이트마다 채널을 넣어 실행한다.
+NOISE = {
+    "noiseless": None,
+    "depolarizing": NoiseModel(depolarizing=0.05),
+    "mixed": NoiseModel(depolarizing=0.02, amplitude_damping=0.03, readout=0.01),
+}
+
+
+@pytest.mark.parametrize("noise", NOISE)
+@pytest.mark.parametrize("family", FAMILIES)
+def test_surrogate_matches_qnode(family, noise):
+    config = replace(default_config(family), noise=NOISE[noise])
+    cls = model_class(family)
+    surrogate_model = cls(replace(config, backend="fourier"))
+    qnode_model = cls(replace(config, backend="pennylane"))
+    assert isinstance(surrogate_model.engine, FourierSurrogate)
+    assert qnode_model.engine is None
+    assert qnode_model.dev.name == ("default.qubit" if noise == "noiseless" else "default.mixed")
+
+    features, targets = surrogate_model._stack_dataset(build_dataset(LogicGate.XOR))
+    rng = np.random.default_rng(2024)
+    for _ in range(3):
+        params = qnp.array(rng.uniform(-np.pi, np.pi, size=surrogate_model.params.shape), requires_grad=True)
+        np.testing.assert_allclose(
+            surrogate_model._expvals(features, params), qnode_model._expvals(features, params), rtol=0, atol=ATOL
+        )
+        loss, grad = surrogate_model._loss_and_grad(features, targets, params)
+        expected_loss, expected_grad = qnode_model._loss_and_grad(features, targets, params)
+        np.testing.assert_allclose(loss, expected_loss, rtol=0, atol=ATOL)
+        np.testing.assert_allclose(grad, expected_grad, rtol=0, atol=ATOL)
+
+    batch = qnp.array(rng.uniform(-np.pi, np.pi, size=(4,) + surrogate_model.params.shape), requires_grad=True)
+    losses, grads = surrogate_model._loss_and_grad(features, targets, batch)
+    expected_losses, expected_grads = qnode_model._loss_and_grad(features, targets, batch)
+    np.testing.assert_allclose(losses, expected_losses, rtol=0, atol=ATOL)
+    np.testing.assert_allclose(grads, expected_grads, rtol=0, atol=ATOL)
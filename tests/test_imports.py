@@ -0,0 +1,40 @@
+"""임포트 시간·의존성 예산 (`pqc.benchmark.IMPORT_BUDGETS`). 느린 머신에서는
+`PQC_IMPORT_BUDGET_SCALE` 환경 변수로 시간 상한을 늘린다."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pqc.benchmark import IMPORT_BUDGETS, bench_import_time
+
+SCALE = float(os.environ.get("PQC_IMPORT_BUDGET_SCALE", "1.0"))
+
+_PREDICTOR_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import pqc, pqc.predictor
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "pennylane": "pennylane" in sys.modules, "qiskit": "qiskit" in sys.modules}))
+"""
+
+
+def test_predictor_import_is_light():
+    limit = IMPORT_BUDGETS["pqc.predictor"][0] * SCALE
+    best = float("inf")
+    for _ in range(3):  # 콜드 임포트 잡음을 줄이려고 가장 빠른 값을 쓴다
+        completed = subprocess.run([sys.executable, "-c", _PREDICTOR_PROBE], capture_output=True, text=True, check=True)
+        probe = json.loads(completed.stdout.strip().splitlines()[-1])
+        assert not probe["pennylane"], "pqc.predictor가 pennylane을 불러옵니다."
+        assert not probe["qiskit"], "pqc.predictor가 qiskit을 불러옵니다."
+        best = min(best, probe["seconds"])
+    assert best < limit, f"import pqc, pqc.predictor: {best:.3f}s > {limit:.3f}s"
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS))
+def test_import_does_not_load_forbidden_packages(module):
+    _, forbidden = IMPORT_BUDGETS[module]
+    _, loaded = bench_import_time(module, repeats=1)
+    assert not set(forbidden) & loaded
@@ -0,0 +1,151 @@
+"""`pqc.jobs` 명세 전개, 기록 읽기, 재실행 검사."""
+
+import json
+import os
+import subprocess
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+import pqc
+from pqc.gates import LogicGate
+from pqc.jobs import JOBS_FORMAT, expand_spec, job_id, read_records, run_jobs
+from pqc.parallel import ExperimentTask, default_config
+
+TINY = {"max_steps": 3, "backend": "numpy"}
+
+# 워커와 하위 프로세스가 설치하지 않은 pqc를 찾도록 저장소 루트에서 실행한다.
+ROOT = Path(pqc.__file__).resolve().parents[1]
+
+
+def test_expand_spec_grid_and_repeats():
+    spec = expand_spec(
+        {
+            "repeats": 2,
+            "experiments": [
+                {"family": "basic", "gates": ["AND", "xor"], "config": TINY, "grid": {"learning_rate": [0.1, 0.2]}},
+                {"families": ["entangled"], "gate": "OR", "repeats": 1, "config": TINY},
+            ],
+        },
+        output="out",
+        concurrency=3,
+    )
+
+    # 격자 2 × 게이트 2 × 반복 2, 그리고 얽힘 계열 1개
+    assert len(spec.jobs) == 9
+    basic = [task for task in spec.jobs if task.family == "basic"]
+    assert {task.config.learning_rate for task in basic} == {0.1, 0.2}
+    assert {task.gate for task in basic} == {LogicGate.AND, LogicGate.XOR}
+    assert {task.repeat for task in basic} == {0, 1}
+    assert all(task.config.max_steps == 3 for task in spec.jobs)
+    assert [(task.family, task.gate, task.repeat) for task in spec.jobs if task.family == "entangled"] == [
+        ("entangled", LogicGate.OR, 0)
+    ]
+    assert (str(spec.output), spec.concurrency, spec.timeout) == ("out", 3, None)
+
+
+def test_expand_spec_deduplicates_jobs():
+    entry = {"family": "basic", "gates": ["AND"], "repeats": 2, "config": TINY}
+    # 기본값과 같은 학습률을 격자로 준 항목도 같은 작업이다.
+    same = dict(entry, grid={"learning_rate": [default_config("basic").learning_rate]})
+    spec = expand_spec({"experiments": [entry, entry, same]})
+
+    assert len(spec.jobs) == 2
+    assert len({job_id(task) for task in spec.jobs}) == 2
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"experiments": [{"family": "basic"}], "workers": 2},
+        {"experiments": [{"family": "basic", "seeds": [1]}]},
+        {"experiments": [{"family": "basic", "config": {"steps": 10}}]},
+        {"experiments": [{"family": "basic", "gate": "AND", "gates": ["OR"]}]},
+        {"experiments": [{"family": "basic", "gate": "IMPLY"}]},
+        {"experiments": [{"family": "unknown"}]},
+        {"experiments": []},
+    ],
+)
+def test_expand_spec_rejects_unknown_keys(spec):
+    with pytest.raises(ValueError):
+        expand_spec(spec)
+
+
+def test_job_id_is_stable():
+    task = ExperimentTask("basic", LogicGate.XOR, replace(default_config("basic"), max_steps=3), 1)
+    same = ExperimentTask("basic", LogicGate.XOR, replace(default_config("basic"), max_steps=3), 1)
+
+    assert job_id(task) == job_id(same)
+    assert job_id(task) != job_id(replace(task, repeat=0))
+    assert job_id(task) != job_id(replace(task, config=replace(task.config, max_steps=4)))
+    # 다른 프로세스(다른 해시 시드)에서도 같은 ID여야 재실행 때 끝난 작업을 알아본다.
+    code = (
+        "from dataclasses import replace; from pqc.gates import LogicGate; from pqc.jobs import job_id; "
+        "from pqc.parallel import ExperimentTask, default_config; "
+        "print(job_id(ExperimentTask('basic', LogicGate.XOR, replace(default_config('basic'), max_steps=3), 1)))"
+    )
+    other = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        env={**os.environ, "PYTHONHASHSEED": "1"},
+    )
+    assert other.stdout.strip() == job_id(task)
+
+
+def test_read_records_skips_truncated_last_line(tmp_path):
+    lines = [
+        {"format": JOBS_FORMAT, "id": "a", "status": "timeout"},
+        {"format": JOBS_FORMAT, "id": "b", "status": "ok"},
+        {"format": JOBS_FORMAT, "id": "a", "status": "ok"},
+        {"format": JOBS_FORMAT + 1, "id": "c", "status": "ok"},
+    ]
+    text = "".join(json.dumps(line) + "\n" for line in lines)
+    (tmp_path / "results.jsonl").write_text(text + '{"format": 1, "id": "d", "sta', encoding="utf-8")
+
+    records = read_records(tmp_path)
+
+    assert sorted(records) == ["a", "b"]
+    assert records["a"]["status"] == "ok"
+    assert read_records(tmp_path / "missing") == {}
+
+
+def test_run_jobs_skips_ok_and_retries_timeouts(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    experiment = {"family": "basic", "config": TINY}
+    first = expand_spec({"experiments": [dict(experiment, gate="AND")]}, output=tmp_path, concurrency=1)
+    spec = expand_spec({"experiments": [dict(experiment, gates=["AND", "OR"])]}, output=tmp_path, concurrency=1)
+    done, pending = (job_id(task) for task in spec.jobs)
+    assert [job_id(task) for task in first.jobs] == [done]
+
+    def run(spec):
+        seen = []
+        records = run_jobs(spec, lambda finished, total, record: seen.append(record["id"]))
+        return seen, {key: record["status"] for key, record in records.items()}
+
+    assert run(first) == ([done], {done: "ok"})
+    # 학습이 끝날 수 없는 제한 시간: 끝난 작업은 건너뛰고 남은 작업만 시간 초과로 기록된다.
+    assert run(replace(spec, timeout=1e-4)) == ([pending], {done: "ok", pending: "timeout"})
+    assert run(replace(spec, timeout=120.0)) == ([pending], {done: "ok", pending: "ok"})
+    assert run(spec) == ([], {done: "ok", pending: "ok"})
+    assert (tmp_path / "archive").exists()
+
+
+def test_cli_dry_run_and_spec_errors(tmp_path, capsys):
+    from pqc.__main__ import main
+
+    spec = tmp_path / "spec.toml"
+    spec.write_text(
+        'repeats = 2\n[[experiments]]\nfamily = "basic"\ngates = ["AND", "OR"]\nconfig = { max_steps = 3 }\n',
+        encoding="utf-8",
+    )
+    assert main([str(spec), "-o", str(tmp_path / "out"), "-j", "1", "--dry-run"]) == 0
+    assert "작업 4개 (이미 끝난 0개 건너뜀), 동시 1개" in capsys.readouterr().out
+
+    spec.write_text('[[experiments]]\nfamily = "basic"\nconfig = { steps = 3 }\n', encoding="utf-8")
+    assert main([str(spec), "--dry-run"]) == 2
+    assert "명세 오류" in capsys.readouterr().err
@@ -0,0 +1,80 @@
+"""`TwoQubitPQC` 학습 경로 검사."""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from pqc.gates import LogicGate, build_dataset
+from pqc.model import PQCConfig, TwoQubitPQC
+from pqc.profiling import TrainingProfiler
+from pqc.tangle.model import EntangledTwoQubitPQC
+
+GATES = (LogicGate.AND, LogicGate.OR, LogicGate.XOR, LogicGate.NAND)
+
+
+@pytest.mark.parametrize("lr_schedule", ["constant", "plateau"])
+@pytest.mark.parametrize("optimizer", ["adam", "qng"])
+def test_fit_stacked_matches_per_gate_fit(optimizer, lr_schedule):
+    learning_rate = 0.05 if optimizer == "qng" else 0.2
+    config = PQCConfig(
+        backend="numpy",
+        optimizer=optimizer,
+        lr_schedule=lr_schedule,
+        plateau_patience=3,
+        learning_rate=learning_rate,
+        max_steps=80,
+        convergence_tol=0.05,
+    )
+    # 얽힘 모델은 XOR만 일찍 수렴하므로 수렴한 슬라이스를 고정하는 경로까지 검사된다.
+    params, histories = EntangledTwoQubitPQC(config).fit_stacked([build_dataset(gate) for gate in GATES])
+
+    assert params.shape == (len(GATES),) + EntangledTwoQubitPQC(config).params.shape
+    for task, gate in enumerate(GATES):
+        model = EntangledTwoQubitPQC(config)
+        history = model.fit(build_dataset(gate))
+        assert len(histories[task]) == len(history)
+        np.testing.assert_allclose(histories[task], history, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(params[task], model.params, rtol=0, atol=1e-12)
+    assert len({len(history) for history in histories}) > 1
+
+
+def test_fit_stacked_rejects_different_inputs():
+    model = TwoQubitPQC(PQCConfig(backend="numpy"))
+    dataset = build_dataset(LogicGate.AND)
+    with pytest.raises(ValueError):
+        model.fit_stacked([dataset, dataset[::-1]])
+    with pytest.raises(ValueError):
+        TwoQubitPQC(replace(model.config, restarts=2)).fit_stacked([dataset])
+
+
+def test_multistart_keeps_best_restart_and_prunes():
+    config = PQCConfig(backend="numpy", restarts=8, restart_prune_every=5, max_steps=30, convergence_tol=0.0)
+    dataset = build_dataset(LogicGate.XOR)
+    model = EntangledTwoQubitPQC(config)
+    seeds = model.restart_seeds()
+    profiler = TrainingProfiler()
+    history = model.fit(dataset, profiler=profiler)
+
+    # 시작점마다 따로 학습한 궤적으로 중앙값 가지치기를 따라가 살아남는 시작점을 구한다.
+    singles = []
+    for seed in seeds:
+        single = EntangledTwoQubitPQC(replace(config, seed=seed, restarts=1))
+        singles.append((single.fit(dataset), single.params))
+    alive = list(range(len(seeds)))
+    expected_rows = []
+    for step in range(1, config.max_steps + 1):
+        expected_rows.append(len(alive))
+        if step % config.restart_prune_every == 0 and len(alive) > 1:
+            median = np.median([singles[restart][0][step - 1] for restart in alive])
+            alive = [restart for restart in alive if singles[restart][0][step - 1] <= median]
+    winner = min(alive, key=lambda restart: singles[restart][0][-1])
+
+    assert model.seed == seeds[winner]
+    np.testing.assert_allclose(history, singles[winner][0], rtol=0, atol=1e-10)
+    np.testing.assert_allclose(model.params, singles[winner][1], rtol=0, atol=1e-10)
+    assert history[-1] == min(singles[restart][0][-1] for restart in alive)
+    # 가지친 시작점은 그 스텝 뒤로 시뮬레이션하지 않는다 (스텝당 실행 수 = 살아 있는 시작점 × 입력 행).
+    rows = len(dataset)
+    assert [record.circuit_executions for record in profiler.records] == [rows * alive for alive in expected_rows]
+    assert expected_rows[-1] < len(seeds)
@@ -0,0 +1,57 @@
+"""`pqc.optimizers`의 QNG 블록 대각 메트릭과 plateau 학습률 일정 검사."""
+
+from dataclasses import replace
+
+import numpy as np
+import pennylane as qml
+import pennylane.numpy as qnp
+import pytest
+
+from pqc.gates import truth_table_inputs
+from pqc.optimizers import BlockDiagonalMetric, PlateauSchedule
+from pqc.parallel import FAMILIES, default_config, model_class
+
+
+@pytest.mark.parametrize("num_blocks", [1, 2])
+@pytest.mark.parametrize("family", FAMILIES)
+def test_block_diagonal_metric_matches_pennylane(family, num_blocks):
+    # 합친 회로(QubitUnitary)는 metric_tensor가 생성자를 모르므로 게이트 단위 회로로 비교한다.
+    config = replace(default_config(family), backend="pennylane", num_blocks=num_blocks, fuse_gates=False)
+    model = model_class(family)(config)
+    metric = BlockDiagonalMetric(model)
+    params = np.random.default_rng(3).uniform(-np.pi, np.pi, size=model.params.shape)
+    rows = np.array(truth_table_inputs(), dtype=float)
+
+    expected = []
+    for row in rows:
+        tensor = qml.metric_tensor(model.qnode, approx="block-diag")(
+            qnp.array(row, requires_grad=False), qnp.array(params, requires_grad=True)
+        )
+        expected.append(np.asarray(tensor).reshape(metric.num_params, metric.num_params))
+        single = metric(model._engine_initial_states(row[None]), params)
+        np.testing.assert_allclose(single, expected[-1], rtol=0, atol=1e-10)
+    # 여러 입력 행이면 행별 메트릭의 평균이다.
+    averaged = metric(model._engine_initial_states(rows), params)
+    np.testing.assert_allclose(averaged, np.mean(expected, axis=0), rtol=0, atol=1e-10)
+
+
+def test_plateau_decays_after_patience():
+    schedule = PlateauSchedule(0.1, patience=3, factor=0.5, min_lr=0.02)
+    assert schedule.update(1.0) == pytest.approx(0.1)
+    # 개선이 없는 스텝이 patience번 쌓여야 줄인다.
+    assert [float(schedule.update(loss)) for loss in (1.0, 0.9995, 1.2)] == pytest.approx([0.1, 0.1, 0.05])
+    # 개선되면 대기 수가 처음부터 다시 쌓인다.
+    assert [float(schedule.update(loss)) for loss in (0.5, 0.6, 0.6, 0.6)] == pytest.approx([0.05, 0.05, 0.05, 0.025])
+    # min_lr 아래로는 줄이지 않는다.
+    assert [float(schedule.update(0.6)) for _ in range(6)] == pytest.approx([0.025] * 2 + [0.02] * 4)
+
+
+def test_plateau_tracks_tasks_separately():
+    schedule = PlateauSchedule(0.2, patience=2, factor=0.5)
+    schedule.update([1.0, 1.0])
+    for step in range(1, 3):
+        lr = schedule.update([1.0, 1.0 - 0.1 * step])
+    np.testing.assert_allclose(lr, [0.1, 0.2])
+
+    schedule.select(np.array([1]))
+    np.testing.assert_allclose(schedule.update([0.8]), [0.2])
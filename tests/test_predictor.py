@@ -0,0 +1,37 @@
+"""`CompiledPredictor` 저장·불러오기 왕복과 모델 예측의 일치 검사."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from pqc.nqubit import NQubitPQC, NQubitPQCConfig
+from pqc.parallel import FAMILIES, default_config, model_class
+from pqc.predictor import CompiledPredictor
+
+
+def _model(family: str):
+    if family == "nqubit":
+        return NQubitPQC(NQubitPQCConfig(num_inputs=3, backend="numpy"))
+    return model_class(family)(default_config(family))
+
+
+@pytest.mark.parametrize("family", [*FAMILIES, "nqubit"])
+def test_predictor_save_load_round_trip(tmp_path, family):
+    model = _model(family)
+    predictor = CompiledPredictor.from_model(model, name=family)
+    path = tmp_path / f"{family}.npz"
+    predictor.save(path)
+    loaded = CompiledPredictor.load(path)
+
+    assert (loaded.name, loaded.num_wires, loaded.num_inputs) == (family, predictor.num_wires, predictor.num_inputs)
+    assert loaded.encoding == predictor.encoding
+    assert loaded.operations == predictor.operations
+    np.testing.assert_array_equal(loaded.params, predictor.params)
+
+    bits = np.array(list(itertools.product((0, 1), repeat=predictor.num_inputs)), dtype=float)
+    continuous = np.random.default_rng(5).uniform(size=(16, predictor.num_inputs))
+    for rows in (bits, continuous):
+        np.testing.assert_array_equal(loaded.predict_batch(rows), predictor.predict_batch(rows))
+    expected = 0.5 * (1.0 - np.asarray(model._build_engine().expval(model._engine_initial_states(bits), model.params)))
+    np.testing.assert_allclose(loaded.predict_batch(bits), expected, rtol=0, atol=1e-12)
@@ -0,0 +1,23 @@
+"""`TrainingProfiler` 실행 이름과 스텝 번호 검사."""
+
+from pqc.gates import LogicGate, build_dataset
+from pqc.model import PQCConfig, TwoQubitPQC
+from pqc.profiling import TrainingProfiler
+
+
+def test_profiler_numbers_steps_per_run():
+    config = PQCConfig(backend="numpy", max_steps=5, convergence_tol=0.0)
+    dataset = build_dataset(LogicGate.AND)
+    profiler = TrainingProfiler()
+    model = TwoQubitPQC(config)
+
+    model.fit(dataset, profiler=profiler)
+    with profiler.session(model, run="TwoQubitPQC#1"):
+        pass
+    model.fit(dataset, profiler=profiler)
+    model.fit(dataset, profiler=profiler)
+
+    runs = [record.run for record in profiler.records]
+    assert runs == ["TwoQubitPQC#0"] * 5 + ["TwoQubitPQC#2"] * 5 + ["TwoQubitPQC#3"] * 5
+    assert [record.step for record in profiler.records] == [1, 2, 3, 4, 5] * 3
+    assert profiler.summary()["steps"] == 15
@@ -0,0 +1,65 @@
+"""`save_results` / `ResultArchive` 보관소 왕복 검사."""
+
+import numpy as np
+
+from pqc.gates import LogicGate
+from pqc.results import ResultArchive, TrainingResult, save_results
+
+
+def _results() -> list[TrainingResult]:
+    rng = np.random.default_rng(7)
+    gate_result = TrainingResult.for_gate(
+        LogicGate.XOR,
+        params=rng.uniform(-np.pi, np.pi, size=(2, 2, 3)),
+        probabilities=[0.1, 0.9, 0.8, 0.3],
+        targets=[0, 1, 1, 0],
+        loss_history=[0.5, 0.2, 0.04],
+        max_steps=10,
+        convergence_tol=0.05,
+        seed=3,
+        total_shots=12345,
+    )
+    function_result = TrainingResult(
+        function="parity3",
+        num_inputs=3,
+        final_loss=0.25,
+        accuracy=0.5,
+        converged=False,
+        params=rng.uniform(-np.pi, np.pi, size=(1, 3, 3)),
+        loss_history=rng.uniform(size=7),
+    )
+    return [gate_result, function_result]
+
+
+def _assert_same(actual: TrainingResult, expected: TrainingResult) -> None:
+    actual_state, expected_state = actual.__getstate__(), expected.__getstate__()
+    assert actual_state.keys() == expected_state.keys()
+    for name, value in expected_state.items():
+        if isinstance(value, np.ndarray):
+            assert actual_state[name].dtype == value.dtype, name
+            np.testing.assert_array_equal(actual_state[name], value, err_msg=name)
+        else:
+            assert actual_state[name] == value, name
+
+
+def test_archive_round_trip(tmp_path):
+    results = _results()
+    archive = ResultArchive(save_results(tmp_path / "archive", results))
+
+    assert len(archive) == len(results)
+    for actual, expected in zip(archive, results):
+        _assert_same(actual, expected)
+    _assert_same(archive[-1], results[-1])
+    assert archive[1].gate is None and archive[1].seed is None
+    np.testing.assert_array_equal(archive.column("final_loss"), [result.final_loss for result in results])
+
+
+def test_archive_overwrite_and_empty(tmp_path):
+    path = tmp_path / "archive"
+    save_results(path, _results())
+    archive = ResultArchive(save_results(path, []))
+
+    assert len(archive) == 0
+    assert list(archive) == []
+    assert archive.column("function").shape == (0,)
+    assert not path.with_name(path.name + ".tmp").exists()
@@ -0,0 +1,65 @@
+"""warm-start 대칭 변환과 `train_gate_with`의 warm-start 경로 검사."""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from pqc.gates import GATE_FUNCTIONS, LogicGate, truth_table_inputs
+from pqc.parallel import FAMILIES, default_config, model_class
+from pqc.warmstart import ParameterStore, gate_relations, parameter_symmetry, warm_start
+from pqc.workflow import train_gate_with
+
+INPUTS = np.array(truth_table_inputs(), dtype=float)
+
+
+def test_gate_relations_reproduce_truth_tables():
+    for target in LogicGate:
+        relations = gate_relations(target)
+        assert relations[0].source is target and relations[0].is_identity
+        for relation in relations:
+            for bits in truth_table_inputs():
+                flipped = [bit ^ mask for bit, mask in zip(bits, relation.input_flip)]
+                value = GATE_FUNCTIONS[relation.source](*flipped) ^ relation.complement
+                assert value == GATE_FUNCTIONS[target](*bits)
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_symmetry_transforms_truth_table(family):
+    # 대칭은 NumPy 엔진으로 찾으므로 확인은 PennyLane QNode 경로로 한다.
+    model = model_class(family)(replace(default_config(family), backend="pennylane"))
+    rng = np.random.default_rng(11)
+    transforms = {
+        (relation.input_flip, relation.complement)
+        for gate in LogicGate
+        for relation in gate_relations(gate)
+        if not relation.is_identity
+    }
+    found = 0
+    for input_flip, complement in sorted(transforms):
+        symmetry = parameter_symmetry(model, input_flip, complement)
+        if symmetry is None:
+            continue
+        found += 1
+        params = rng.uniform(-np.pi, np.pi, size=model.params.shape)
+        flipped = np.abs(INPUTS - np.array(input_flip, dtype=float))
+        expected = model.predict_probabilities(flipped, params)
+        if complement:
+            expected = 1.0 - expected
+        np.testing.assert_allclose(model.predict_probabilities(INPUTS, symmetry.apply(params)), expected, atol=1e-10)
+    assert found >= 1
+
+def test_warm_start_keeps_model_config_and_seed():
+    config = replace(default_config("basic"), backend="numpy", restarts=2, max_steps=50)
+    cls = model_class("basic")
+    store = ParameterStore()
+    source = train_gate_with(cls(config), LogicGate.AND, store=store)
+
+    model = cls(config)
+    assert warm_start(model, LogicGate.NAND, store) is not None
+    result = train_gate_with(model, LogicGate.NAND, store=store)
+    assert model.config == config
+    assert model.seed == config.seed
+    assert result.seed is None
+    # NAND = NOT AND이므로 변환한 초기값의 진리표는 AND 결과를 뒤집은 것이다.
+    np.testing.assert_array_equal(result.predictions, 1 - source.predictions)